@@ -1,5 +1,7 @@
 import { module_library_mapping, ModuleHookingType } from "../shared/shared_structures.js";
 import { getModuleNames, ssl_library_loader, invokeHookingFunction } from "../shared/shared_functions.js";
+import { moduleLoaded } from "../shared/module_registry.js";
+import { module_closing, module_closed } from "../util/hook_registry.js";
 import { log, devlog } from "../util/log.js";
 import { gnutls_execute } from "./gnutls_android.js";
 import { wolfssl_execute } from "./wolfssl_android.js";
@@ -10,7 +12,6 @@ import { java_execute} from "./android_java_tls_libs.js";
 
 
 var plattform_name = "linux";
-var moduleNames: Array<string> = getModuleNames();
 (global as any).addresses = {};
 
 export const socket_library = "libc"
@@ -22,7 +23,7 @@ function install_java_hooks(){
 function hook_Android_Dynamic_Loader(module_library_mapping: { [key: string]: Array<[any, ModuleHookingType]> }, is_base_hook: boolean): void{
     try {
     const regex_libdl = /.*libdl.*\.so/
-    const libdl = moduleNames.find(element => element.match(regex_libdl))
+    const libdl = getModuleNames().find(element => element.match(regex_libdl))
     if (libdl === undefined){
         throw "Android Dynamic loader not found!"
     } 
@@ -43,6 +44,7 @@ function hook_Android_Dynamic_Loader(module_library_mapping: { [key: string]: Ar
         },
         onLeave: function (retval: any) {
             if (this.moduleName != undefined) {
+                moduleLoaded(this.moduleName, retval)
                 for(let map of module_library_mapping[plattform_name]){
                     let regex = map[0]
                     let func = map[1]
@@ -58,6 +60,18 @@ function hook_Android_Dynamic_Loader(module_library_mapping: { [key: string]: Ar
         
     })
 
+    // the hooks of a library are dropped when it is unloaded
+    Interceptor.attach(Module.getExportByName(libdl, "dlclose"), {
+        onEnter: function (args) {
+            this.module = module_closing(args[0])
+        },
+        onLeave: function (retval: any) {
+            if (this.module !== null) {
+                module_closed(this.module)
+            }
+        }
+    })
+
     console.log(`[*] Android dynamic loader hooked.`)
 } catch (error) {
     devlog("Loader error: "+ error)
@@ -66,7 +80,7 @@ function hook_Android_Dynamic_Loader(module_library_mapping: { [key: string]: Ar
 }
 
 function hook_native_Android_SSL_Libs(module_library_mapping: { [key: string]: Array<[any, ModuleHookingType]> }, is_base_hook: boolean){
-    ssl_library_loader(plattform_name, module_library_mapping,moduleNames,"Android",is_base_hook)
+    ssl_library_loader(plattform_name, module_library_mapping,getModuleNames(),"Android",is_base_hook)
 
 }
 
@@ -1,5 +1,6 @@
 import { log } from "../util/log.js";
 import { byteArrayToString, byteArrayToNumber, getAttribute, reflectionByteArrayToString } from "../shared/shared_functions.js";
+import { datalog } from "../util/datalog.js";
 export function execute() {
     setTimeout(function () {
         Java.perform(function () {
@@ -30,7 +31,7 @@ export function execute() {
                 message["ssl_session_id"] = byteArrayToString(this.this$0.value.getConnection().getSession().getId())
                 //log(message["ssl_session_id"])
                 message["function"] = "writeApplicationData"
-                send(message, result)
+                datalog(message, result)
 
                 return this.write(buf, offset, len)
             }
@@ -61,7 +62,7 @@ export function execute() {
                 message["ssl_session_id"] = byteArrayToString(this.this$0.value.getConnection().getSession().getId())
                 log(message["ssl_session_id"])
                 message["function"] = "readApplicationData"
-                send(message, result)
+                datalog(message, result)
 
                 return bytesRead
             }
@@ -1,6 +1,7 @@
 
 import {GnuTLS } from "../ssl_lib/gnutls.js";
 import { socket_library } from "./android_agent.js";
+import { attach_hook } from "../util/hook_registry.js";
 
 export class GnuTLS_Linux extends GnuTLS {
 
@@ -12,11 +13,12 @@ export class GnuTLS_Linux extends GnuTLS {
     execute_hooks(){
         this.install_plaintext_read_hook();
         this.install_plaintext_write_hook();
+        this.install_close_hook();
         this.install_tls_keys_callback_hook();
     }
 
     install_tls_keys_callback_hook(){
-        Interceptor.attach(this.addresses[this.module_name]["gnutls_init"],
+        attach_hook("gnutls_init", this.addresses[this.module_name]["gnutls_init"],
     {
         onEnter: function (args: any) {
             this.session = args[0]
@@ -22,6 +22,7 @@ export class mbed_TLS_Android extends mbed_TLS {
     execute_hooks(){
         this.install_plaintext_read_hook();
         this.install_plaintext_write_hook();
+        this.install_close_hook();
     }
 
 }
@@ -18,6 +18,7 @@ export class NSS_Android extends NSS {
     execute_hooks(){
         this.install_plaintext_read_hook();
         this.install_plaintext_write_hook();
+        this.install_close_hook();
         //this.install_tls_keys_callback_hook() // might fail 
     }
 
@@ -1,6 +1,7 @@
 
 import {OpenSSL_BoringSSL } from "../ssl_lib/openssl_boringssl.js";
 import { socket_library } from "./android_agent.js";
+import { attach_hook } from "../util/hook_registry.js";
 
 export class OpenSSL_BoringSSL_Android extends OpenSSL_BoringSSL {
 
@@ -12,6 +13,7 @@ export class OpenSSL_BoringSSL_Android extends OpenSSL_BoringSSL {
     execute_hooks(){
         this.install_plaintext_read_hook();
         this.install_plaintext_write_hook();
+        this.install_close_hook();
         this.install_tls_keys_callback_hook();
     }
 
@@ -21,7 +23,7 @@ export class OpenSSL_BoringSSL_Android extends OpenSSL_BoringSSL {
         var instance = this;
 
     
-        Interceptor.attach(this.addresses[this.module_name]["SSL_new"],
+        attach_hook("SSL_new", this.addresses[this.module_name]["SSL_new"],
         {
             onEnter: function (args: any) {
                 instance.SSL_CTX_set_keylog_callback(args[0], OpenSSL_BoringSSL.keylog_callback)
@@ -29,7 +31,7 @@ export class OpenSSL_BoringSSL_Android extends OpenSSL_BoringSSL {
     
         });
 
-        Interceptor.attach(this.addresses[this.module_name]["SSL_do_handshake"],
+        attach_hook("SSL_do_handshake", this.addresses[this.module_name]["SSL_do_handshake"],
         {
             onEnter: function (args: any) {
                 instance.SSL_CTX_set_keylog_callback(args[0], OpenSSL_BoringSSL.keylog_callback)
@@ -1,11 +1,12 @@
 import { module_library_mapping, ModuleHookingType } from "../shared/shared_structures.js";
 import { log, devlog } from "../util/log.js";
 import { getModuleNames, ssl_library_loader, invokeHookingFunction } from "../shared/shared_functions.js";
+import { moduleLoaded } from "../shared/module_registry.js";
+import { module_closing, module_closed } from "../util/hook_registry.js";
 import { boring_execute } from "./openssl_boringssl_ios.js";
 
 
 var plattform_name = "darwin";
-var moduleNames: Array<string> = getModuleNames()
 
 export const socket_library = "libSystem.B.dylib"
 
@@ -13,7 +14,7 @@ export const socket_library = "libSystem.B.dylib"
 function hook_iOS_Dynamic_Loader(module_library_mapping: { [key: string]: Array<[any, ModuleHookingType]> }, is_base_hook: boolean): void {
     try {
         const regex_libdl = /libSystem.B.dylib/
-        const libdl = moduleNames.find(element => element.match(regex_libdl))
+        const libdl = getModuleNames().find(element => element.match(regex_libdl))
         if (libdl === undefined) {
             throw "Darwin Dynamic loader not found!"
         }
@@ -26,6 +27,7 @@ function hook_iOS_Dynamic_Loader(module_library_mapping: { [key: string]: Array<
             },
             onLeave: function (retval: any) {
                 if (this.moduleName != undefined) {
+                    moduleLoaded(this.moduleName, retval)
                     for (let map of module_library_mapping[plattform_name]) {
                         let regex = map[0]
                         let func = map[1]
@@ -41,6 +43,18 @@ function hook_iOS_Dynamic_Loader(module_library_mapping: { [key: string]: Array<
 
         })
 
+        // the hooks of a library are dropped when it is unloaded
+        Interceptor.attach(Module.getExportByName(libdl, "dlclose"), {
+            onEnter: function (args) {
+                this.module = module_closing(args[0])
+            },
+            onLeave: function (retval: any) {
+                if (this.module !== null) {
+                    module_closed(this.module)
+                }
+            }
+        })
+
         console.log(`[*] iOS dynamic loader hooked.`)
     } catch (error) {
         devlog("Loader error: " + error)
@@ -50,7 +64,7 @@ function hook_iOS_Dynamic_Loader(module_library_mapping: { [key: string]: Array<
 
 
 function hook_iOS_SSL_Libs(module_library_mapping: { [key: string]: Array<[any, ModuleHookingType]> }, is_base_hook: boolean) {
-    ssl_library_loader(plattform_name, module_library_mapping,moduleNames,"iOS",is_base_hook)
+    ssl_library_loader(plattform_name, module_library_mapping,getModuleNames(),"iOS",is_base_hook)
 }
 
 
@@ -2,6 +2,7 @@
 import {OpenSSL_BoringSSL } from "../ssl_lib/openssl_boringssl.js";
 import { socket_library } from "./ios_agent.js";
 import { log, devlog } from "../util/log.js";
+import { attach_hook } from "../util/hook_registry.js";
 
 export class OpenSSL_BoringSSL_iOS extends OpenSSL_BoringSSL {
 
@@ -27,7 +28,7 @@ export class OpenSSL_BoringSSL_iOS extends OpenSSL_BoringSSL {
                 devlog("Installing callback for iOS >= 17");
                 CALLBACK_OFFSET = 0x308; // >= iOS 17.x 
             }
-            Interceptor.attach(this.addresses[this.module_name]["SSL_CTX_set_info_callback"], {
+            attach_hook("SSL_CTX_set_info_callback", this.addresses[this.module_name]["SSL_CTX_set_info_callback"], {
               onEnter: function (args : any) {
                 ptr(args[0]).add(CALLBACK_OFFSET).writePointer(OpenSSL_BoringSSL.keylog_callback);
               }
@@ -57,6 +58,7 @@ export class OpenSSL_BoringSSL_iOS extends OpenSSL_BoringSSL {
         this.install_plaintext_write_hook();
         */
 
+        this.install_close_hook();
         this.install_tls_keys_callback_hook();
     }
 
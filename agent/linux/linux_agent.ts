@@ -1,6 +1,8 @@
 import { module_library_mapping, ModuleHookingType } from "../shared/shared_structures.js";
 import { log, devlog } from "../util/log.js";
 import { getModuleNames, ssl_library_loader, invokeHookingFunction } from "../shared/shared_functions.js";
+import { moduleLoaded } from "../shared/module_registry.js";
+import { module_closing, module_closed } from "../util/hook_registry.js";
 import { gnutls_execute } from "./gnutls_linux.js";
 import { wolfssl_execute } from "./wolfssl_linux.js";
 import { nss_execute } from "./nss_linux.js";
@@ -9,14 +11,13 @@ import { boring_execute } from "./openssl_boringssl_linux.js";
 import { matrixSSL_execute } from "./matrixssl_linux.js";
 
 var plattform_name = "linux";
-var moduleNames: Array<string> = getModuleNames()
 
 export const socket_library = "libc"
 
 function hook_Linux_Dynamic_Loader(module_library_mapping: { [key: string]: Array<[any, ModuleHookingType]> }, is_base_hook: boolean): void {
     try {
         const regex_libdl = /.*libdl.*\.so/
-        const libdl = moduleNames.find(element => element.match(regex_libdl))
+        const libdl = getModuleNames().find(element => element.match(regex_libdl))
         if (libdl === undefined) {
             throw "Linux Dynamic loader not found!"
         }
@@ -29,6 +30,7 @@ function hook_Linux_Dynamic_Loader(module_library_mapping: { [key: string]: Arra
             },
             onLeave: function (retval: any) {
                 if (this.moduleName != undefined) {
+                    moduleLoaded(this.moduleName, retval)
                     for (let map of module_library_mapping[plattform_name]) {
                         let regex = map[0]
                         let func = map[1]
@@ -44,6 +46,18 @@ function hook_Linux_Dynamic_Loader(module_library_mapping: { [key: string]: Arra
 
         })
 
+        // the hooks of a library are dropped when it is unloaded
+        Interceptor.attach(Module.getExportByName(libdl, "dlclose"), {
+            onEnter: function (args) {
+                this.module = module_closing(args[0])
+            },
+            onLeave: function (retval: any) {
+                if (this.module !== null) {
+                    module_closed(this.module)
+                }
+            }
+        })
+
         console.log(`[*] Linux dynamic loader hooked.`)
     } catch (error) {
         devlog("Loader error: " + error)
@@ -52,7 +66,7 @@ function hook_Linux_Dynamic_Loader(module_library_mapping: { [key: string]: Arra
 }
 
 function hook_Linux_SSL_Libs(module_library_mapping: { [key: string]: Array<[any, ModuleHookingType]> }, is_base_hook: boolean) {
-    ssl_library_loader(plattform_name, module_library_mapping,moduleNames,"Linux", is_base_hook)
+    ssl_library_loader(plattform_name, module_library_mapping,getModuleNames(),"Linux", is_base_hook)
 }
 
 
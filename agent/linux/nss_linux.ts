@@ -2,6 +2,7 @@
 import {NSS } from "../ssl_lib/nss.js";
 import { socket_library } from "./linux_agent.js";
 import { log, devlog } from "../util/log.js";
+import { attach_hook } from "../util/hook_registry.js";
 
 export class NSS_Linux extends NSS {
 
@@ -19,6 +20,7 @@ export class NSS_Linux extends NSS {
     execute_hooks(){
         this.install_plaintext_read_hook();
         this.install_plaintext_write_hook();
+        this.install_close_hook();
         this.install_tls_keys_callback_hook()
     }
 
@@ -39,7 +41,7 @@ export class NSS_Linux extends NSS {
         NSS.PK11_ExtractKeyValue = new NativeFunction(this.addresses[this.module_name]["PK11_ExtractKeyValue"], "int", ["pointer"]);
         NSS.PK11_GetKeyData = new NativeFunction(this.addresses[this.module_name]["PK11_GetKeyData"], "pointer", ["pointer"]);
 
-        Interceptor.attach(this.addresses[this.module_name]["SSL_ImportFD"],
+        attach_hook("SSL_ImportFD", this.addresses[this.module_name]["SSL_ImportFD"],
             {
                 onEnter(args: any) {
                     this.fd = args[1];
@@ -86,13 +88,13 @@ export class NSS_Linux extends NSS {
                 void *client_data
             );
          */
-        Interceptor.attach(this.addresses[this.module_name]["SSL_HandshakeCallback"],
+        attach_hook("SSL_HandshakeCallback", this.addresses[this.module_name]["SSL_HandshakeCallback"],
             {
                 onEnter(args: any) {
 
                     this.originalCallback = args[1];
 
-                    Interceptor.attach(ptr(this.originalCallback),
+                    attach_hook("SSLHandshakeCallback", ptr(this.originalCallback),
                         {
                             onEnter(args: any) {
                                 var sslSocketFD = args[0];
@@ -1,6 +1,7 @@
 
 import {OpenSSL_BoringSSL } from "../ssl_lib/openssl_boringssl.js";
 import { socket_library } from "./linux_agent.js";
+import { attach_hook } from "../util/hook_registry.js";
 
 export class OpenSSL_BoringSSL_Linux extends OpenSSL_BoringSSL {
 
@@ -12,6 +13,7 @@ export class OpenSSL_BoringSSL_Linux extends OpenSSL_BoringSSL {
     execute_hooks(){
         this.install_plaintext_read_hook();
         this.install_plaintext_write_hook();
+        this.install_close_hook();
         this.install_tls_keys_callback_hook();
     }
 
@@ -20,7 +22,7 @@ export class OpenSSL_BoringSSL_Linux extends OpenSSL_BoringSSL {
         this.SSL_CTX_set_keylog_callback = ObjC.available ? new NativeFunction(this.addresses[this.module_name]["SSL_CTX_set_info_callback"], "void", ["pointer", "pointer"]) : new NativeFunction(this.addresses[this.module_name]["SSL_CTX_set_keylog_callback"], "void", ["pointer", "pointer"]);
         var instance = this;
     
-        Interceptor.attach(this.addresses[this.module_name]["SSL_new"],
+        attach_hook("SSL_new", this.addresses[this.module_name]["SSL_new"],
         {
             onEnter: function (args: any) {
                 instance.SSL_CTX_set_keylog_callback(args[0], OpenSSL_BoringSSL.keylog_callback)
@@ -1,6 +1,7 @@
 
 import {WolfSSL } from "../ssl_lib/wolfssl.js";
 import { socket_library } from "./linux_agent.js";
+import { attach_hook } from "../util/hook_registry.js";
 import { toHexString } from "../shared/shared_functions.js";
 
 export class WolfSSL_Linux extends WolfSSL {
@@ -13,6 +14,7 @@ export class WolfSSL_Linux extends WolfSSL {
     execute_hooks(){
         this.install_plaintext_read_hook();
         this.install_plaintext_write_hook();
+        this.install_close_hook();
         this.install_tls_keys_callback_hook();
     }
 
@@ -22,7 +24,7 @@ export class WolfSSL_Linux extends WolfSSL {
         //https://www.wolfssl.com/doxygen/group__Setup.html#gaf18a029cfeb3150bc245ce66b0a44758
         WolfSSL.wolfSSL_SESSION_get_master_key = new NativeFunction(this.addresses[this.module_name]["wolfSSL_SESSION_get_master_key"], "int", ["pointer", "pointer", "int"])
         
-        Interceptor.attach(this.addresses[this.module_name]["wolfSSL_connect"],{
+        attach_hook("wolfSSL_connect", this.addresses[this.module_name]["wolfSSL_connect"],{
             onEnter: function(args: any){
                 this.ssl = args[0]
             },
@@ -2,11 +2,12 @@
 import { module_library_mapping, ModuleHookingType } from "../shared/shared_structures.js";
 import { log, devlog } from "../util/log.js";
 import { getModuleNames, ssl_library_loader, invokeHookingFunction } from "../shared/shared_functions.js";
+import { moduleLoaded } from "../shared/module_registry.js";
+import { module_closing, module_closed } from "../util/hook_registry.js";
 import { boring_execute } from "./openssl_boringssl_macos.js";
 
 
 var plattform_name = "darwin";
-var moduleNames: Array<string> = getModuleNames()
 
 export const socket_library = "libSystem.B.dylib"
 
@@ -14,7 +15,7 @@ export const socket_library = "libSystem.B.dylib"
 function hook_macOS_Dynamic_Loader(module_library_mapping: { [key: string]: Array<[any, ModuleHookingType]> }, is_base_hook: boolean): void {
     try {
         const regex_libdl = /libSystem.B.dylib/
-        const libdl = moduleNames.find(element => element.match(regex_libdl))
+        const libdl = getModuleNames().find(element => element.match(regex_libdl))
         if (libdl === undefined) {
             throw "Darwin Dynamic loader not found!"
         }
@@ -27,6 +28,7 @@ function hook_macOS_Dynamic_Loader(module_library_mapping: { [key: string]: Arra
             },
             onLeave: function (retval: any) {
                 if (this.moduleName != undefined) {
+                    moduleLoaded(this.moduleName, retval)
                     for (let map of module_library_mapping[plattform_name]) {
                         let regex = map[0]
                         let func = map[1]
@@ -42,6 +44,18 @@ function hook_macOS_Dynamic_Loader(module_library_mapping: { [key: string]: Arra
 
         })
 
+        // the hooks of a library are dropped when it is unloaded
+        Interceptor.attach(Module.getExportByName("libSystem.B.dylib", "dlclose"), {
+            onEnter: function (args) {
+                this.module = module_closing(args[0])
+            },
+            onLeave: function (retval: any) {
+                if (this.module !== null) {
+                    module_closed(this.module)
+                }
+            }
+        })
+
         log("MacOS dynamic loader hooked.")
     } catch (error) {
         devlog("Loader error: " + error)
@@ -51,7 +65,7 @@ function hook_macOS_Dynamic_Loader(module_library_mapping: { [key: string]: Arra
 
 
 function hook_macOS_SSL_Libs(module_library_mapping: { [key: string]: Array<[any, ModuleHookingType]> }, is_base_hook: boolean) {
-    ssl_library_loader(plattform_name, module_library_mapping,moduleNames,"MacOS", is_base_hook)
+    ssl_library_loader(plattform_name, module_library_mapping,getModuleNames(),"MacOS", is_base_hook)
 }
 
 
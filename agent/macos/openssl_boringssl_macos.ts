@@ -1,6 +1,7 @@
 
 import {OpenSSL_BoringSSL } from "../ssl_lib/openssl_boringssl.js";
 import { socket_library } from "./macos_agent.js";
+import { attach_hook } from "../util/hook_registry.js";
 
 
 export class OpenSSL_BoringSSL_MacOS extends OpenSSL_BoringSSL {
@@ -16,7 +17,7 @@ export class OpenSSL_BoringSSL_MacOS extends OpenSSL_BoringSSL {
             }else if (foundationNumber >= 1751.108) {
                 CALLBACK_OFFSET = 0x2B8; // >= iOS 14.x 
             }
-            Interceptor.attach(this.addresses[this.module_name]["SSL_CTX_set_info_callback"], {
+            attach_hook("SSL_CTX_set_info_callback", this.addresses[this.module_name]["SSL_CTX_set_info_callback"], {
               onEnter: function (args : any) {
                 ptr(args[0]).add(CALLBACK_OFFSET).writePointer(this.keylog_callback);
               }
@@ -45,6 +46,7 @@ export class OpenSSL_BoringSSL_MacOS extends OpenSSL_BoringSSL {
         this.install_plaintext_write_hook();
         */
 
+        this.install_close_hook();
         this.install_tls_keys_callback_hook();
     }
 
@@ -0,0 +1,97 @@
+/*
+The addresses of the hooked functions are looked up in an index of the exports of every module.
+The exports of a module are enumerated once, when a function of it is looked up for the first time,
+and kept in a map of their names. Libraries which are loaded later are handed to the backends by the
+dlopen hooks of the platform agents and are added to the index as soon as their functions are resolved.
+The index of a module is kept for its path and base address, so a library which is loaded again at
+another address is indexed again.
+
+The library names are globs like "*libssl*" and are matched against the path and the name of the
+modules. A function name with a trailing "*" matches every export starting with it, its exact name
+is preferred.
+*/
+
+var export_index = new Map<string, Map<string, NativePointer>>()
+
+
+/**
+ * Converts a glob (only "*" and "?" are special) into an anchored regular expression.
+ */
+export function globToRegExp(glob: string): RegExp {
+    var pattern = glob.replace(/[.+^${}()|[\]\\]/g, "\\$&").replace(/\*/g, ".*").replace(/\?/g, ".")
+    return new RegExp("^" + pattern + "$")
+}
+
+
+/**
+ * Returns the exports of the given module, they are enumerated on the first call only.
+ */
+export function getModuleExports(module: Module): Map<string, NativePointer> {
+    var key = module.path + "@" + module.base
+    var exports = export_index.get(key)
+    if (exports === undefined) {
+        exports = new Map<string, NativePointer>()
+        for (const module_export of module.enumerateExports()) {
+            // the first definition of a name wins, like for dlsym
+            if (!exports.has(module_export.name)) {
+                exports.set(module_export.name, module_export.address)
+            }
+        }
+        export_index.set(key, exports)
+    }
+    return exports
+}
+
+
+/**
+ * Drops the exports of an unloaded module.
+ */
+export function forgetModuleExports(module: Module) {
+    export_index.delete(module.path + "@" + module.base)
+}
+
+
+/**
+ * Looks up a function in the exports of a module.
+ * @param {Module} module The module to search
+ * @param {string} function_name Name of the function, a trailing "*" matches every export starting with it
+ * @return {NativePointer | null} The address of the function or null if the module doesn't export it
+ */
+export function findModuleExport(module: Module, function_name: string): NativePointer | null {
+    var exports = getModuleExports(module)
+    if (!function_name.endsWith("*")) {
+        var address = exports.get(function_name)
+        return address === undefined ? null : address
+    }
+
+    var prefix = function_name.substring(0, function_name.length - 1)
+    var exact = exports.get(prefix)
+    if (exact !== undefined) {
+        return exact
+    }
+    for (const [name, address] of exports) {
+        if (name.startsWith(prefix)) {
+            return address
+        }
+    }
+    return null
+}
+
+
+/**
+ * Looks up a function in the first of the given modules which matches the library glob and exports it.
+ * @param {RegExp} library_regex The library glob converted by globToRegExp
+ * @param {string} function_name Name of the function (see findModuleExport)
+ * @param {Array<Module>} modules The modules to search in their load order
+ */
+export function resolveExport(library_regex: RegExp, function_name: string, modules: Array<Module>): NativePointer | null {
+    for (const module of modules) {
+        if (library_regex.test(module.path) || library_regex.test(module.name)) {
+            var address = findModuleExport(module, function_name)
+            if (address !== null) {
+                return address
+            }
+        }
+    }
+    return null
+}
@@ -0,0 +1,215 @@
+import { forgetModuleExports } from "./module_exports.js";
+
+/*
+The loaded modules are enumerated once and kept in a registry, which is looked up by name, path,
+pattern or address instead of walking the module list of the process again. It is kept up to date by
+the dynamic loader hooks of the platform agents (moduleLoaded) and, if Frida provides it, by a module
+observer which also reports unloaded modules. The matches of a pattern are cached until the registry
+changes. The handles returned by the dynamic loader are kept, so that dlclose can be mapped to its module.
+*/
+
+var modules: Array<Module> = []
+var modules_by_name = new Map<string, Module>()
+var modules_by_path = new Map<string, Module>()
+var pattern_matches = new Map<string, Array<Module>>()
+var modules_by_handle = new Map<string, Module>()
+var removed_listeners: Array<(module: Module) => void> = []
+var initialized = false
+
+
+function ensureRegistry() {
+    if (initialized) {
+        return
+    }
+    initialized = true
+    for (const module of Process.enumerateModules()) {
+        addModule(module)
+    }
+
+    // Frida >= 17 reports loaded and unloaded modules itself
+    const attachModuleObserver = (Process as any).attachModuleObserver
+    if (typeof attachModuleObserver === "function") {
+        attachModuleObserver.call(Process, {
+            onAdded: function (module: Module) {
+                addModule(module)
+            },
+            onRemoved: function (module: Module) {
+                removeModule(module)
+            }
+        })
+    }
+}
+
+
+function addModule(module: Module) {
+    var known = modules_by_path.get(module.path)
+    if (known !== undefined) {
+        if (known.base.equals(module.base)) {
+            return
+        }
+        removeModule(known)
+    }
+    modules.push(module)
+    modules_by_path.set(module.path, module)
+    if (!modules_by_name.has(module.name)) {
+        modules_by_name.set(module.name, module)
+    }
+    pattern_matches.clear()
+}
+
+
+function removeModule(module: Module) {
+    var known = modules_by_path.get(module.path)
+    if (known === undefined || !known.base.equals(module.base)) {
+        return
+    }
+    modules.splice(modules.indexOf(known), 1)
+    modules_by_path.delete(known.path)
+    if (modules_by_name.get(known.name) === known) {
+        modules_by_name.delete(known.name)
+        const other = modules.find(element => element.name == known!.name)
+        if (other !== undefined) {
+            modules_by_name.set(other.name, other)
+        }
+    }
+    for (const [handle, module] of modules_by_handle) {
+        if (module === known) {
+            modules_by_handle.delete(handle)
+        }
+    }
+    forgetModuleExports(known)
+    pattern_matches.clear()
+    for (const listener of removed_listeners) {
+        listener(known)
+    }
+}
+
+
+/**
+ * Registers a function which is called with every module which was unloaded.
+ */
+export function addModuleRemovedListener(listener: (module: Module) => void) {
+    removed_listeners.push(listener)
+}
+
+
+/**
+ * Enumerates the modules of the process again, e.g. when a library was loaded which isn't registered yet.
+ */
+export function refreshModules() {
+    ensureRegistry()
+    var loaded = Process.enumerateModules()
+    var loaded_paths = new Set<string>()
+    for (const module of loaded) {
+        loaded_paths.add(module.path + "@" + module.base)
+        addModule(module)
+    }
+    for (const module of modules.slice()) {
+        if (!loaded_paths.has(module.path + "@" + module.base)) {
+            removeModule(module)
+        }
+    }
+}
+
+
+/**
+ * Registers a library which was just loaded by the dynamic loader.
+ * @param {string} name The name or path of the library as passed to the loader
+ * @param {NativePointer} handle The handle returned by the loader
+ * @return {Module | null} The registered module or null if it isn't loaded
+ */
+export function moduleLoaded(name: string, handle?: NativePointer): Module | null {
+    var module = findModule(name)
+    if (module === null) {
+        try {
+            module = Process.findModuleByName(name)
+            if (module !== null) {
+                addModule(module)
+            }
+        } catch (error) {
+            // a path which isn't known to Frida
+        }
+    }
+    if (module === null) {
+        refreshModules()
+        module = findModule(name)
+    }
+    if (module !== null && handle !== undefined && !handle.isNull()) {
+        modules_by_handle.set(handle.toString(), module)
+    }
+    return module
+}
+
+
+/**
+ * Returns the module of a handle of the dynamic loader, only handles seen by moduleLoaded are known.
+ */
+export function findModuleByHandle(handle: NativePointer): Module | null {
+    var module = modules_by_handle.get(handle.toString())
+    return module === undefined ? null : module
+}
+
+
+/**
+ * Registers the library which was just loaded at the given address (e.g. the handle returned by LoadLibrary).
+ */
+export function moduleLoadedAt(address: NativePointer): Module | null {
+    var module = findModuleByAddress(address)
+    if (module === null) {
+        refreshModules()
+        module = findModuleByAddress(address)
+    }
+    return module
+}
+
+
+/**
+ * Returns all loaded modules in the order they were registered.
+ */
+export function getModules(): Array<Module> {
+    ensureRegistry()
+    return modules
+}
+
+
+/**
+ * Looks up a module by its name or path.
+ */
+export function findModule(name: String): Module | null {
+    ensureRegistry()
+    var key = name.toString()
+    var module = modules_by_name.get(key)
+    if (module === undefined) {
+        module = modules_by_path.get(key)
+    }
+    return module === undefined ? null : module
+}
+
+
+/**
+ * Returns the modules whose name matches the given pattern, the result is cached until the registry changes.
+ */
+export function findModules(pattern: RegExp): Array<Module> {
+    ensureRegistry()
+    var key = pattern.toString()
+    var matches = pattern_matches.get(key)
+    if (matches === undefined) {
+        matches = modules.filter(module => module.name.match(pattern))
+        pattern_matches.set(key, matches)
+    }
+    return matches
+}
+
+
+/**
+ * Returns the module which contains the given address.
+ */
+export function findModuleByAddress(address: NativePointer): Module | null {
+    ensureRegistry()
+    for (const module of modules) {
+        if (address.compare(module.base) >= 0 && address.compare(module.base.add(module.size)) < 0) {
+            return module
+        }
+    }
+    return null
+}
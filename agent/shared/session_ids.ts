@@ -0,0 +1,84 @@
+/*
+The session id of a connection is send with every decrypted record, but it only changes when the
+TLS library switches to another session (e.g. a resumed session or a TLS 1.3 session ticket).
+Therefore the id is read once per connection and cached for the handle of the TLS library
+(SSL*, gnutls_session_t, PRFileDesc*, ...) together with the session object it was read from.
+The entry is dropped when the library frees the handle (see util/connections.ts) and invalidated
+as soon as the handle uses another session object. Ids which aren't available yet (e.g. an error of
+the library before the handshake finished) are never cached, so the next record tries again.
+*/
+
+// "00" ... "FF", session ids are reported in upper case
+const HEX_TABLE: Array<string> = []
+for (let n = 0; n <= 0xff; ++n) {
+    HEX_TABLE.push(n.toString(16).padStart(2, "0").toUpperCase())
+}
+
+// libraries without a close hook on a platform only rely on this limit
+const MAX_CACHED_SESSION_IDS = 4096
+
+var session_ids = new Map<string, { session: string, session_id: string }>()
+
+
+/**
+ * Converts bytes into an upper case hex string, e.g. [0xAB, 0x01] ==> "AB01".
+ */
+export function bytesToHex(bytes: ArrayBuffer | null): string {
+    if (bytes === null) {
+        return ""
+    }
+    var array = new Uint8Array(bytes)
+    var hex = ""
+    for (var i = 0; i < array.length; i++) {
+        hex += HEX_TABLE[array[i]]
+    }
+    return hex
+}
+
+
+/**
+ * Reads a session id of the given length with a single read and returns it as hex string.
+ */
+export function readSessionId(address: NativePointer, length: number): string {
+    if (address.isNull() || length <= 0) {
+        return ""
+    }
+    return bytesToHex(address.readByteArray(length))
+}
+
+
+/**
+ * Returns the cached session id of a connection or reads it with read_session_id.
+ * @param {NativePointer} handle The connection object of the TLS library
+ * @param {NativePointer} session The session object used by the connection (e.g. SSL_SESSION*) or NULL if the
+ *     library doesn't expose it. The id is read again when it changes.
+ * @param read_session_id Reads the id of the connection, it returns null if there is no id yet.
+ * @return {string | null} The session id as hex string or null if there is none yet.
+ */
+export function getSessionId(handle: NativePointer, session: NativePointer, read_session_id: (handle: NativePointer, session: NativePointer) => string | null): string | null {
+    var key = handle.toString()
+    var session_key = session.toString()
+    var entry = session_ids.get(key)
+    if (entry !== undefined && entry.session === session_key) {
+        return entry.session_id
+    }
+
+    var session_id = read_session_id(handle, session)
+    if (session_id === null) {
+        return null
+    }
+    if (entry === undefined && session_ids.size >= MAX_CACHED_SESSION_IDS) {
+        // the oldest connection is most likely gone
+        session_ids.delete(session_ids.keys().next().value as string)
+    }
+    session_ids.set(key, { session: session_key, session_id: session_id })
+    return session_id
+}
+
+
+/**
+ * Drops the cached session id of a connection, called when the TLS library frees its handle.
+ */
+export function forgetSessionId(handle: NativePointer | string) {
+    session_ids.delete(handle.toString())
+}
@@ -1,5 +1,10 @@
 import { log, devlog } from "../util/log.js";
 import { AF_INET, AF_INET6, ModuleHookingType } from "./shared_structures.js";
+import { binary_records } from "../ssl_log.js";
+import { Endpoints, get_endpoints, cache_endpoints } from "../util/connections.js";
+import { globToRegExp, resolveExport } from "./module_exports.js";
+import { getModules, findModule, findModules, refreshModules } from "./module_registry.js";
+import { claim_module, release_module } from "../util/hook_registry.js";
 
 
 function wait_for_library_loaded(module_name: string){
@@ -52,11 +57,9 @@ export function ssl_library_loader(plattform_name: string, module_library_mappin
 
 //TODO: 
 export function getSocketLibrary(){
-    var moduleNames: Array<String> = getModuleNames()
-    var socket_library_name = ""
     switch(Process.platform){
         case "linux":
-            return moduleNames.find(element => element.match(/libc.*\.so/))
+            return findModules(/libc.*\.so/).map(module => module.name)[0]
         case "windows":
             return "WS2_32.dll"
         case "darwin":
@@ -68,13 +71,19 @@ export function getSocketLibrary(){
 }
 
 export function getModuleNames(){
-    var moduleNames: Array<string> = []
-    Process.enumerateModules().forEach(item => moduleNames.push(item.name))
-    return moduleNames;
+    return getModules().map(module => module.name);
 }
 
+/**
+ * Read the addresses for the given methods from the given modules
+ * @param {{[key: string]: Array<String> }} library_method_mapping A string indexed list of arrays, mapping modules to methods
+ * @return {{[key: string]: { [functionName: string]: NativePointer } }} A string indexed list of NativePointers, which point to the respective methods
+ *
+ * The methods are looked up in the export index of the registered modules (see module_exports.ts and
+ * module_registry.ts), so the exports of a module are only enumerated once.
+ */
 export function readAddresses(moduleName: string, library_method_mapping: { [key: string]: Array<string> }): { [library_name: string]: { [functionName: string]: NativePointer } } {
-    const resolver = new ApiResolver("module");
+    const modules = getModules();
     const addresses: { [library_name: string]: { [functionName: string]: NativePointer } } = {};
 
     // Initialize addresses[moduleName] as an empty object if not already initialized
@@ -83,31 +92,26 @@ export function readAddresses(moduleName: string, library_method_mapping: { [key
     }
 
     for (const library_name in library_method_mapping) {
+        const library_regex = globToRegExp(library_name);
         library_method_mapping[library_name].forEach(function (method) {
-            const matches = resolver.enumerateMatches("exports:" + library_name + "!" + method);
-            let match_number = 0;
+            let address = resolveExport(library_regex, method, modules);
+            if (address === null) {
+                // e.g. a dependency which was loaded together with the library
+                refreshModules();
+                address = resolveExport(library_regex, method, modules);
+            }
             let method_name = method.toString();
 
             if (method_name.endsWith("*")) { // this is for the temporary iOS bug using Frida's ApiResolver
                 method_name = method_name.substring(0, method_name.length - 1);
             }
 
-            if (matches.length == 0) {
+            if (address === null) {
                 throw "Could not find " + library_name + "!" + method;
-            } else if (matches.length == 1) {
-                devlog("Found " + method + " " + matches[0].address);
-            } else {
-                // Sometimes Frida returns duplicates or it finds more than one result.
-                for (let k = 0; k < matches.length; k++) {
-                    if (matches[k].name.endsWith(method_name)) {
-                        match_number = k;
-                        devlog("Found " + method + " " + matches[match_number].address);
-                        break;
-                    }
-                }
             }
+            devlog("Found " + method + " " + address);
 
-            addresses[moduleName][method_name] = matches[match_number].address;
+            addresses[moduleName][method_name] = address;
         });
     }
 
@@ -117,72 +121,142 @@ export function readAddresses(moduleName: string, library_method_mapping: { [key
 
 
 /**
- * Read the addresses for the given methods from the given modules
- * @param {{[key: string]: Array<String> }} library_method_mapping A string indexed list of arrays, mapping modules to methods
- * @param is_base_hook a boolean value to indicate if this hooks are done on the start or during dynamic library loading
- * @return {{[key: string]: { [functionName: string]: NativePointer } }} A string indexed list of NativePointers, which point to the respective methods
+ * Same as readAddresses, kept for older callers
  */
  export function readAddresses2(moduleName: string, library_method_mapping: { [key: string]: Array<string> }): { [library_name: string]: { [functionName: string]: NativePointer } } {
-    var resolver = new ApiResolver("module");
-    var addresses: { [library_name: string]: { [functionName: string]: NativePointer } } = {};
-    
+    return readAddresses(moduleName, library_method_mapping);
+}
 
-    // Initialize addresses[library_name] as an empty object if not already initialized
-    if (!addresses[moduleName]) {
-        addresses[moduleName] = {};
-    }
 
-    for (let library_name in library_method_mapping) {
 
-        library_method_mapping[library_name].forEach(function (method) {
-            var matches = resolver.enumerateMatches("exports:" + library_name + "!" + method);
-            var match_number = 0;
-            var method_name = method.toString();
+/**
+ * Returns the base address of a given module
+ * @param {string} moduleName Name of module to return base address from
+ * @returns
+ */
+ export function getBaseAddress(moduleName: String): NativePointer | null {
+    const module = findModule(moduleName)
+    return module === null ? null : module.base;
+}
 
-            if (method_name.endsWith("*")) { // this is for the temporary iOS bug using Frida's ApiResolver
-                method_name = method_name.substring(0, method_name.length - 1);
-            }
 
-            if (matches.length == 0) {
-                throw "Could not find " + library_name + "!" + method;
-            } else if (matches.length == 1) {
-                devlog("Found " + method + " " + matches[0].address);
-            } else {
-                // Sometimes Frida returns duplicates or it finds more than one result.
-                for (var k = 0; k < matches.length; k++) {
-                    if (matches[k].name.endsWith(method_name)) {
-                        match_number = k;
-                        devlog("Found " + method + " " + matches[match_number].address);
-                        break;
-                    }
-                }
-            }
+// 127.0.0.1 as used for the fallback socket information (--enable_default_fd)
+export const DEFAULT_FD_ADDR = 0x7F000001
 
-            addresses[moduleName][method_name] = matches[match_number].address;
-        });
+
+/**
+ * Checks if the 16 bytes at the given address are an IPv4-mapped IPv6 address (::ffff:a.b.c.d)
+ * @param {NativePointer} ipv6_addr Pointer to the raw IPv6 address
+ */
+export function isIPv4MappedAddress(ipv6_addr: NativePointer): boolean {
+    return ipv6_addr.readU32() == 0 && ipv6_addr.add(4).readU32() == 0 && ipv6_addr.add(8).readU16() == 0 && ipv6_addr.add(10).readU16() == 0xFFFF
+}
+
+
+/**
+ * Returns the IPv6 address at the given address in the form friTap expects it. When binary records are
+ * used the raw bytes are passed through, otherwise it is formatted as hex string.
+ * @param {NativePointer} ipv6_addr Pointer to the raw IPv6 address
+ */
+export function getIPv6Address(ipv6_addr: NativePointer): string | ArrayBuffer {
+    if (binary_records) {
+        return ipv6_addr.readByteArray(16)
+    }
+    var address = ""
+    for (var offset = 0; offset < 16; offset += 1) {
+        address += ("0" + ipv6_addr.add(offset).readU8().toString(16).toUpperCase()).substr(-2)
     }
+    return address
+}
 
-    return addresses;
+
+interface SocketFunctions {
+    getpeername: NativeFunction<number, [number, NativePointerValue, NativePointerValue]>
+    getsockname: NativeFunction<number, [number, NativePointerValue, NativePointerValue]>
+    addr: NativePointer
+    addrlen: NativePointer
+}
+
+// the socket functions and their scratch buffers are created once for the addresses of every hooked module,
+// getpeername/getsockname keep the JS lock and the returned address is parsed without any further native call
+// (ports and IPv4 addresses are read in network byte order instead of calling ntohs/ntohl), so that hooks on
+// other threads can't overwrite the buffers meanwhile
+var socket_functions = new WeakMap<{ [key: string]: NativePointer }, SocketFunctions>()
+
+
+function getSocketFunctions(methodAddresses: { [key: string]: NativePointer }): SocketFunctions {
+    var functions = socket_functions.get(methodAddresses)
+    if (functions === undefined) {
+        functions = {
+            getpeername: new NativeFunction(methodAddresses["getpeername"], "int", ["int", "pointer", "pointer"], { scheduling: "exclusive" }),
+            getsockname: new NativeFunction(methodAddresses["getsockname"], "int", ["int", "pointer", "pointer"], { scheduling: "exclusive" }),
+            addr: Memory.alloc(128),
+            addrlen: Memory.alloc(4)
+        }
+        socket_functions.set(methodAddresses, functions)
+    }
+    return functions
+}
+
+
+function readU16NetworkOrder(address: NativePointer): number {
+    return (address.readU8() << 8) | address.add(1).readU8()
 }
 
 
+function readU32NetworkOrder(address: NativePointer): number {
+    return ((address.readU8() << 24) | (address.add(1).readU8() << 16) | (address.add(2).readU8() << 8) | address.add(3).readU8()) >>> 0
+}
+
 
 /**
- * Returns the base address of a given module
- * @param {string} moduleName Name of module to return base address from
- * @returns
+ * Reads the address returned by getsockname/getpeername into the given endpoint ("local" or "peer").
  */
- export function getBaseAddress(moduleName: String): NativePointer | null {
-    console.log("Module to find:",moduleName)
-    const modules = Process.enumerateModules()
-
-    for(const module of modules){
-        if(module.name == moduleName){
-            return module.base;
+function readSocketAddress(functions: SocketFunctions, endpoint: string, socket_endpoints: { [key: string]: any }) {
+    var addr = functions.addr
+    var family = addr.readU16()
+    if (family == AF_INET) {
+        socket_endpoints[endpoint + "_port"] = readU16NetworkOrder(addr.add(2))
+        socket_endpoints[endpoint + "_addr"] = readU32NetworkOrder(addr.add(4))
+        socket_endpoints["ss_family"] = "AF_INET"
+    } else if (family == AF_INET6) {
+        socket_endpoints[endpoint + "_port"] = readU16NetworkOrder(addr.add(2))
+        var ipv6_addr = addr.add(8)
+        if (isIPv4MappedAddress(ipv6_addr)) {
+            socket_endpoints[endpoint + "_addr"] = readU32NetworkOrder(ipv6_addr.add(12))
+            socket_endpoints["ss_family"] = "AF_INET"
         }
+        else {
+            socket_endpoints[endpoint + "_addr"] = getIPv6Address(ipv6_addr)
+            socket_endpoints["ss_family"] = "AF_INET6"
+        }
+    } else {
+        devlog("[-] getPortsAndAddresses resolving error:"+family)
+        throw "Only supporting IPv4/6"
     }
+}
 
-    return null;
+
+/**
+ * Looks up the local (getsockname) and the peer (getpeername) address of a socket. Throws if one of the lookups
+ * fails (e.g. ENOTCONN), the scratch buffer would still hold the previous address then.
+ */
+function getSocketEndpoints(sockfd: number, methodAddresses: { [key: string]: NativePointer }): Endpoints {
+    var functions = getSocketFunctions(methodAddresses)
+    var socket_endpoints: { [key: string]: any } = {}
+    functions.addrlen.writeU32(128)
+    if (functions.getsockname(sockfd, functions.addr, functions.addrlen) != 0) {
+        devlog("[-] getPortsAndAddresses: getsockname failed for fd " + sockfd)
+        throw "Could not resolve the local address of the socket"
+    }
+    readSocketAddress(functions, "local", socket_endpoints)
+    functions.addrlen.writeU32(128)
+    if (functions.getpeername(sockfd, functions.addr, functions.addrlen) != 0) {
+        devlog("[-] getPortsAndAddresses: getpeername failed for fd " + sockfd)
+        throw "Could not resolve the peer address of the socket"
+    }
+    readSocketAddress(functions, "peer", socket_endpoints)
+    return socket_endpoints as Endpoints
 }
 
 
@@ -192,65 +266,48 @@ export function readAddresses(moduleName: string, library_method_mapping: { [key
 * @param {int} sockfd The file descriptor of the socket to inspect.
 * @param {boolean} isRead If true, the context is an SSL_read call. If
 *     false, the context is an SSL_write call.
-* @param {{ [key: string]: NativePointer}} methodAddresses Dictionary containing (at least) addresses for getpeername, getsockname, ntohs and ntohl
+* @param {{ [key: string]: NativePointer}} methodAddresses Dictionary containing (at least) addresses for getpeername and getsockname
+* @param {NativePointer} handle The connection object of the TLS library (e.g. SSL*). If given, the endpoints are
+*     only looked up for the first record of the connection (see util/connections.ts).
 * @return {{ [key: string]: string | number }} Dictionary of sockfd's "src_addr", "src_port", "dst_addr",
 *     and "dst_port".
 */
-export function getPortsAndAddresses(sockfd: number, isRead: boolean, methodAddresses: { [key: string]: NativePointer }, enable_default_fd : boolean): { [key: string]: string | number } {
+export function getPortsAndAddresses(sockfd: number, isRead: boolean, methodAddresses: { [key: string]: NativePointer }, enable_default_fd : boolean, handle?: NativePointer): { [key: string]: any } {
 
-    var message: { [key: string]: string | number } = {}
+    var message: { [key: string]: any } = {}
     if (enable_default_fd && (sockfd < 0)){
         
         message["src" + "_port"] = 1234
-        message["src" + "_addr"] = "127.0.0.1"
+        message["src" + "_addr"] = DEFAULT_FD_ADDR
         message["dst" + "_port"] = 2345
-        message["dst" + "_addr"] = "127.0.0.1"
+        message["dst" + "_addr"] = DEFAULT_FD_ADDR
         message["ss_family"] = "AF_INET"
 
         return message
     }
 
-    var getpeername = new NativeFunction(methodAddresses["getpeername"], "int", ["int", "pointer", "pointer"])
-    var getsockname = new NativeFunction(methodAddresses["getsockname"], "int", ["int", "pointer", "pointer"])
-    var ntohs = new NativeFunction(methodAddresses["ntohs"], "uint16", ["uint16"])
-    var ntohl = new NativeFunction(methodAddresses["ntohl"], "uint32", ["uint32"])
-
-    var addrlen = Memory.alloc(4)
-    var addr = Memory.alloc(128)
-    var src_dst = ["src", "dst"]
-    for (var i = 0; i < src_dst.length; i++) {
-        addrlen.writeU32(128)
-        if ((src_dst[i] == "src") !== isRead) {
-            devlog("src")
-            getsockname(sockfd, addr, addrlen)
-        }
-        else {
-            devlog("dst")
-            getpeername(sockfd, addr, addrlen)
-        }
-        if (addr.readU16() == AF_INET) {
-            message[src_dst[i] + "_port"] = ntohs(addr.add(2).readU16()) as number
-            message[src_dst[i] + "_addr"] = ntohl(addr.add(4).readU32()) as number
-            message["ss_family"] = "AF_INET"
-        } else if (addr.readU16() == AF_INET6) {
-            message[src_dst[i] + "_port"] = ntohs(addr.add(2).readU16()) as number
-            message[src_dst[i] + "_addr"] = ""
-            var ipv6_addr = addr.add(8)
-            for (var offset = 0; offset < 16; offset += 1) {
-                message[src_dst[i] + "_addr"] += ("0" + ipv6_addr.add(offset).readU8().toString(16).toUpperCase()).substr(-2)
-            }
-            if (message[src_dst[i] + "_addr"].toString().indexOf("00000000000000000000FFFF") === 0) {
-                message[src_dst[i] + "_addr"] = ntohl(ipv6_addr.add(12).readU32()) as number
-                message["ss_family"] = "AF_INET"
-            }
-            else {
-                message["ss_family"] = "AF_INET6"
-            }
-        } else {
-            devlog("[-] getPortsAndAddresses resolving error:"+addr.readU16())
-            throw "Only supporting IPv4/6"
+    var socket_endpoints = handle === undefined ? undefined : get_endpoints(sockfd, handle)
+    if (socket_endpoints === undefined) {
+        // only reached when both lookups succeeded, a failed lookup throws and is retried on the next record
+        socket_endpoints = getSocketEndpoints(sockfd, methodAddresses)
+        if (handle !== undefined) {
+            cache_endpoints(sockfd, handle, socket_endpoints)
         }
     }
+
+    // data read by the target was sent by its peer
+    if (isRead) {
+        message["src_port"] = socket_endpoints.peer_port
+        message["src_addr"] = socket_endpoints.peer_addr
+        message["dst_port"] = socket_endpoints.local_port
+        message["dst_addr"] = socket_endpoints.local_addr
+    } else {
+        message["src_port"] = socket_endpoints.local_port
+        message["src_addr"] = socket_endpoints.local_addr
+        message["dst_port"] = socket_endpoints.peer_port
+        message["dst_addr"] = socket_endpoints.peer_addr
+    }
+    message["ss_family"] = socket_endpoints.ss_family
     return message
 }
 
@@ -267,13 +324,13 @@ export function byteArrayToString(byteArray: any) {
     }).join('')
 }
 
-export function toHexString (byteArray: any) {
-    const byteToHex: any = [];
+// "00" ... "ff", built once instead of for every conversion
+const byteToHex: Array<string> = [];
+for (let n = 0; n <= 0xff; ++n){
+    byteToHex.push(n.toString(16).padStart(2, "0"));
+}
 
-    for (let n = 0; n <= 0xff; ++n){
-        const hexOctet = n.toString(16).padStart(2, "0");
-        byteToHex.push(hexOctet);
-    }
+export function toHexString (byteArray: any) {
     return Array.prototype.map.call(
         new Uint8Array(byteArray),
         n => byteToHex[n]
@@ -322,6 +379,16 @@ export function getAttribute(Instance: Java.Wrapper, fieldName: string) {
 // Wrapper function to ensure all execute functions conform to the required signature
 export function invokeHookingFunction(func: (moduleName: string, is_base_hook: boolean) => void): (moduleName: string, is_base_hook: boolean) => void {
     return (moduleName: string, is_base_hook: boolean) => {
-        func(moduleName, is_base_hook);
+        // ssl_library_loader and the dynamic loader hooks may hand over the same module several times
+        if (!claim_module(moduleName, func)) {
+            devlog(`${moduleName} is already hooked`);
+            return;
+        }
+        try {
+            func(moduleName, is_base_hook);
+        } catch (error) {
+            release_module(moduleName, func);
+            throw error;
+        }
     };
 }
\ No newline at end of file
@@ -1,6 +1,10 @@
 import { readAddresses, getPortsAndAddresses, toHexString, getBaseAddress } from "../shared/shared_functions.js";
 import { log } from "../util/log.js";
+import { attach_hook } from "../util/hook_registry.js";
 import { offsets, enable_default_fd } from "../ssl_log.js";
+import { datalog } from "../util/datalog.js";
+import { track_connection, install_close_hooks } from "../util/connections.js";
+import { getSessionId, readSessionId } from "../shared/session_ids.js";
 
 export class GnuTLS {
 
@@ -11,6 +15,8 @@ export class GnuTLS {
     
     static gnutls_transport_get_int : any;
     static gnutls_session_get_id: any;
+    static session_id_buffer: NativePointer = Memory.alloc(32);
+    static session_id_length: NativePointer = Memory.alloc(4);
     static gnutls_session_get_random: any;
     static gnutls_session_set_keylog_function: any;
 
@@ -56,7 +62,8 @@ export class GnuTLS {
         }
 
         GnuTLS.gnutls_transport_get_int = new NativeFunction(this.addresses[this.moduleName]["gnutls_transport_get_int"], "int", ["pointer"])
-        GnuTLS.gnutls_session_get_id = new NativeFunction(this.addresses[this.moduleName]["gnutls_session_get_id"], "int", ["pointer", "pointer", "pointer"])
+        // exclusive: the id is written into buffers shared by all threads
+        GnuTLS.gnutls_session_get_id = new NativeFunction(this.addresses[this.moduleName]["gnutls_session_get_id"], "int", ["pointer", "pointer", "pointer"], { scheduling: "exclusive" })
         GnuTLS.gnutls_session_set_keylog_function = new NativeFunction(this.addresses[this.moduleName]["gnutls_session_set_keylog_function"], "void", ["pointer", "pointer"])
         GnuTLS.gnutls_session_get_random = new NativeFunction(this.addresses[this.moduleName]["gnutls_session_get_random"], "pointer", ["pointer", "pointer", "pointer"])
 
@@ -114,45 +121,39 @@ export class GnuTLS {
        *     "59FD71B7B90202F359D89E66AE4E61247954E28431F6C6AC46625D472FF76336".
        */
      static getSslSessionId(session: NativePointer) {
-        var len_pointer = Memory.alloc(4)
-        var err = GnuTLS.gnutls_session_get_id(session, NULL, len_pointer)
-        if (err != 0) {
-            if(enable_default_fd){
-                log("using dummy SessionID: 59FD71B7B90202F359D89E66AE4E61247954E28431F6C6AC46625D472FF76337")
-                return "59FD71B7B90202F359D89E66AE4E61247954E28431F6C6AC46625D472FF76337"
-            }
-            return ""
-        }
-        var len = len_pointer.readU32()
-        var p = Memory.alloc(len)
-        err = GnuTLS.gnutls_session_get_id(session, p, len_pointer)
-        if (err != 0) {
+        // gnutls has no session object of its own, the id is cached until gnutls_deinit
+        var session_id = getSessionId(session, NULL, GnuTLS.readSessionIdOfSession)
+        if (session_id === null) {
             if(enable_default_fd){
                 log("using dummy SessionID: 59FD71B7B90202F359D89E66AE4E61247954E28431F6C6AC46625D472FF76337")
                 return "59FD71B7B90202F359D89E66AE4E61247954E28431F6C6AC46625D472FF76337"
             }
             return ""
         }
-        var session_id = ""
-        for (var i = 0; i < len; i++) {
-            // Read a byte, convert it to a hex string (0xAB ==> "AB"), and append
-            // it to session_id.
+        return session_id
+    }
 
-            session_id +=
-                ("0" + p.add(i).readU8().toString(16).toUpperCase()).substr(-2)
+    static readSessionIdOfSession(session: NativePointer, unused: NativePointer): string | null {
+        var len_pointer = GnuTLS.session_id_length
+        len_pointer.writeU32(32) // GNUTLS_MAX_SESSION_ID_SIZE
+        var err = GnuTLS.gnutls_session_get_id(session, GnuTLS.session_id_buffer, len_pointer)
+        if (err != 0) {
+            return null
         }
-        return session_id
+        return readSessionId(GnuTLS.session_id_buffer, len_pointer.readU32())
     }
 
     install_plaintext_read_hook(){
         var current_module_name = this.module_name;
         var lib_addesses = this.addresses;
-        Interceptor.attach(this.addresses[this.moduleName]["gnutls_record_recv"],
+        attach_hook("gnutls_record_recv", this.addresses[this.moduleName]["gnutls_record_recv"],
     {
         onEnter: function (args: any) {
-            var message = getPortsAndAddresses(GnuTLS.gnutls_transport_get_int(args[0]) as number, true, lib_addesses[current_module_name], enable_default_fd)
+            var fd = GnuTLS.gnutls_transport_get_int(args[0]) as number
+            var message = getPortsAndAddresses(fd, true, lib_addesses[current_module_name], enable_default_fd, args[0])
             message["ssl_session_id"] = GnuTLS.getSslSessionId(args[0])
             message["function"] = "SSL_read"
+            track_connection(args[0], fd, message)
             this.message = message
             this.buf = args[1]
         },
@@ -162,7 +163,7 @@ export class GnuTLS {
                 return
             }
             this.message["contentType"] = "datalog"
-            send(this.message, this.buf.readByteArray(retval))
+            datalog(this.message, this.buf.readByteArray(retval))
         }
     })
 
@@ -171,14 +172,16 @@ export class GnuTLS {
     install_plaintext_write_hook(){
         var current_module_name = this.module_name;
         var lib_addesses = this.addresses;
-        Interceptor.attach(this.addresses[this.moduleName]["gnutls_record_send"],
+        attach_hook("gnutls_record_send", this.addresses[this.moduleName]["gnutls_record_send"],
     {
         onEnter: function (args: any) {
-            var message = getPortsAndAddresses(GnuTLS.gnutls_transport_get_int(args[0]) as number, false, lib_addesses[current_module_name], enable_default_fd)
+            var fd = GnuTLS.gnutls_transport_get_int(args[0]) as number
+            var message = getPortsAndAddresses(fd, false, lib_addesses[current_module_name], enable_default_fd, args[0])
             message["ssl_session_id"] = GnuTLS.getSslSessionId(args[0])
             message["function"] = "SSL_write"
             message["contentType"] = "datalog"
-            send(message, args[1].readByteArray(parseInt(args[2])))
+            track_connection(args[0], fd, message)
+            datalog(message, args[1].readByteArray(parseInt(args[2])))
         },
         onLeave: function (retval: any) {
         }
@@ -190,6 +193,10 @@ export class GnuTLS {
         
     }
 
+    install_close_hook(){
+        install_close_hooks(this.module_name, ["gnutls_deinit"])
+    }
+
 
 
 }
\ No newline at end of file
@@ -1,6 +1,8 @@
 import { readAddresses, getPortsAndAddresses, getBaseAddress} from "../shared/shared_functions.js";
 import { enable_default_fd, offsets } from "../ssl_log.js";
 import { log } from "../util/log.js";
+import { attach_hook } from "../util/hook_registry.js";
+import { datalog } from "../util/datalog.js";
 
 
 export class matrix_SSL {
@@ -70,7 +72,7 @@ export class matrix_SSL {
         var lib_addesses = this.addresses;
         
     
-        Interceptor.attach(this.addresses[this.moduleName]["matrixSslReceivedData"], {
+        attach_hook("matrixSslReceivedData", this.addresses[this.moduleName]["matrixSslReceivedData"], {
             onEnter: function (args) {
                 this.buffer = args[2];
                 this.len = args[3];
@@ -89,7 +91,7 @@ export class matrix_SSL {
 
                 var data = this.buffer.readByteArray(this.len);
                 this.message["contentType"] = "datalog"
-                send(this.message, data)
+                datalog(this.message, data)
 
 
             }
@@ -103,7 +105,7 @@ export class matrix_SSL {
         var current_module_name = this.module_name;
         var lib_addesses = this.addresses;
         //This function is needed to extract the buffer address in which the plaintext will be stored before registring this buffer as the "sent data" buffer.
-        Interceptor.attach(this.addresses[this.moduleName]["matrixSslGetWritebuf"], {
+        attach_hook("matrixSslGetWritebuf", this.addresses[this.moduleName]["matrixSslGetWritebuf"], {
             onEnter: function (args) {
                 this.outBuffer = args[1];
             },
@@ -121,7 +123,7 @@ export class matrix_SSL {
 
          //This function actual encodes the plaintext. We need to hook this, because the user will fill the data out buffer between matrixSslGetWritebuf and matrixSslEncodeWritebuf call.
          //So at the time this function is called, the buffer with the plaintext will be final 
-         Interceptor.attach(this.addresses[this.moduleName]["matrixSslEncodeWritebuf"], {
+         attach_hook("matrixSslEncodeWritebuf", this.addresses[this.moduleName]["matrixSslEncodeWritebuf"], {
 
             onEnter: function (args) {
                 var data = this.outBuffer.readByteArray(this.outBufferLength);
@@ -129,7 +131,7 @@ export class matrix_SSL {
                 message["ssl_session_id"] = this.addresses[this.moduleName]["matrixSslGetSid"] === undefined ? matrix_SSL.sessionId : this.getSessionId(args[0]);
                 message["function"] = "matrixSslEncodeWritebuf"
                 message["contentType"] = "datalog"
-                send(message, data)
+                datalog(message, data)
             }
         });
 
@@ -142,7 +144,7 @@ export class matrix_SSL {
 
     install_helper_hook(){        
     
-        Interceptor.attach(this.addresses[this.moduleName]["matrixSslNewSessionId"], {
+        attach_hook("matrixSslNewSessionId", this.addresses[this.moduleName]["matrixSslNewSessionId"], {
             onEnter: function (args) {
                 this.sslSessionPointer = args[0];
             },
@@ -158,7 +160,7 @@ export class matrix_SSL {
 
         });
 
-        Interceptor.attach(this.addresses[this.moduleName]["connect"], {
+        attach_hook("connect", this.addresses[this.moduleName]["connect"], {
             onEnter: function (args) {
             },
             onLeave: function (retval: any) {
@@ -1,6 +1,10 @@
 import { readAddresses, getPortsAndAddresses, getBaseAddress} from "../shared/shared_functions.js";
 import { offsets, enable_default_fd } from "../ssl_log.js";
 import { log } from "../util/log.js";
+import { attach_hook } from "../util/hook_registry.js";
+import { datalog } from "../util/datalog.js";
+import { install_close_hooks } from "../util/connections.js";
+import { getSessionId, readSessionId } from "../shared/session_ids.js";
 
 /**
  * 
@@ -176,15 +180,17 @@ export class mbed_TLS {
 
 
     static getSessionId(sslcontext: NativePointer) {
-        var ssl_context = mbed_TLS.parse_mbedtls_ssl_context_struct(sslcontext)
-
-        var session_id = ''
-        for (var byteCounter = 0; byteCounter < ssl_context.session.id_len; byteCounter++) {
-
-            session_id = `${session_id}${ssl_context.session.id?.unwrap().add(byteCounter).readU8().toString(16).toUpperCase()}`
+        // only the session pointer is read for every record, the id itself is cached until it changes
+        var session = sslcontext.add(24 + 7 * Process.pointerSize).readPointer()
+        if (session.isNull()) {
+            return ""
         }
+        return getSessionId(sslcontext, session, mbed_TLS.readSessionIdOfSession)
+    }
 
-        return session_id
+    static readSessionIdOfSession(sslcontext: NativePointer, session: NativePointer): string {
+        // the id of a mbedtls_ssl_session has at most 32 bytes
+        return readSessionId(session.add(8 + 4 + 4 + 4), Math.min(session.add(8 + 4 + 4).readU32(), 32))
     }
 
 
@@ -192,13 +198,13 @@ export class mbed_TLS {
         var current_module_name = this.module_name;
         var lib_addesses = this.addresses;
         //https://tls.mbed.org/api/ssl_8h.html#aa2c29eeb1deaf5ad9f01a7515006ede5
-        Interceptor.attach(this.addresses[this.moduleName]["mbedtls_ssl_read"], {
+        attach_hook("mbedtls_ssl_read", this.addresses[this.moduleName]["mbedtls_ssl_read"], {
             onEnter: function (args) {
                 this.buffer = args[1];
                 this.len = args[2];
                 this.sslContext = args[0];
 
-                var message = getPortsAndAddresses(mbed_TLS.getSocketDescriptor(args[0]) as number, true, lib_addesses[current_module_name], enable_default_fd)
+                var message = getPortsAndAddresses(mbed_TLS.getSocketDescriptor(args[0]) as number, true, lib_addesses[current_module_name], enable_default_fd, args[0])
                 message["ssl_session_id"] = mbed_TLS.getSessionId(args[0])
                 message["function"] = "mbedtls_ssl_read"
                 this.message = message
@@ -211,7 +217,7 @@ export class mbed_TLS {
 
                 var data = this.buffer.readByteArray(retval);
                 this.message["contentType"] = "datalog"
-                send(this.message, data)
+                datalog(this.message, data)
 
 
             }
@@ -225,7 +231,7 @@ export class mbed_TLS {
         var current_module_name = this.module_name;
         var lib_addesses = this.addresses;
         //https://tls.mbed.org/api/ssl_8h.html#a5bbda87d484de82df730758b475f32e5
-        Interceptor.attach(this.addresses[this.moduleName]["mbedtls_ssl_write"], {
+        attach_hook("mbedtls_ssl_write", this.addresses[this.moduleName]["mbedtls_ssl_write"], {
 
             onEnter: function (args) {
                 var buffer = args[1];
@@ -235,17 +241,22 @@ export class mbed_TLS {
                     return
                 }
                 var data = buffer.readByteArray(len);
-                var message = getPortsAndAddresses(mbed_TLS.getSocketDescriptor(args[0]) as number, false, lib_addesses[current_module_name], enable_default_fd)
+                var message = getPortsAndAddresses(mbed_TLS.getSocketDescriptor(args[0]) as number, false, lib_addesses[current_module_name], enable_default_fd, args[0])
                 message["ssl_session_id"] = mbed_TLS.getSessionId(args[0])
                 message["function"] = "mbedtls_ssl_write"
                 message["contentType"] = "datalog"
-                send(message, data)
+                datalog(message, data)
             }
         });
 
     }
 
 
+    install_close_hook() {
+        install_close_hooks(this.module_name, ["mbedtls_ssl_free", "mbedtls_ssl_session_reset"])
+    }
+
+
     install_tls_keys_callback_hook() {
         // TBD
     }
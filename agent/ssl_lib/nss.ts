@@ -1,7 +1,11 @@
-import { readAddresses, getBaseAddress } from "../shared/shared_functions.js";
+import { readAddresses, getBaseAddress, isIPv4MappedAddress, getIPv6Address, DEFAULT_FD_ADDR } from "../shared/shared_functions.js";
 import { pointerSize, AF_INET, AF_INET6 } from "../shared/shared_structures.js";
 import { log, devlog } from "../util/log.js";
+import { attach_hook } from "../util/hook_registry.js";
 import { offsets,enable_default_fd } from "../ssl_log.js";
+import { datalog } from "../util/datalog.js";
+import { track_connection, install_close_hooks } from "../util/connections.js";
+import { getSessionId, readSessionId } from "../shared/session_ids.js";
 
 
 /**
@@ -645,15 +649,15 @@ struct {
 typedef union PRNetAddr PRNetAddr;
 
 */
-    static getPortsAndAddressesFromNSS(sockfd: NativePointer | null, isRead: boolean, methodAddresses: { [key: string]: NativePointer }, enable_default_fd: boolean): { [key: string]: string | number } {
+    static getPortsAndAddressesFromNSS(sockfd: NativePointer | null, isRead: boolean, methodAddresses: { [key: string]: NativePointer }, enable_default_fd: boolean): { [key: string]: any } {
 
-        var message: { [key: string]: string | number } = {}
+        var message: { [key: string]: any } = {}
         if (enable_default_fd && sockfd === null){
         
             message["src" + "_port"] = 1234
-            message["src" + "_addr"] = "127.0.0.1"
+            message["src" + "_addr"] = DEFAULT_FD_ADDR
             message["dst" + "_port"] = 2345
-            message["dst" + "_addr"] = "127.0.0.1"
+            message["dst" + "_addr"] = DEFAULT_FD_ADDR
             message["ss_family"] = "AF_INET"
     
             return message
@@ -685,16 +689,13 @@ typedef union PRNetAddr PRNetAddr;
                 message["ss_family"] = "AF_INET"
             } else if (addr.readU16() == AF_INET6) {
                 message[src_dst[i] + "_port"] = ntohs(addr.add(2).readU16()) as number
-                message[src_dst[i] + "_addr"] = ""
                 var ipv6_addr = addr.add(8)
-                for (var offset = 0; offset < 16; offset += 1) {
-                    message[src_dst[i] + "_addr"] += ("0" + ipv6_addr.add(offset).readU8().toString(16).toUpperCase()).substr(-2)
-                }
-                if (message[src_dst[i] + "_addr"].toString().indexOf("00000000000000000000FFFF") === 0) {
+                if (isIPv4MappedAddress(ipv6_addr)) {
                     message[src_dst[i] + "_addr"] = ntohl(ipv6_addr.add(12).readU32()) as number
                     message["ss_family"] = "AF_INET"
                 }
                 else {
+                    message[src_dst[i] + "_addr"] = getIPv6Address(ipv6_addr)
                     message["ss_family"] = "AF_INET6"
                 }
             } else {
@@ -773,18 +774,7 @@ typedef union PRNetAddr PRNetAddr;
 
 
     static getSessionIdString(session_id_ptr: NativePointer, len: number): string {
-        var session_id = "";
-
-
-        for (var i = 0; i < len; i++) {
-            // Read a byte, convert it to a hex string (0xAB ==> "AB"), and append
-            // it to session_id.
-
-            session_id +=
-                ("0" + session_id_ptr.add(i).readU8().toString(16).toUpperCase()).substr(-2)
-        }
-
-        return session_id
+        return readSessionId(session_id_ptr, len)
     }
 
     static getSSL_Layer(pRFileDesc: NativePointer) {
@@ -875,6 +865,12 @@ typedef union PRNetAddr PRNetAddr;
 
     static getSslSessionIdFromFD(pRFileDesc: NativePointer): string {
         var dummySSL_SessionID = "3E8ABF58649A1A1C58824D704173BA9AAFA2DA33B45FFEA341D218B29BBACF8F";
+        // SSL_GetSessionID allocates a new SECItem, so the id is only read once per PRFileDesc (until PR_Close)
+        var session_id = getSessionId(pRFileDesc, NULL, NSS.readSslSessionIdFromFD)
+        return session_id === null ? dummySSL_SessionID : session_id
+    }
+
+    static readSslSessionIdFromFD(pRFileDesc: NativePointer, unused: NativePointer): string | null {
         var fdType = NSS.getDescType(pRFileDesc)
         //log("pRFileDescType: "+ fdType)
         /*if(fdType == 4){ // LAYERED 
@@ -886,7 +882,7 @@ typedef union PRNetAddr PRNetAddr;
         }*/
         var layer = NSS.NSS_FindIdentityForName(pRFileDesc, 'SSL');
         if (!layer) {
-            return dummySSL_SessionID;
+            return null;
         }
 
         var sslSessionIdSECItem = ptr(NSS.SSL_SESSION_get_id(layer).toString())
@@ -944,7 +940,7 @@ typedef union PRNetAddr PRNetAddr;
                 devlog("Error:" + error)
 
             }
-            return dummySSL_SessionID;
+            return null;
 
 
         }
@@ -1301,7 +1297,7 @@ typedef union PRNetAddr PRNetAddr;
         var lib_addesses = this.addresses;
 
 
-        Interceptor.attach(this.addresses[this.moduleName]["PR_Read"],
+        attach_hook("PR_Read", this.addresses[this.moduleName]["PR_Read"],
             {
                 onEnter: function (args: any) {
                     // ab hier nicht mehr
@@ -1322,14 +1318,15 @@ typedef union PRNetAddr PRNetAddr;
 
                     if (addr.readU16() == 2 || addr.readU16() == 10 || addr.readU16() == 100) {
                         var message = NSS.getPortsAndAddressesFromNSS(this.fd as NativePointer, true, lib_addesses[current_module_name], enable_default_fd)
-                        devlog("Session ID: " + NSS.getSslSessionIdFromFD(this.fd))
                         message["ssl_session_id"] = NSS.getSslSessionIdFromFD(this.fd)
+                        devlog("Session ID: " + message["ssl_session_id"])
                         message["function"] = "NSS_read"
+                        track_connection(this.fd, -1, message)
                         this.message = message
 
                         this.message["contentType"] = "datalog"
                         var data = this.buf.readByteArray((new Uint32Array([retval]))[0])
-                        send(message, data)
+                        datalog(message, data)
                     } else {
                         var message = NSS.getPortsAndAddressesFromNSS( null, true, lib_addesses[current_module_name], enable_default_fd)
                         message["ssl_session_id"] = NSS.getSslSessionIdFromFD(this.fd)
@@ -1339,7 +1336,7 @@ typedef union PRNetAddr PRNetAddr;
                         this.message["contentType"] = "datalog"
                         var temp = this.buf.readByteArray((new Uint32Array([retval]))[0])
                         devlog(JSON.stringify(temp))
-                        send(message, temp)
+                        datalog(message, temp)
                     }
                 }
             })
@@ -1353,7 +1350,7 @@ typedef union PRNetAddr PRNetAddr;
         var current_module_name = this.module_name;
         var lib_addesses = this.addresses;
 
-        Interceptor.attach(this.addresses[this.moduleName]["PR_Write"],
+        attach_hook("PR_Write", this.addresses[this.moduleName]["PR_Write"],
             {
                 onEnter: function (args: any) {
                     this.fd = ptr(args[0]);
@@ -1374,7 +1371,8 @@ typedef union PRNetAddr PRNetAddr;
                         message["ssl_session_id"] = NSS.getSslSessionIdFromFD(this.fd)
                         message["function"] = "NSS_write"
                         message["contentType"] = "datalog"
-                        send(message, this.buf.readByteArray((parseInt(this.len))))
+                        track_connection(this.fd, -1, message)
+                        datalog(message, this.buf.readByteArray((parseInt(this.len))))
                     }else {
                         log("The results of NSS and its PR_Write is likely not the information transmitted over the wire. Better do a full capture and just log the TLS keys")
                         var message = NSS.getPortsAndAddressesFromNSS(null, true, lib_addesses[current_module_name], enable_default_fd)
@@ -1385,7 +1383,7 @@ typedef union PRNetAddr PRNetAddr;
                         this.message["contentType"] = "datalog"
                         var temp = this.buf.readByteArray((new Uint32Array([retval]))[0])
                         devlog(JSON.stringify(temp))
-                        send(message, temp)
+                        datalog(message, temp)
                     }
 
                 }
@@ -1393,6 +1391,10 @@ typedef union PRNetAddr PRNetAddr;
 
     }
 
+    install_close_hook() {
+        install_close_hooks(this.module_name, ["PR_Close"])
+    }
+
     /***** install callbacks for key logging ******/
 
 
@@ -1463,7 +1465,7 @@ function tls13_RecordKeyLog(pRFileDesc, secret_label, secret){
     }
 
     static insert_hook_into_secretCallback(addr_of_installed_secretCallback: NativePointer) {
-        Interceptor.attach(addr_of_installed_secretCallback,
+        attach_hook("SSLSecretCallback", addr_of_installed_secretCallback,
             {
                 onEnter(args: any) {
                     this.sslSocketFD = args[0];
@@ -2,6 +2,10 @@ import { readAddresses, getPortsAndAddresses, getBaseAddress } from "../shared/s
 import { pointerSize } from "../shared/shared_structures.js";
 import { getOffsets, offsets, enable_default_fd } from "../ssl_log.js";
 import { devlog, log } from "../util/log.js";
+import { attach_hook } from "../util/hook_registry.js";
+import { datalog } from "../util/datalog.js";
+import { track_connection, install_close_hooks } from "../util/connections.js";
+import { getSessionId, readSessionId } from "../shared/session_ids.js";
 
 
 class ModifyReceiver{
@@ -72,6 +76,7 @@ export class OpenSSL_BoringSSL {
     SSL_CTX_set_keylog_callback : any;
     SSL_get_fd: any;
     SSL_get_session: any;
+    session_id_length: NativePointer = Memory.alloc(4);
     static modReceiver: ModifyReceiver;
    
 
@@ -131,7 +136,8 @@ export class OpenSSL_BoringSSL {
 
         }
 
-        this.SSL_SESSION_get_id = new NativeFunction(this.addresses[this.moduleName]["SSL_SESSION_get_id"], "pointer", ["pointer", "pointer"]);
+        // exclusive: the length is written into a buffer shared by all threads
+        this.SSL_SESSION_get_id = new NativeFunction(this.addresses[this.moduleName]["SSL_SESSION_get_id"], "pointer", ["pointer", "pointer"], { scheduling: "exclusive" });
         this.SSL_get_fd = ObjC.available ? new NativeFunction(this.addresses[this.moduleName]["BIO_get_fd"], "int", ["pointer"]) : new NativeFunction(this.addresses[this.moduleName]["SSL_get_fd"], "int", ["pointer"]);
         this.SSL_get_session = new NativeFunction(this.addresses[this.moduleName]["SSL_get_session"], "pointer", ["pointer"]);
         
@@ -157,7 +163,7 @@ export class OpenSSL_BoringSSL {
         var instance = this;
         var current_module_name = this.module_name;
 
-        Interceptor.attach(this.addresses[this.moduleName]["SSL_read"],
+        attach_hook("SSL_read", this.addresses[this.moduleName]["SSL_read"],
         {
             
             onEnter: function (args: any) 
@@ -171,9 +177,10 @@ export class OpenSSL_BoringSSL {
 
 
             
-                var message = getPortsAndAddresses(this.fd as number, true, lib_addesses[current_module_name], enable_default_fd)
+                var message = getPortsAndAddresses(this.fd as number, true, lib_addesses[current_module_name], enable_default_fd, args[0])
                 message["ssl_session_id"] = instance.getSslSessionId(args[0])
                 message["function"] = "SSL_read"
+                track_connection(args[0], this.fd, message)
                 this.message = message
                 
                 this.buf = args[1]
@@ -200,7 +207,7 @@ export class OpenSSL_BoringSSL {
                 
                 
                 
-                send(this.message, this.buf.readByteArray(retval))
+                datalog(this.message, this.buf.readByteArray(retval))
                 
             }
         })
@@ -223,7 +230,7 @@ export class OpenSSL_BoringSSL {
         var current_module_name = this.module_name;
         var lib_addesses = this.addresses;
         var instance = this;
-        Interceptor.attach(this.addresses[this.moduleName]["SSL_write"],
+        attach_hook("SSL_write", this.addresses[this.moduleName]["SSL_write"],
         {
             onEnter: function (args: any) {
                 if (!ObjC.available){
@@ -255,10 +262,11 @@ export class OpenSSL_BoringSSL {
                 if(this.fd < 0 && enable_default_fd == false) {
                     return
                 }
-                var message = getPortsAndAddresses(this.fd as number, false, lib_addesses[current_module_name], enable_default_fd)
+                var message = getPortsAndAddresses(this.fd as number, false, lib_addesses[current_module_name], enable_default_fd, args[0])
                 message["ssl_session_id"] = instance.getSslSessionId(args[0])
                 message["function"] = "SSL_write"
                 message["contentType"] = "datalog"
+                track_connection(args[0], this.fd, message)
                 
 
                 if(OpenSSL_BoringSSL.modReceiver.writemod !== null){
@@ -269,7 +277,7 @@ export class OpenSSL_BoringSSL {
                     args[2] = new NativePointer(OpenSSL_BoringSSL.modReceiver.writemod.byteLength); 
                 }
 
-                send(message, args[1].readByteArray(args[2].toInt32()))
+                datalog(message, args[1].readByteArray(args[2].toInt32()))
                 } // this is a temporary workaround for the fd problem on iOS
             },
             onLeave: function (retval: any) {
@@ -281,12 +289,17 @@ export class OpenSSL_BoringSSL {
         log("Error: TLS key extraction not implemented yet.")
     }
 
+    install_close_hook(){
+        install_close_hooks(this.module_name, ["SSL_shutdown", "SSL_free"])
+    }
+
      /**
        * Get the session_id of SSL object and return it as a hex string.
        * @param {!NativePointer} ssl A pointer to an SSL object.
        * @return {dict} A string representing the session_id of the SSL object's
        *     SSL_SESSION. For example,
        *     "59FD71B7B90202F359D89E66AE4E61247954E28431F6C6AC46625D472FF76336".
+       *     The id is only read again when the SSL object uses another SSL_SESSION (see shared/session_ids.ts).
        */
       getSslSessionId(ssl: NativePointer) {
           
@@ -299,18 +312,12 @@ export class OpenSSL_BoringSSL {
             log("Session is null")
             return 0
         }
-        var len_pointer = Memory.alloc(4)
-        var p = this.SSL_SESSION_get_id(session, len_pointer) as NativePointer
-        var len = len_pointer.readU32()
-        var session_id = ""
-        for (var i = 0; i < len; i++) {
-            // Read a byte, convert it to a hex string (0xAB ==> "AB"), and append
-            // it to session_id.
-
-            session_id +=
-                ("0" + p.add(i).readU8().toString(16).toUpperCase()).substr(-2)
-        }
-        return session_id
+        return getSessionId(ssl, session, this.read_session_id)
+    }
+
+    read_session_id = (ssl: NativePointer, session: NativePointer): string => {
+        var p = this.SSL_SESSION_get_id(session, this.session_id_length) as NativePointer
+        return readSessionId(p, this.session_id_length.readU32())
     }
 
 
@@ -1,6 +1,10 @@
 import { readAddresses, getPortsAndAddresses, toHexString, getBaseAddress } from "../shared/shared_functions.js";
 import { log } from "../util/log.js";
+import { attach_hook } from "../util/hook_registry.js";
 import { offsets, enable_default_fd } from "../ssl_log.js";
+import { datalog } from "../util/datalog.js";
+import { install_close_hooks } from "../util/connections.js";
+import { getSessionId, readSessionId } from "../shared/session_ids.js";
 
 export class WolfSSL {
 
@@ -64,6 +68,10 @@ export class WolfSSL {
         log("Error: TLS key extraction not implemented yet.")
     }
 
+    install_close_hook(){
+        install_close_hooks(this.module_name, ["wolfSSL_free", "wolfSSL_clear"])
+    }
+
     /**
        * Get the session_id of SSL object and return it as a hex string.
        * @param {!NativePointer} ssl A pointer to an SSL object.
@@ -82,28 +90,23 @@ export class WolfSSL {
             log("Session is null")
             return 0
         }
-        var p = session.add(8)
-        var len = 32 // This comes from internals.h. It is untested!
-        var session_id = ""
-        for (var i = 0; i < len; i++) {
-            // Read a byte, convert it to a hex string (0xAB ==> "AB"), and append
-            // it to session_id.
-
-            session_id +=
-                ("0" + p.add(i).readU8().toString(16).toUpperCase()).substr(-2)
-        }
-        return session_id
+        return getSessionId(ssl, session, WolfSSL.readSessionIdOfSession)
+    }
+
+    static readSessionIdOfSession(ssl: NativePointer, session: NativePointer): string {
+        // the offset and length come from internals.h. It is untested!
+        return readSessionId(session.add(8), 32)
     }
 
 
     install_plaintext_read_hook(){
         var current_module_name = this.module_name;
         var lib_addesses = this.addresses;
-        Interceptor.attach(this.addresses[this.moduleName]["wolfSSL_read"],
+        attach_hook("wolfSSL_read", this.addresses[this.moduleName]["wolfSSL_read"],
         {
             onEnter: function (args: any) {
                 
-                var message = getPortsAndAddresses(WolfSSL.wolfSSL_get_fd(args[0]) as number, true, lib_addesses[current_module_name], enable_default_fd)
+                var message = getPortsAndAddresses(WolfSSL.wolfSSL_get_fd(args[0]) as number, true, lib_addesses[current_module_name], enable_default_fd, args[0])
                 
                 message["function"] = "wolfSSL_read"
                 message["ssl_session_id"] = WolfSSL.getSslSessionId(args[0])
@@ -117,7 +120,7 @@ export class WolfSSL {
                     return
                 }
                 this.message["contentType"] = "datalog"
-                send(this.message, this.buf.readByteArray(retval))
+                datalog(this.message, this.buf.readByteArray(retval))
             }
         })
     }
@@ -126,14 +129,14 @@ export class WolfSSL {
     install_plaintext_write_hook(){
         var current_module_name = this.module_name;
         var lib_addesses = this.addresses;
-        Interceptor.attach(this.addresses[this.moduleName]["wolfSSL_write"],
+        attach_hook("wolfSSL_write", this.addresses[this.moduleName]["wolfSSL_write"],
         {
             onEnter: function (args: any) {
-                var message = getPortsAndAddresses(WolfSSL.wolfSSL_get_fd(args[0]) as number, false, lib_addesses[current_module_name], enable_default_fd)
+                var message = getPortsAndAddresses(WolfSSL.wolfSSL_get_fd(args[0]) as number, false, lib_addesses[current_module_name], enable_default_fd, args[0])
                 message["ssl_session_id"] = WolfSSL.getSslSessionId(args[0])
                 message["function"] = "wolfSSL_write"
                 message["contentType"] = "datalog"
-                send(message, args[1].readByteArray(parseInt(args[2])))
+                datalog(message, args[1].readByteArray(parseInt(args[2])))
             },
             onLeave: function (retval: any) {
             }
@@ -6,6 +6,8 @@ import { load_windows_hooking_agent } from "./windows/windows_agent.js";
 import { isWindows, isLinux, isAndroid, isiOS, isMacOS } from "./util/process_infos.js";
 import { anti_root_execute } from "./util/anti_root.js";
 import { log } from "./util/log.js";
+import { flush_datalog } from "./util/datalog.js";
+import { get_hook_stats } from "./util/hook_registry.js";
 
 // global address which stores the addresses of the hooked modules which aren't loaded via the dynamic loader
 (global as any).init_addresses = {};
@@ -92,30 +94,29 @@ export let experimental: boolean = false;
 export let anti_root: boolean = false;
 //@ts-ignore
 export let enable_default_fd: boolean = false;
+//@ts-ignore
+export let batch_size: number = 0;
+//@ts-ignore
+export let batch_timeout: number = 0;
+//@ts-ignore
+export let binary_records: boolean = false;
 
 
 /*
-This way we are providing boolean values from the commandline directly to our frida script
+This way we are providing the options from the commandline directly to our frida script.
+All of them are requested at once, so the hooks are installed after a single round trip.
 */
 
-send("defaultFD")
-const enable_default_fd_state = recv('defaultFD', value => {
-    //console.log("value.payload: "+value.payload)
-    enable_default_fd = value.payload;
-});
-enable_default_fd_state.wait();
-
-send("experimental")
-const exp_recv_state = recv('experimental', value => {
-    experimental = value.payload;
-});
-exp_recv_state.wait();
-
-send("anti")
-const antiroot_recv_state = recv('antiroot', value => {
-    anti_root = value.payload;
+send("config")
+const config_recv_state = recv('config', value => {
+    enable_default_fd = value.payload.defaultFD;
+    experimental = value.payload.experimental;
+    batch_size = value.payload.transport.batch_size;
+    batch_timeout = value.payload.transport.batch_timeout;
+    binary_records = value.payload.transport.binary_records;
+    anti_root = value.payload.antiroot;
 });
-antiroot_recv_state.wait();/* */
+config_recv_state.wait();
 
 
 /*
@@ -133,6 +134,20 @@ export function getOffsets(){
 }
 
 
+rpc.exports = {
+    // ensure that no batched records get lost when friTap is detaching, the hook statistics are sent as well
+    // as friTap can't read them anymore once the process exited
+    dispose() {
+        flush_datalog();
+        send({"contentType": "hook_stats", "stats": get_hook_stats()});
+    },
+    // the hooks of the TLS libraries with their number of calls (see util/hook_registry.ts)
+    hookStats() {
+        return get_hook_stats();
+    }
+};
+
+
 
 function load_os_specific_agent() {
     if(isWindows()){
@@ -163,6 +178,9 @@ function load_os_specific_agent() {
 
 load_os_specific_agent()
 
+// friTap resumes spawned processes as soon as their hooks are installed
+send({"contentType": "hooks_installed"})
+
 
 
 
@@ -0,0 +1,179 @@
+import { toHexString } from "../shared/shared_functions.js";
+import { flush_datalog, forget_session_handle } from "./datalog.js";
+import { forgetSessionId } from "../shared/session_ids.js";
+import { attach_hook } from "./hook_registry.js";
+
+/*
+The connections of the hooked TLS libraries are tracked from their first decrypted record until
+the library frees them (SSL_shutdown/SSL_free, gnutls_deinit, PR_Close) or the application closes
+their socket. friTap is then informed with a "close" message which carries the endpoints of the
+first record, so that it is able to end the flow in the plaintext capture and free its state:
+
+    {"contentType": "close", "closed_by": "SSL_free", "function": "SSL_read", "ss_family": ...,
+     "src_addr": ..., "src_port": ..., "dst_addr": ..., "dst_port": ..., "ssl_session_id": ...}
+
+Pending (batched) records are send before the close message, so the order is kept. With binary records the
+close message also carries the "session_handle" of its session id, which is dropped (see datalog.ts).
+Only libraries with a close hook track their connections, otherwise the maps would grow forever.
+
+The endpoints of a socket are only looked up (getsockname/getpeername) for the first record of a connection
+and cached for its file descriptor together with the handle of the TLS library. The cache entry is dropped
+as soon as the socket is closed or the library frees the handle. The close hooks of the libraries also drop
+the cached session id of the handle (see shared/session_ids.ts), whether its connection is tracked or not.
+*/
+
+var connections = new Map<string, { [key: string]: any }>()
+var connection_fds = new Map<number, string>()
+var fds_of_connections = new Map<string, number>()
+var close_hook_installed = false
+
+export interface Endpoints {
+    ss_family: string
+    local_addr: any
+    local_port: number
+    peer_addr: any
+    peer_port: number
+}
+
+var endpoints = new Map<number, { handle: string, endpoints: Endpoints }>()
+
+
+function get_address(addr: any): any {
+    // binary records use raw IPv6 addresses, the close message is always send as JSON
+    return addr instanceof ArrayBuffer ? toHexString(addr) : addr
+}
+
+
+/**
+ * Remembers the connection of a decrypted record until it is closed.
+ * @param handle The connection object of the TLS library (SSL*, gnutls_session_t, PRFileDesc*)
+ * @param fd The socket of the connection or -1 if it is unknown
+ * @param message The datalog message of the record
+ */
+export function track_connection(handle: NativePointer, fd: number, message: { [key: string]: any }) {
+    var key = handle.toString()
+    if (connections.has(key)) {
+        return
+    }
+    var close_message: { [key: string]: any } = {}
+    close_message["contentType"] = "close"
+    close_message["function"] = message["function"]
+    close_message["ss_family"] = message["ss_family"]
+    close_message["src_addr"] = get_address(message["src_addr"])
+    close_message["src_port"] = message["src_port"]
+    close_message["dst_addr"] = get_address(message["dst_addr"])
+    close_message["dst_port"] = message["dst_port"]
+    close_message["ssl_session_id"] = message["ssl_session_id"]
+    connections.set(key, close_message)
+    if (fd >= 0) {
+        connection_fds.set(fd, key)
+        fds_of_connections.set(key, fd)
+        install_socket_close_hook()
+    }
+}
+
+
+/**
+ * Reports the connection of the given handle as closed, unknown handles are ignored.
+ * @param handle The connection object of the TLS library
+ * @param closed_by Name of the function which closed the connection
+ */
+export function close_connection(handle: NativePointer | string, closed_by: string) {
+    var key = handle.toString()
+    forgetSessionId(key)
+    var message = connections.get(key)
+    if (message === undefined) {
+        return
+    }
+    connections.delete(key)
+    var fd = fds_of_connections.get(key)
+    if (fd !== undefined) {
+        fds_of_connections.delete(key)
+        connection_fds.delete(fd)
+        forget_endpoints(fd, key)
+    }
+    message["closed_by"] = closed_by
+    flush_datalog()
+    // the records of the connection are send, the handle of its session id (binary records) isn't needed anymore
+    var session_handle = forget_session_handle(message["ssl_session_id"])
+    if (session_handle !== undefined) {
+        message["session_handle"] = session_handle
+    }
+    send(message)
+}
+
+
+/**
+ * Hooks the given close functions of a TLS library, their first argument has to be the handle of the connection.
+ */
+export function install_close_hooks(module_name: string, function_names: Array<string>) {
+    for (const function_name of function_names) {
+        const address = Module.findExportByName(module_name, function_name)
+        if (address === null) {
+            continue
+        }
+        attach_hook(function_name, address, {
+            onEnter: function (args: any) {
+                close_connection(args[0], function_name)
+            }
+        })
+    }
+}
+
+
+/**
+ * Returns the cached endpoints of the socket of a connection or undefined if they weren't looked up yet.
+ * @param fd The socket of the connection
+ * @param handle The connection object of the TLS library
+ */
+export function get_endpoints(fd: number, handle: NativePointer): Endpoints | undefined {
+    var entry = endpoints.get(fd)
+    if (entry === undefined || entry.handle !== handle.toString()) {
+        return undefined
+    }
+    return entry.endpoints
+}
+
+
+/**
+ * Caches the endpoints of the socket of a connection until the socket is closed or the handle is freed.
+ */
+export function cache_endpoints(fd: number, handle: NativePointer, socket_endpoints: Endpoints) {
+    endpoints.set(fd, { handle: handle.toString(), endpoints: socket_endpoints })
+    install_socket_close_hook()
+}
+
+
+function forget_endpoints(fd: number, handle?: string) {
+    var entry = endpoints.get(fd)
+    if (entry !== undefined && (handle === undefined || entry.handle === handle)) {
+        endpoints.delete(fd)
+    }
+}
+
+
+function install_socket_close_hook() {
+    if (close_hook_installed) {
+        return
+    }
+    close_hook_installed = true
+    for (const function_name of ["close", "closesocket"]) {
+        const address = Module.findExportByName(null, function_name)
+        if (address === null) {
+            continue
+        }
+        attach_hook(function_name, address, {
+            onEnter: function (args: any) {
+                if (connection_fds.size == 0 && endpoints.size == 0) {
+                    return
+                }
+                var fd = args[0].toInt32()
+                forget_endpoints(fd)
+                var key = connection_fds.get(fd)
+                if (key !== undefined) {
+                    close_connection(key, function_name)
+                }
+            }
+        })
+    }
+}
@@ -0,0 +1,197 @@
+import { batch_size, batch_timeout, binary_records } from "../ssl_log.js";
+
+/*
+Decrypted records are either send directly to friTap or, when batching is enabled, collected
+and send as one "datalog_batch" message. The payloads of a batch are concatenated into a single
+buffer and every record carries its "length" so that friTap is able to split them again.
+
+When binary records are enabled a record is encoded as a fixed header followed by its payload
+(see RECORD_HEADER_SIZE) and send as "datalog_binary". These records are self-delimiting, so a
+batch of them is just their concatenation. Records which can't be encoded (unknown function or
+addresses in an unexpected form) fall back to the JSON based format.
+
+Binary record header (network byte order), friTap decodes it in ssl_logger.py:
+    u8  function code (index into FUNCTION_CODES)
+    u8  address family (4 or 6)
+    u16 src_port
+    u16 dst_port
+    16  src_addr (IPv4 addresses use the first 4 bytes)
+    16  dst_addr
+    u32 session handle (announced once via a "session" message)
+    u32 payload length
+
+The handles are numbered per agent, friTap maps them per process. The handle of a session id is dropped
+when a connection using it is closed, the close message carries it so that friTap drops it as well.
+Further records of that session id get a new handle.
+*/
+
+// must be in sync with DATALOG_FUNCTIONS in ssl_logger.py
+const FUNCTION_CODES: { [key: string]: number } = {
+    "SSL_read": 0,
+    "SSL_write": 1,
+    "wolfSSL_read": 2,
+    "wolfSSL_write": 3,
+    "NSS_read": 4,
+    "NSS_write": 5,
+    "readApplicationData": 6,
+    "writeApplicationData": 7,
+    "mbedtls_ssl_read": 8,
+    "mbedtls_ssl_write": 9,
+    "matrixSslReceivedData": 10,
+    "matrixSslEncodeWritebuf": 11,
+    "DecryptMessage": 12,
+    "EncryptMessage": 13,
+    "Full_read": 14,
+    "Full_write": 15
+}
+const RECORD_HEADER_SIZE = 46
+const BINARY_MESSAGE = { "contentType": "datalog_binary" }
+
+var session_handles = new Map<any, number>()
+var next_session_handle = 1
+
+var pending_records: Array<{ [key: string]: any }> = []
+var pending_payloads: Array<Uint8Array> = []
+var pending_bytes = 0
+var pending_binary: Array<Uint8Array> = []
+var pending_binary_bytes = 0
+var flush_timer: any = null
+
+
+function get_session_handle(ssl_session_id: any): number {
+    var handle = session_handles.get(ssl_session_id)
+    if (handle === undefined) {
+        handle = next_session_handle++
+        session_handles.set(ssl_session_id, handle)
+
+        var message: { [key: string]: any } = {}
+        message["contentType"] = "session"
+        message["handle"] = handle
+        message["ssl_session_id"] = ssl_session_id
+        send(message)
+    }
+    return handle
+}
+
+
+/**
+ * Drops the handle of a session id, returns it or undefined if the session id has none.
+ */
+export function forget_session_handle(ssl_session_id: any): number | undefined {
+    var handle = session_handles.get(ssl_session_id)
+    if (handle !== undefined) {
+        session_handles.delete(ssl_session_id)
+    }
+    return handle
+}
+
+
+function encode_record(message: { [key: string]: any }, payload: Uint8Array): Uint8Array | null {
+    var function_code = FUNCTION_CODES[message["function"]]
+    if (function_code === undefined) {
+        return null
+    }
+
+    var record = new Uint8Array(RECORD_HEADER_SIZE + payload.byteLength)
+    var header = new DataView(record.buffer)
+    if (message["ss_family"] == "AF_INET" && typeof message["src_addr"] === "number" && typeof message["dst_addr"] === "number") {
+        header.setUint8(1, 4)
+        header.setUint32(6, message["src_addr"])
+        header.setUint32(22, message["dst_addr"])
+    } else if (message["ss_family"] == "AF_INET6" && message["src_addr"] instanceof ArrayBuffer && message["dst_addr"] instanceof ArrayBuffer) {
+        header.setUint8(1, 6)
+        record.set(new Uint8Array(message["src_addr"]), 6)
+        record.set(new Uint8Array(message["dst_addr"]), 22)
+    } else {
+        return null
+    }
+    header.setUint8(0, function_code)
+    header.setUint16(2, message["src_port"])
+    header.setUint16(4, message["dst_port"])
+    header.setUint32(38, get_session_handle(message["ssl_session_id"]))
+    header.setUint32(42, payload.byteLength)
+    record.set(payload, RECORD_HEADER_SIZE)
+    return record
+}
+
+
+function schedule_flush() {
+    if (pending_bytes + pending_binary_bytes >= batch_size) {
+        flush_datalog()
+    } else if (flush_timer === null) {
+        flush_timer = setTimeout(flush_datalog, batch_timeout)
+    }
+}
+
+
+export function datalog(message: { [key: string]: any }, data: ArrayBuffer | Array<number> | null) {
+    if (batch_size <= 0 && !binary_records) {
+        send(message, data)
+        return
+    }
+
+    var payload = data === null ? new Uint8Array(0) : new Uint8Array(data)
+
+    if (binary_records) {
+        var record = encode_record(message, payload)
+        if (record !== null) {
+            if (batch_size <= 0) {
+                send(BINARY_MESSAGE, record.buffer as ArrayBuffer)
+            } else {
+                pending_binary.push(record)
+                pending_binary_bytes += record.byteLength
+                schedule_flush()
+            }
+            return
+        }
+        if (batch_size <= 0) {
+            send(message, data)
+            return
+        }
+    }
+
+    message["length"] = payload.byteLength
+    pending_records.push(message)
+    pending_payloads.push(payload)
+    pending_bytes += payload.byteLength
+    schedule_flush()
+}
+
+
+function concat(chunks: Array<Uint8Array>, length: number): ArrayBuffer {
+    var buffer = new Uint8Array(length)
+    var offset = 0
+    for (var chunk of chunks) {
+        buffer.set(chunk, offset)
+        offset += chunk.byteLength
+    }
+    return buffer.buffer as ArrayBuffer
+}
+
+
+export function flush_datalog() {
+    if (flush_timer !== null) {
+        clearTimeout(flush_timer)
+        flush_timer = null
+    }
+
+    if (pending_binary.length > 0) {
+        var binary_batch = concat(pending_binary, pending_binary_bytes)
+        pending_binary = []
+        pending_binary_bytes = 0
+        send(BINARY_MESSAGE, binary_batch)
+    }
+
+    if (pending_records.length > 0) {
+        var message: { [key: string]: any } = {}
+        message["contentType"] = "datalog_batch"
+        message["records"] = pending_records
+        var batch = concat(pending_payloads, pending_bytes)
+
+        pending_records = []
+        pending_payloads = []
+        pending_bytes = 0
+
+        send(message, batch)
+    }
+}
@@ -0,0 +1,176 @@
+import { devlog } from "./log.js";
+import { findModule, findModuleByAddress, findModuleByHandle, refreshModules, addModuleRemovedListener } from "../shared/module_registry.js";
+
+/*
+The hooks of the TLS libraries are installed with attach_hook, which keeps them in a registry keyed by the
+base address of their module and the address of the hooked function. Installing the same hook again returns
+the existing listener, so a library which is seen by ssl_library_loader and the dynamic loader hook or which is
+loaded several times is only hooked once. In addition the hooking functions of the platform agents (see
+invokeHookingFunction) run only once per module.
+
+Every hook counts its calls, friTap reads the counters with the hookStats RPC:
+
+    [{"module": "libssl.so.3", "function": "SSL_read", "address": "0x7f...", "hits": 42}, ...]
+
+The hooks of a module are dropped when it is unloaded. They stay attached while dlclose runs, as most calls only
+lower the reference count of the library and its hooks must keep working on the other threads meanwhile. Only if
+the module isn't mapped anymore when dlclose returns (or the module observer reports it as removed) its hooks are
+forgotten, the listeners aren't detached as their code is gone.
+*/
+
+interface Hook {
+    module: string
+    base: string
+    function_name: string
+    address: NativePointer
+    listener: InvocationListener
+    hits: number
+}
+
+var hooks = new Map<string, Hook>()
+// bases of the modules which were handed to a hooking function, see invokeHookingFunction
+var hooked_modules = new Map<string, Set<any>>()
+
+
+function count_hits(hook: Hook, callbacks: { [key: string]: any }): { [key: string]: any } {
+    var counted: { [key: string]: any } = {}
+    var onEnter = callbacks.onEnter
+    var onLeave = callbacks.onLeave
+    if (onEnter !== undefined) {
+        counted.onEnter = function (this: InvocationContext, args: InvocationArguments) {
+            hook.hits++
+            onEnter.call(this, args)
+        }
+        if (onLeave !== undefined) {
+            counted.onLeave = onLeave
+        }
+    } else if (onLeave !== undefined) {
+        counted.onLeave = function (this: InvocationContext, retval: InvocationReturnValue) {
+            hook.hits++
+            onLeave.call(this, retval)
+        }
+    }
+    return counted
+}
+
+
+/**
+ * Hooks a function of a TLS library unless it is already hooked.
+ * @param {string} function_name Name of the function for the hook statistics
+ * @param {NativePointer} address The address of the function
+ * @param callbacks The onEnter/onLeave callbacks as for Interceptor.attach
+ * @return {InvocationListener | null} The listener of the hook
+ */
+export function attach_hook(function_name: string, address: NativePointer, callbacks: { [key: string]: any }): InvocationListener | null {
+    var module = findModuleByAddress(address)
+    var base = module === null ? "0x0" : module.base.toString()
+    var key = base + "!" + address
+    var hook = hooks.get(key)
+    if (hook !== undefined) {
+        devlog(`${function_name} at ${address} is already hooked`)
+        return hook.listener
+    }
+
+    hook = {
+        module: module === null ? "" : module.name,
+        base: base,
+        function_name: function_name,
+        address: address,
+        hits: 0
+    } as Hook
+    hook.listener = Interceptor.attach(address, count_hits(hook, callbacks) as InvocationListenerCallbacks)
+    hooks.set(key, hook)
+    return hook.listener
+}
+
+
+/**
+ * Returns the hooks with their number of calls.
+ */
+export function get_hook_stats(): Array<{ [key: string]: any }> {
+    var stats: Array<{ [key: string]: any }> = []
+    for (const hook of hooks.values()) {
+        stats.push({ "module": hook.module, "function": hook.function_name, "address": hook.address.toString(), "hits": hook.hits })
+    }
+    return stats
+}
+
+
+/**
+ * Marks the given module as hooked by owner (a hooking function). Returns false if it was already hooked by it.
+ */
+export function claim_module(module_name: string, owner: any): boolean {
+    var module = findModule(module_name)
+    if (module === null) {
+        return true
+    }
+    var key = module.base.toString()
+    var owners = hooked_modules.get(key)
+    if (owners === undefined) {
+        owners = new Set<any>()
+        hooked_modules.set(key, owners)
+    }
+    if (owners.has(owner)) {
+        return false
+    }
+    owners.add(owner)
+    return true
+}
+
+
+/**
+ * Releases the claim of a module, e.g. because its hooking function failed.
+ */
+export function release_module(module_name: string, owner: any) {
+    var module = findModule(module_name)
+    if (module !== null) {
+        hooked_modules.get(module.base.toString())?.delete(owner)
+    }
+}
+
+
+/**
+ * Called before dlclose, returns the module of the handle or null if none of its functions are hooked.
+ * The hooks stay attached, dlclose usually only lowers the reference count of the library.
+ */
+export function module_closing(handle: NativePointer): Module | null {
+    var module = findModuleByHandle(handle)
+    if (module === null) {
+        return null
+    }
+    var base = module.base.toString()
+    for (const hook of hooks.values()) {
+        if (hook.base == base) {
+            return module
+        }
+    }
+    return null
+}
+
+
+/**
+ * Called after dlclose with the result of module_closing. The hooks are dropped if the module was unmapped.
+ */
+export function module_closed(module: Module) {
+    var loaded = Process.findModuleByAddress(module.base)
+    if (loaded !== null && loaded.path == module.path) {
+        return
+    }
+    devlog(`${module.name} was unloaded, dropping its hooks`)
+    refreshModules()
+    forget_module_hooks(module)
+}
+
+
+function forget_module_hooks(module: Module) {
+    var base = module.base.toString()
+    for (const [key, hook] of hooks) {
+        // the code of an unloaded module can't be restored anymore, its listeners are only forgotten
+        if (hook.base == base) {
+            hooks.delete(key)
+        }
+    }
+    hooked_modules.delete(base)
+}
+
+addModuleRemovedListener(forget_module_hooks)
@@ -12,6 +12,7 @@ export class GnuTLS_Windows extends GnuTLS {
     execute_hooks(){
         this.install_plaintext_read_hook();
         this.install_plaintext_write_hook();
+        this.install_close_hook();
 
         //this.install_tls_keys_callback_hook();
     }
@@ -21,6 +21,7 @@ export class NSS_Windows extends NSS {
     execute_hooks(){
         this.install_plaintext_read_hook();
         this.install_plaintext_write_hook();
+        this.install_close_hook();
         // this.install_tls_keys_callback_hook(); needs to be implemented
     }
 
@@ -25,6 +25,7 @@ export class OpenSSL_BoringSSL_Windows extends OpenSSL_BoringSSL {
     execute_hooks(){
         this.install_plaintext_read_hook();
         this.install_plaintext_write_hook();
+        this.install_close_hook();
     }
 
 }
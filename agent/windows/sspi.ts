@@ -1,7 +1,9 @@
 import { readAddresses, getBaseAddress } from "../shared/shared_functions.js";
 import { socket_library } from "./windows_agent.js";
 import { devlog, log } from "../util/log.js";
+import { attach_hook } from "../util/hook_registry.js";
 import { experimental, offsets } from "../ssl_log.js";
+import { datalog } from "../util/datalog.js";
 
 /*
 ToDo:
@@ -76,7 +78,7 @@ export class SSPI_Windows {
     
 
     install_plaintext_read_hook(){
-        Interceptor.attach(this.addresses[this.module_name]["DecryptMessage"], {
+        attach_hook("DecryptMessage", this.addresses[this.module_name]["DecryptMessage"], {
             onEnter: function(args){
                 this.pMessage = args[1];
             },
@@ -110,7 +112,7 @@ export class SSPI_Windows {
                         message["function"] = "DecryptMessage"
                         message["contentType"] = "datalog"
                         message["ssl_session_id"] = 10
-                        send(message, bytes)
+                        datalog(message, bytes)
                     }
                 }
             }
@@ -120,7 +122,7 @@ export class SSPI_Windows {
     }
 
     install_plaintext_write_hook(){
-        Interceptor.attach(this.addresses[this.module_name]["EncryptMessage"], {
+        attach_hook("EncryptMessage", this.addresses[this.module_name]["EncryptMessage"], {
         
             onEnter: function(args){
                         this.pMessage = args[2]; //PSecBufferDesc pMessage (https://docs.microsoft.com/en-us/windows/win32/api/sspi/ns-sspi-secbufferdesc)
@@ -153,7 +155,7 @@ export class SSPI_Windows {
                                 message["function"] = "EncryptMessage"
                                 message["contentType"] = "datalog"
                                 message["ssl_session_id"] = 10
-                                send(message, bytes)
+                                datalog(message, bytes)
                             }
                         }
             }
@@ -215,7 +217,7 @@ export class SSPI_Windows {
 
         
         if(this.addresses[this.module_name]["SslHashHandshake"] != null)
-            Interceptor.attach(this.addresses[this.module_name]["SslHashHandshake"], {
+            attach_hook("SslHashHandshake", this.addresses[this.module_name]["SslHashHandshake"], {
                 onEnter: function (args: any) {
                     // https://docs.microsoft.com/en-us/windows/win32/seccng/sslhashhandshake
                     var buf = ptr(args[2]);
@@ -235,7 +237,7 @@ export class SSPI_Windows {
             });
 
         if(this.addresses[this.module_name]["SslGenerateMasterKey"] != null)
-            Interceptor.attach(this.addresses[this.module_name]["SslGenerateMasterKey"], {
+            attach_hook("SslGenerateMasterKey", this.addresses[this.module_name]["SslGenerateMasterKey"], {
                 onEnter: function (args: any) {
                     // https://docs.microsoft.com/en-us/windows/win32/seccng/sslgeneratemasterkey
                     this.phMasterKey = ptr(args[3]);
@@ -251,7 +253,7 @@ export class SSPI_Windows {
             });
 
         if(this.addresses[this.module_name]["SslImportMasterKey"] != null)
-            Interceptor.attach(this.addresses[this.module_name]["SslImportMasterKey"], {
+            attach_hook("SslImportMasterKey", this.addresses[this.module_name]["SslImportMasterKey"], {
                 onEnter: function (args: any) {
                     // https://docs.microsoft.com/en-us/windows/win32/seccng/sslimportmasterkey
                     this.phMasterKey = ptr(args[2]);
@@ -267,7 +269,7 @@ export class SSPI_Windows {
             });
 
         if(this.addresses[this.module_name]["SslGenerateSessionKeys"] != null)
-            Interceptor.attach(this.addresses[this.module_name]["SslGenerateSessionKeys"], {
+            attach_hook("SslGenerateSessionKeys", this.addresses[this.module_name]["SslGenerateSessionKeys"], {
                 onEnter: function (args: any) {
                     // https://docs.microsoft.com/en-us/windows/win32/seccng/sslgeneratesessionkeys
                     this.hMasterKey = ptr(args[1]);
@@ -295,7 +297,7 @@ export class SSPI_Windows {
         }
 
         if(this.addresses[this.module_name]["SslExpandTrafficKeys"] != null)
-            Interceptor.attach(this.addresses[this.module_name]["SslExpandTrafficKeys"], {
+            attach_hook("SslExpandTrafficKeys", this.addresses[this.module_name]["SslExpandTrafficKeys"], {
                 onEnter: function (args: any) {
                     this.retkey1 = ptr(args[3]);
                     this.retkey2 = ptr(args[4]);
@@ -317,7 +319,7 @@ export class SSPI_Windows {
             });
 
         if(this.addresses[this.module_name]["SslExpandExporterMasterKey"] != null)
-            Interceptor.attach(this.addresses[this.module_name]["SslExpandExporterMasterKey"], {
+            attach_hook("SslExpandExporterMasterKey", this.addresses[this.module_name]["SslExpandExporterMasterKey"], {
                 onEnter: function (args: any) {
                     this.retkey = ptr(args[3]);
                     this.client_random = client_randoms[this.threadId] || "???";
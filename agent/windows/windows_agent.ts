@@ -1,6 +1,7 @@
 import { module_library_mapping, ModuleHookingType } from "../shared/shared_structures.js";
 import { log, devlog } from "../util/log.js";
 import { getModuleNames, ssl_library_loader, invokeHookingFunction } from "../shared/shared_functions.js";
+import { moduleLoadedAt } from "../shared/module_registry.js";
 import { sspi_execute } from "./sspi.js";
 import { boring_execute } from "./openssl_boringssl_windows.js";
 import { gnutls_execute } from "./gnutls_windows.js";
@@ -11,7 +12,6 @@ import { matrixSSL_execute } from "./matrixssl_windows.js";
 
 
 var plattform_name = "windows";
-var moduleNames: Array<string> = getModuleNames()
 
 export const socket_library = "WS2_32.dll";
 
@@ -27,9 +27,9 @@ function hook_Windows_Dynamic_Loader(module_library_mapping: { [key: string]: Ar
         Interceptor.attach(loadLibraryExW[0].address, {
             onLeave(retval: NativePointer) {
 
-                let map = new ModuleMap();
-                let moduleName = map.findName(retval)
-                if (moduleName === null) return
+                let module = moduleLoadedAt(retval)
+                if (module === null) return
+                let moduleName = module.name
 
                 for (let map of module_library_mapping[plattform_name]) {
                     let regex = new RegExp(map[0])
@@ -51,7 +51,7 @@ function hook_Windows_Dynamic_Loader(module_library_mapping: { [key: string]: Ar
 }
 
 function hook_Windows_SSL_Libs(module_library_mapping: { [key: string]: Array<[any, ModuleHookingType]> }, is_base_hook: boolean) {
-    ssl_library_loader(plattform_name, module_library_mapping,moduleNames,"Windows", is_base_hook)
+    ssl_library_loader(plattform_name, module_library_mapping,getModuleNames(),"Windows", is_base_hook)
 }
 
 export function load_windows_hooking_agent() {
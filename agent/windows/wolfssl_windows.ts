@@ -23,6 +23,7 @@ export class WolfSSL_Windows extends WolfSSL {
     execute_hooks(){
         this.install_plaintext_read_hook();
         this.install_plaintext_write_hook();
+        this.install_close_hook();
         //this.install_tls_keys_callback_hook(); currently not implemented
     }
 
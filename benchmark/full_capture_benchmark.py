@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Replays a pcap through the write path of the full local capture and reports the
+# sustained packets/s of:
+#   legacy: wrpcap(..., append=True) per packet (the previous implementation)
+#   scapy:  scapy packets written into the persistent CaptureFileWriter
+#   raw:    raw frames written into the persistent CaptureFileWriter (--raw_frames)
+# Without --pcap a capture with synthetic TCP packets is generated:
+#
+#   python3 benchmark/full_capture_benchmark.py --packets 200000
+#   python3 benchmark/full_capture_benchmark.py --pcap large.pcap
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.dirname(here))
+
+logging.getLogger("scapy.runtime").setLevel(logging.ERROR)
+from scapy.all import Ether, IP, TCP, Raw, PcapReader, RawPcapReader, PcapWriter as ScapyPcapWriter, wrpcap, conf
+
+from friTap.pcap_writer import PcapWriter, CaptureFileWriter, LINKTYPE_ETHERNET
+
+
+def create_pcap(file_name, packets, size):
+    writer = ScapyPcapWriter(file_name)
+    payload = bytes(size)
+    for i in range(packets):
+        writer.write(Ether() / IP(src="10.0.0.1", dst="10.0.0.2") / TCP(sport=40000 + i % 100, dport=443, seq=i) / Raw(payload))
+    writer.close()
+
+
+def replay_legacy(pcap, out, limit):
+    packets = 0
+    for packet in PcapReader(pcap):
+        wrpcap(out, packet, append=True)
+        packets += 1
+        if packets >= limit:
+            break
+    return packets
+
+
+def replay_scapy(pcap, out, limit):
+    capture_file = CaptureFileWriter(PcapWriter(out))
+    packets = 0
+    for packet in PcapReader(pcap):
+        capture_file.write_frame(bytes(packet), float(packet.time), conf.l2types.layer2num.get(type(packet), LINKTYPE_ETHERNET))
+        packets += 1
+        if packets >= limit:
+            break
+    capture_file.close()
+    return packets
+
+
+def replay_raw(pcap, out, limit):
+    capture_file = CaptureFileWriter(PcapWriter(out))
+    packets = 0
+    for frame, metadata in RawPcapReader(pcap):
+        capture_file.write_frame(frame, metadata.sec + metadata.usec / 1000000)
+        packets += 1
+        if packets >= limit:
+            break
+    capture_file.close()
+    return packets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="friTap full capture write path benchmark")
+    parser.add_argument("--pcap", help="pcap to replay (default: generate synthetic packets)")
+    parser.add_argument("--packets", type=int, default=100000, help="number of synthetic packets")
+    parser.add_argument("--size", type=int, default=512, help="payload size of the synthetic packets")
+    parser.add_argument("--legacy_packets", type=int, default=5000, help="replay only this many packets with the slow legacy path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pcap = args.pcap
+        if pcap is None:
+            pcap = os.path.join(tmpdir, "replay.pcap")
+            create_pcap(pcap, args.packets, args.size)
+
+        for name, replay, limit in (("legacy", replay_legacy, args.legacy_packets),
+                                    ("scapy", replay_scapy, sys.maxsize),
+                                    ("raw", replay_raw, sys.maxsize)):
+            out = os.path.join(tmpdir, name + ".pcap")
+            start = time.perf_counter()
+            packets = replay(pcap, out, limit)
+            duration = time.perf_counter() - start
+            print(f"{name:8} {packets:8} packets {packets / duration:12.0f} packets/s")
+
+
+if __name__ == "__main__":
+    main()
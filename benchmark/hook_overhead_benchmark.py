@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Measures the overhead of the SSL_write hook of the friTap agent per call. The target is benchmark/tls_client.py
+# writing many small records to a local "openssl s_server", once without friTap and once for every given agent.
+# friTap attaches after the client loaded libssl and the client starts writing as soon as the hooks are installed.
+# To compare two versions of the agent, e.g. before and after a change, pass both builds. Run it from the
+# repository root with the rights to instrument local processes:
+#
+#   git show HEAD~1:friTap/_ssl_log.js > /tmp/_ssl_log_before.js
+#   sudo -E python3 benchmark/hook_overhead_benchmark.py --agent /tmp/_ssl_log_before.js --agent friTap/_ssl_log.js
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.dirname(here))
+
+from friTap.ssl_logger import SSL_Logger
+from transport_benchmark import create_certificate
+
+
+class BenchmarkLogger(SSL_Logger):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.records = 0
+
+    def handle_payload(self, p, data, pid=None):
+        if isinstance(p, dict) and p.get("contentType") == "datalog":
+            self.records += 1
+        super().handle_payload(p, data, pid)
+
+    def on_detach(self, reason):
+        pass
+
+
+def start_client(args, wait_for_stdin):
+    command = [sys.executable, os.path.join(here, "tls_client.py"), "--port", str(args.port), "--count", str(args.count),
+               "--size", str(args.size), "--report"]
+    command += ["--wait_for_stdin"] if wait_for_stdin else ["--delay", "0"]
+    return subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+
+
+def get_write_seconds(client):
+    output, _ = client.communicate(timeout=600)
+    for line in output.splitlines():
+        if line.startswith("write_seconds="):
+            return float(line.split("=", 1)[1])
+    raise SystemExit("[-] the client didn't report its write time")
+
+
+def run_hooked(args, agent):
+    client = start_client(args, True)
+    # the client loads libssl before it waits for stdin
+    time.sleep(1.0)
+    logger = BenchmarkLogger(str(client.pid), exit_on_cleanup=False)
+    logger.frida_agent_script = os.path.abspath(agent)
+    process = logger.start_fritap_session()
+    logger.wait_for_hooks(logger.sessions[client.pid])
+    client.stdin.write("\n")
+    client.stdin.flush()
+    write_seconds = get_write_seconds(client)
+    logger.stop_writer_queue()
+    process.detach()
+    return write_seconds, logger.records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="friTap hook overhead benchmark")
+    parser.add_argument("--port", type=int, default=4433)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--size", type=int, default=16)
+    parser.add_argument("--agent", metavar="<path>", action="append",
+                        help="agent build to measure, can be given several times (default: friTap/_ssl_log.js)")
+    args = parser.parse_args()
+    agents = args.agent or [os.path.join(os.path.dirname(here), "friTap", "_ssl_log.js")]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cert, key = create_certificate(tmpdir)
+        # s_server ends its connections when its stdin is closed
+        server = subprocess.Popen(["openssl", "s_server", "-quiet", "-accept", str(args.port), "-cert", cert, "-key", key],
+                                  stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            time.sleep(0.5)
+            baseline = get_write_seconds(start_client(args, False)) / args.count * 1e6
+            print(f"{'without friTap':40} {baseline:8.2f} us/call")
+            for agent in agents:
+                write_seconds, records = run_hooked(args, agent)
+                per_call = write_seconds / args.count * 1e6
+                print(f"{os.path.basename(agent)[:40]:40} {per_call:8.2f} us/call  hook overhead {per_call - baseline:8.2f} us/call  "
+                      f"({records}/{args.count} records captured)")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Import-time regression check of the common friTap invocations. Every invocation is simulated in a fresh
+# interpreter started with "python -X importtime": friTap is imported and the sinks of the invocation are
+# created. The check fails when a heavy optional module (scapy, watchdog, hexdump or the Android tooling)
+# is imported or the cumulative import time exceeds --max_ms. Run it from the repository root:
+#
+#   python3 benchmark/import_time_check.py --max_ms 500
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+here = os.path.abspath(os.path.dirname(__file__))
+
+# modules which are only needed by the full capture, payload modification, verbose output or Android
+HEAVY_MODULES = ["scapy", "watchdog", "hexdump", "AndroidFridaManager"]
+
+INVOCATIONS = {
+    # fritap -k keys.log app
+    "keylog": """
+import friTap.friTap
+from friTap.keylog import KeylogWriter
+KeylogWriter(os.path.join(tmpdir, "keys.log")).close()
+""",
+    # fritap -p log.pcap app
+    "plaintext pcap": """
+import friTap.friTap
+from friTap.pcap import PCAP
+from friTap.ssl_logger import SSL_READ, SSL_WRITE
+PCAP(os.path.join(tmpdir, "log.pcap"), SSL_READ, SSL_WRITE, False, False).close()
+""",
+}
+
+
+def measure(code, tmpdir):
+    """Returns the total import time in microseconds and the names of all imported modules."""
+    code = f"import os\ntmpdir = {tmpdir!r}\n{code}"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True,
+                            cwd=os.path.dirname(here), check=True)
+    total_us = 0
+    modules = set()
+    # import time: <self [us]> | <cumulative [us]> | <imported package indented by its depth>
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        if not name.startswith("  "):
+            # the cumulative time of a top level import includes all its nested imports
+            total_us += int(cumulative_us)
+        modules.add(name.strip())
+    return total_us, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="friTap import-time regression check")
+    parser.add_argument("--max_ms", type=float, default=500.0,
+                        help="Maximal cumulative import time of an invocation in milliseconds (default: 500)")
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, code in INVOCATIONS.items():
+            total_us, modules = measure(code, tmpdir)
+            total_ms = total_us / 1000
+            heavy = sorted({module.split(".")[0] for module in modules} & set(HEAVY_MODULES))
+            print(f"{name:16} {total_ms:8.1f} ms")
+            if heavy:
+                print(f"[-] {name}: imports {', '.join(heavy)}")
+                failed = True
+            if total_ms > args.max_ms:
+                print(f"[-] {name}: import time exceeds {args.max_ms} ms")
+                failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Micro-benchmark of the plaintext PCAP writer on synthetic records. It compares the
+# previous implementation (one struct.pack and one unbuffered write() per header field)
+# with the PlaintextPcapWriter (per-flow header templates and a buffered writev()):
+#
+#   python3 benchmark/pcap_writer_benchmark.py --records 200000 --size 64
+
+import argparse
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.dirname(here))
+
+from friTap.pcap_writer import PcapWriter, PlaintextPcapWriter
+
+SSL_READ = ["SSL_read", "wolfSSL_read", "readApplicationData", "NSS_read", "Full_read"]
+
+
+class CountingFile:
+    """Unbuffered file which counts its write() calls, each of them is a syscall."""
+
+    def __init__(self, name):
+        self.file = open(name, "wb", 0)
+        self.write_calls = 0
+
+    def write(self, data):
+        self.write_calls += 1
+        return self.file.write(data)
+
+    def close(self):
+        self.file.close()
+
+
+class LegacyPlaintextPcapWriter:
+    """The plaintext PCAP writer as it was implemented in PCAP.log_plaintext_payload."""
+
+    def __init__(self, pcap_file):
+        self.pcap_file = pcap_file
+        self.ssl_sessions = {}
+        self.SSL_READ = SSL_READ
+
+    def log_plaintext_payload(self, ss_family, function, src_addr, src_port, dst_addr, dst_port, data):
+        t = time.time()
+        if function in self.SSL_READ:
+            session_unique_key = str(src_addr) + str(src_port) + str(dst_addr) + str(dst_port)
+        else:
+            session_unique_key = str(dst_addr) + str(dst_port) + str(src_addr) + str(src_port)
+        if session_unique_key not in self.ssl_sessions:
+            self.ssl_sessions[session_unique_key] = (random.randint(0, 0xFFFFFFFF), random.randint(0, 0xFFFFFFFF))
+        client_sent, server_sent = self.ssl_sessions[session_unique_key]
+        if function in self.SSL_READ:
+            seq, ack = (server_sent, client_sent)
+        else:
+            seq, ack = (client_sent, server_sent)
+        for writes in (
+            ("=I", int(t)), ("=I", int(t * 1000000) % 1000000), ("=I", 40 + len(data)), ("=i", 40 + len(data)),
+            (">B", 0x45), (">B", 0), (">H", 40 + len(data)), (">H", 0), (">H", 0x4000), (">B", 0xFF), (">B", 6),
+            (">H", 0), (">I", src_addr), (">I", dst_addr), (">H", src_port), (">H", dst_port), (">I", seq),
+            (">I", ack), (">H", 0x5018), (">H", 0xFFFF), (">H", 0), (">H", 0)):
+            self.pcap_file.write(struct.pack(writes[0], writes[1]))
+        self.pcap_file.write(data)
+        if function in self.SSL_READ:
+            server_sent += len(data)
+        else:
+            client_sent += len(data)
+        self.ssl_sessions[session_unique_key] = (client_sent, server_sent)
+
+
+def synthetic_records(count, size, flows):
+    payload = bytes(size)
+    records = []
+    for i in range(count):
+        flow = i % flows
+        client = (0x0A000000 + flow, 40000 + flow)
+        server = (0x0A800000 + flow, 443)
+        if i % 2 == 0:
+            records.append(("AF_INET", "SSL_write", client[0], client[1], server[0], server[1], payload))
+        else:
+            records.append(("AF_INET", "SSL_read", server[0], server[1], client[0], client[1], payload))
+    return records
+
+
+def measure(name, writer, records, count_write_calls):
+    start = time.perf_counter()
+    for record in records:
+        writer.log_plaintext_payload(*record)
+    duration = time.perf_counter() - start
+    print(f"{name:8} {len(records) / duration:12.0f} records/s {count_write_calls() / len(records):8.3f} syscalls/record")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="friTap plaintext PCAP writer benchmark")
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--flows", type=int, default=100)
+    parser.add_argument("--buffer_size", type=int, default=65536)
+    args = parser.parse_args()
+
+    records = synthetic_records(args.records, args.size, args.flows)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        legacy_file = CountingFile(os.path.join(tmpdir, "legacy.pcap"))
+        measure("legacy", LegacyPlaintextPcapWriter(legacy_file), records, lambda: legacy_file.write_calls)
+        legacy_file.close()
+
+        pcap_file = PcapWriter(os.path.join(tmpdir, "engine.pcap"), args.buffer_size, 0)
+        measure("engine", PlaintextPcapWriter(pcap_file, SSL_READ), records, lambda: pcap_file.write_calls)
+        pcap_file.close()
+
+
+if __name__ == "__main__":
+    main()
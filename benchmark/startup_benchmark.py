@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Measures the time-to-first-hook of the friTap agent, i.e. the time from creating the script in a
+# spawned local process until the agent reports that its hooks are installed. Run it from the repository root
+# with the rights to spawn and instrument local processes, --agent measures other builds of the agent:
+#
+#   sudo -E python3 benchmark/startup_benchmark.py --iterations 10 --agent friTap/_ssl_log.js --agent /tmp/_ssl_log.js
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import frida
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.dirname(here))
+
+from friTap.session import AgentSession
+from friTap.ssl_logger import get_fritap_frida_script
+
+TARGET = "import ssl, time; ssl.create_default_context(); time.sleep(60)"
+AGENT_CONFIG = {"experimental": False, "defaultFD": False, "antiroot": False,
+                "transport": {"batch_size": 0, "batch_timeout": 100, "binary_records": False}}
+
+
+def time_to_first_hook(device, script_string, timeout):
+    pid = device.spawn([sys.executable, "-c", TARGET], env=dict(os.environ))
+    process = device.attach(pid)
+    session = None
+    try:
+        # agents which don't report their hooks count as hooked with their first message
+        session = AgentSession(process, pid, AGENT_CONFIG, lambda message, data, pid: session.hooks_installed.set())
+        start = time.perf_counter()
+        session.load(script_string)
+        if not session.wait_for_hooks(timeout):
+            return None
+        return time.perf_counter() - start
+    finally:
+        if session is not None:
+            session.detach()
+        try:
+            device.kill(pid)
+        except frida.ProcessNotFoundError:
+            pass
+
+
+def run(device, script_string, name, iterations, timeout):
+    durations = []
+    for _ in range(iterations):
+        duration = time_to_first_hook(device, script_string, timeout)
+        if duration is not None:
+            durations.append(duration * 1000)
+    if not durations:
+        print(f"[-] {name}: the agent didn't report any hook")
+        return
+    print(f"{name:40} median {statistics.median(durations):8.1f} ms  min {min(durations):8.1f} ms  max {max(durations):8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="friTap agent startup benchmark")
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--agent", metavar="<path>", action="append",
+                        help="agent build to measure, can be given several times (default: friTap/_ssl_log.js)")
+    args = parser.parse_args()
+
+    device = frida.get_local_device()
+    for agent in args.agent or [os.path.join(os.path.dirname(here), "friTap", "_ssl_log.js")]:
+        run(device, get_fritap_frida_script(agent), os.path.basename(agent), args.iterations, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Small OpenSSL client which writes a lot of small records with SSL_write. It is used as the
+# instrumented target of our benchmarks. We drive libssl via ctypes, because Python's own ssl
+# module uses SSL_write_ex/SSL_read_ex which aren't hooked by friTap.
+
+import argparse
+import ctypes
+import ctypes.util
+import socket
+import sys
+import time
+
+
+def load_libssl():
+    libssl = ctypes.CDLL(ctypes.util.find_library("ssl") or "libssl.so.3")
+    libssl.TLS_client_method.restype = ctypes.c_void_p
+    libssl.SSL_CTX_new.restype = ctypes.c_void_p
+    libssl.SSL_CTX_new.argtypes = [ctypes.c_void_p]
+    libssl.SSL_new.restype = ctypes.c_void_p
+    libssl.SSL_new.argtypes = [ctypes.c_void_p]
+    libssl.SSL_set_fd.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    libssl.SSL_connect.argtypes = [ctypes.c_void_p]
+    libssl.SSL_write.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+    libssl.SSL_shutdown.argtypes = [ctypes.c_void_p]
+    libssl.SSL_free.argtypes = [ctypes.c_void_p]
+    libssl.SSL_CTX_free.argtypes = [ctypes.c_void_p]
+    return libssl
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenSSL client writing many small records")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4433)
+    parser.add_argument("--count", type=int, default=20000, help="number of records to write")
+    parser.add_argument("--size", type=int, default=64, help="size of a single record in bytes")
+    parser.add_argument("--delay", type=float, default=2.0, help="seconds to wait until friTap installed its hooks")
+    parser.add_argument("--wait_for_stdin", action="store_true", help="wait for a line on stdin instead of --delay, e.g. until friTap attached")
+    parser.add_argument("--report", action="store_true", help="print the seconds spent in the SSL_write loop")
+    args = parser.parse_args()
+
+    libssl = load_libssl()
+    if args.wait_for_stdin:
+        sys.stdin.readline()
+    else:
+        time.sleep(args.delay)
+
+    ctx = libssl.SSL_CTX_new(libssl.TLS_client_method())
+    ssl = libssl.SSL_new(ctx)
+    payload = b"A" * args.size
+    with socket.create_connection((args.host, args.port)) as sock:
+        libssl.SSL_set_fd(ssl, sock.fileno())
+        if libssl.SSL_connect(ssl) != 1:
+            raise SystemExit("[-] TLS handshake failed")
+        start = time.perf_counter()
+        for _ in range(args.count):
+            libssl.SSL_write(ssl, payload, len(payload))
+        write_seconds = time.perf_counter() - start
+        libssl.SSL_shutdown(ssl)
+    libssl.SSL_free(ssl)
+    libssl.SSL_CTX_free(ctx)
+    if args.report:
+        print(f"write_seconds={write_seconds}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Measures how many messages/records friTap receives from the agent per second with and
+# without batching (--batch) and binary records (--binary_records). The target is benchmark/tls_client.py talking to a local
+# "openssl s_server". Run it from the repository root with the rights to spawn and
+# instrument local processes:
+#
+#   sudo -E python3 benchmark/transport_benchmark.py --count 20000 --size 64
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+here = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.dirname(here))
+
+from friTap.ssl_logger import SSL_Logger
+
+
+class BenchmarkLogger(SSL_Logger):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.finished = threading.Event()
+        self.messages = 0
+        self.records = 0
+        self.bytes = 0
+        self.first_message = None
+        self.last_message = None
+
+    def on_message(self, message, data, pid=None):
+        payload = message.get("payload")
+        if isinstance(payload, dict) and payload.get("contentType") in ("datalog", "datalog_batch", "datalog_binary"):
+            now = time.perf_counter()
+            if self.first_message is None:
+                self.first_message = now
+            self.last_message = now
+            self.messages += 1
+        super().on_message(message, data, pid)
+
+    def handle_payload(self, p, data, pid=None):
+        if isinstance(p, dict) and p.get("contentType") == "datalog":
+            self.records += 1
+            self.bytes += len(data) if data else 0
+        super().handle_payload(p, data, pid)
+
+    def on_detach(self, reason):
+        self.finished.set()
+
+
+def create_certificate(tmpdir):
+    cert = os.path.join(tmpdir, "cert.pem")
+    key = os.path.join(tmpdir, "key.pem")
+    subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-keyout", key, "-out", cert,
+                    "-subj", "/CN=localhost", "-days", "1"], check=True, capture_output=True)
+    return cert, key
+
+
+def run(args, batching, binary_records):
+    target = f"{sys.executable} {os.path.join(here, 'tls_client.py')} --port {args.port} --count {args.count} --size {args.size}"
+    logger = BenchmarkLogger(target, spawn=True, batching=batching, batch_size=args.batch_size, batch_timeout=args.batch_timeout,
+                         binary_records=binary_records)
+    logger.start_fritap_session()
+    logger.finished.wait(args.timeout)
+
+    duration = (logger.last_message or 0) - (logger.first_message or 0)
+    if duration <= 0:
+        print(f"[-] no decrypted records received (batching={batching}, binary_records={binary_records})")
+        return
+    print(f"batching={str(batching):5} binary={str(binary_records):5} messages={logger.messages:8} records={logger.records:8} "
+          f"{logger.messages / duration:10.0f} messages/s {logger.records / duration:10.0f} records/s "
+          f"{logger.bytes / duration / 1e6:8.2f} MB/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="friTap agent to host transport benchmark")
+    parser.add_argument("--port", type=int, default=4433)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--batch_size", type=int, default=65536)
+    parser.add_argument("--batch_timeout", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cert, key = create_certificate(tmpdir)
+        server = subprocess.Popen(["openssl", "s_server", "-quiet", "-accept", str(args.port), "-cert", cert, "-key", key],
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            time.sleep(0.5)
+            for batching in (False, True):
+                for binary_records in (False, True):
+                    run(args, batching, binary_records)
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import os
+import subprocess
+import uuid
+from threading import Lock
+
+# Return code of a command which couldn't be run because the shell of the device is gone
+SHELL_CLOSED = 255
+
+
+def get_adb_path():
+    """Returns the adb binary: $FRITAP_ADB (e.g. a stand-in script for testing) or adb from the PATH."""
+    return os.environ.get("FRITAP_ADB") or "adb"
+
+
+def get_completed_process(command, lines, marker_line):
+    """Returns the output lines of a command and the exit status of its marker line as subprocess.CompletedProcess."""
+    output = "".join(lines)
+    return subprocess.CompletedProcess(command, int(marker_line.split()[1]), output[:-1] if output.endswith("\n") else output, "")
+
+
+class AdbShell:
+    """A long-lived "adb shell" of a device.
+    Instead of spawning an adb process for every command, the commands are written one after another
+    to the stdin of a single shell. The end of the output of every command is marked with a unique
+    marker line carrying its exit status, so several threads can share the shell.
+    The shell is started with "adb shell -T" which needs the shell protocol v2 (Android 7+). Devices without
+    it get an adb process per command, the exit status is then passed with the same marker.
+    Args:
+    adb: The adb binary.
+    serial: Serial of the device, None uses the only connected device.
+    """
+
+    def __init__(self, adb=None, serial=None):
+        self.adb = adb or get_adb_path()
+        self.serial = serial
+        self.process = None
+        self.lock = Lock()
+        self.commands = 0
+        # whether the device supports the shell protocol v2, None until it is checked
+        self.shell_v2 = None
+
+
+    def get_adb_command(self, *args):
+        """Returns the argument list of an adb invocation for the device of this shell."""
+        command = [self.adb]
+        if self.serial is not None:
+            command += ["-s", self.serial]
+        return command + list(args)
+
+
+    def devices(self):
+        """Returns the serials of the connected devices which are ready to use."""
+        output = subprocess.run(self.get_adb_command("devices"), capture_output=True, text=True).stdout
+        serials = []
+        for line in output.splitlines()[1:]:
+            fields = line.split()
+            if len(fields) >= 2 and fields[1] == "device":
+                serials.append(fields[0])
+        return serials
+
+
+    def supports_shell_v2(self):
+        """Returns whether the device supports the shell protocol v2 ("adb shell -T", exit status), checked once."""
+        if self.shell_v2 is None:
+            output = subprocess.run(self.get_adb_command("features"), capture_output=True, text=True)
+            self.shell_v2 = output.returncode == 0 and "shell_v2" in output.stdout.split()
+        return self.shell_v2
+
+
+    def start(self):
+        # -T: no pty, otherwise the commands would be echoed and the output would use \r\n
+        self.process = subprocess.Popen(self.get_adb_command("shell", "-T"), stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL, text=True, bufsize=1)
+
+
+    def run(self, command):
+        """Runs a shell command on the device and returns it as subprocess.CompletedProcess.
+        The stderr of the command is discarded.
+        """
+        marker = f"__friTap_{uuid.uuid4().hex}__"
+        # the command runs in a subshell, so that e.g. exit or cd don't affect the shell,
+        # the leading newline ends the last line of commands whose output doesn't end with one
+        script = f"({command}) 2>/dev/null </dev/null; printf '\\n{marker} %d\\n' $?"
+        if not self.supports_shell_v2():
+            return self.run_once(command, script, marker)
+        with self.lock:
+            if self.process is None or self.process.poll() is not None:
+                self.start()
+            try:
+                self.process.stdin.write(script + "\n")
+                self.process.stdin.flush()
+            except OSError:
+                self.close_process()
+                return subprocess.CompletedProcess(command, SHELL_CLOSED, "", "")
+            self.commands += 1
+            lines = []
+            while True:
+                line = self.process.stdout.readline()
+                if line == "":
+                    # the shell ended, e.g. the device was disconnected
+                    self.close_process()
+                    return subprocess.CompletedProcess(command, SHELL_CLOSED, "".join(lines), "")
+                if line.startswith(marker):
+                    break
+                lines.append(line)
+            return get_completed_process(command, lines, line)
+
+
+    def run_once(self, command, script, marker):
+        # without the shell protocol v2 the exit status of adb is always 0,
+        # the \r\n line endings of the pty are turned into \n by the text mode
+        self.commands += 1
+        output = subprocess.run(self.get_adb_command("shell", script), capture_output=True, text=True).stdout
+        lines = output.splitlines(keepends=True)
+        for i, line in enumerate(lines):
+            if line.startswith(marker):
+                return get_completed_process(command, lines[:i], line)
+        return subprocess.CompletedProcess(command, SHELL_CLOSED, "".join(lines), "")
+
+
+    def close_process(self):
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(1)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+
+
+    def close(self):
+        with self.lock:
+            self.close_process()
@@ -7,53 +7,77 @@ import frida
 import subprocess
 import sys
 import shlex
+from .adb import AdbShell
 
 if sys.version_info >= (3,10):
     from importlib.resources import files
 
 
+# frida's names of the architectures of ro.product.cpu.abi
+ANDROID_ABIS = {"arm64-v8a": "arm64", "armeabi-v7a": "arm", "armeabi": "arm", "x86": "ia32", "x86_64": "x64"}
+
+
 class Android:
+    """The Android device of a full capture.
+    All shell commands are send over one long-lived adb shell (see friTap/adb.py) and the state of
+    the device (root method, architecture, tcpdump) is only queried once.
+    Args:
+    debug_infos: Print the output of adb.
+    arch: Architecture of the device, queried from the device if not given.
+    adb: The adb binary, default: $FRITAP_ADB or adb.
+    log: Called with the status messages.
+    """
     
-    def __init__(self,debug_infos=False, arch=""):
+    def __init__(self,debug_infos=False, arch="", adb=None, log=print):
+        self.log = log
         self.dst_path = "/data/local/tmp/"
         self.device = None
         self.pcap_name = ""
         self.print_debug_infos = debug_infos
         self.is_magisk_mode = False
         self.do_we_have_an_android_device = False
+        self.shell = AdbShell(adb)
+        # su prefix of the root commands, None until it is checked
+        self.root_method = None
+        self.tcpdump_available = None
         if self._is_Android():
             self.tcpdump_version = self._get_appropriate_android_tcpdump_version(arch)
             self.adb_check_root() # set is_magisk_mode
 
         
     def adb_check_root(self):
-        if bool(subprocess.run(['adb', 'shell','su -v'], capture_output=True, text=True).stdout):
-            self.is_magisk_mode = True
-            return True
-
-        return bool(subprocess.run(['adb', 'shell','su 0 id -u'], capture_output=True, text=True).stdout)
+        if self.root_method is None:
+            if self.shell.run("su -v").stdout:
+                self.is_magisk_mode = True
+                self.root_method = "su -c"
+            elif self.shell.run("su 0 id -u").stdout:
+                self.root_method = "su 0"
+            else:
+                self.root_method = ""
+        return self.root_method != ""
     
     def run_adb_command_as_root(self,command):
         if self.adb_check_root() == False:
-            print("[-] none rooted device. Please root it before using FridaAndroidManager and ensure that you are able to run commands with the su-binary....")
+            self.log("[-] none rooted device. Please root it before using FridaAndroidManager and ensure that you are able to run commands with the su-binary....")
             exit(2)
 
-        if self.is_magisk_mode:
-            output = subprocess.run(['adb', 'shell','su -c '+command], capture_output=True, text=True)
-        else:
-            output = subprocess.run(['adb', 'shell','su 0 '+command], capture_output=True, text=True)
-            
+        output = self.shell.run(self.root_method+" "+command)
+        if self.print_debug_infos:
+            self.log(str(output))
         return output
 
     def _adb_push_file(self,file,dst):
-        output = subprocess.run(['adb', 'push',file,dst], capture_output=True, text=True)
+        output = subprocess.run(self.shell.get_adb_command('push',file,dst), capture_output=True, text=True)
         return output
     
     def _adb_pull_file(self,src_file,dst):
-        output = subprocess.run(['adb', 'pull',src_file,dst], capture_output=True, text=True)
+        output = subprocess.run(self.shell.get_adb_command('pull',src_file,dst), capture_output=True, text=True)
         return output
     
     def _get_android_device_arch(self):
+        abi = self.shell.run("getprop ro.product.cpu.abi").stdout.strip()
+        if abi in ANDROID_ABIS:
+            return ANDROID_ABIS[abi]
         frida_usb_json_data = frida.get_usb_device().query_system_parameters()
         return frida_usb_json_data['arch']
     
@@ -79,25 +103,18 @@ class Android:
         elif arch == "x64":
             tcpdump_version = "tcpdump_x86_64_android"
         else:
-            print("[-] unknown arch.\n We can't find your device architecture using frida, please set mobile arch via --m_arch <arm64|arm|ia32|x64>\n[-] Leaving....")
+            self.log("[-] unknown arch.\n We can't find your device architecture using frida, please set mobile arch via --m_arch <arm64|arm|ia32|x64>\n[-] Leaving....")
             exit(2)
             
         return tcpdump_version
 
 
-    def is_tcpdump_available():
-        try:
-            # Check if tcpdump is available on the device
-            result = subprocess.run(['adb', 'shell', 'tcpdump', '--version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            if result.returncode == 0:
-                #print("tcpdump is available on the device.")
-                return True
-            else:
-                #print("tcpdump is not available on the device.")
-                return False
-        except Exception as e:
-            print(f"Error checking tcpdump availability: {e}")
-            return False
+    @property
+    def is_tcpdump_available(self):
+        # Check once if tcpdump is available on the device
+        if self.tcpdump_available is None:
+            self.tcpdump_available = self.shell.run("tcpdump --version").returncode == 0
+        return self.tcpdump_available
             
     
     def _get_tcpdump_version(self):
@@ -109,11 +126,11 @@ class Android:
         #tcpdump_path = files('friTap.assets.tcpdump_binaries').joinpath(self.tcpdump_version)
 
         if file_exists(tcpdump_path):
-            print(f"[*] installing tcpdump to Android device: {tcpdump_path}")
+            self.log(f"[*] installing tcpdump to Android device: {tcpdump_path}")
             return tcpdump_path
         else:
-            print("[-] error: can't find "+str(tcpdump_path))
-            print("[-] ensure that "+str(tcpdump_path)+" exits\n")
+            self.log("[-] error: can't find "+str(tcpdump_path))
+            self.log("[-] ensure that "+str(tcpdump_path)+" exits\n")
             os._exit(2)
     
     def push_tcpdump_to_device(self):
@@ -123,69 +140,96 @@ class Android:
         
 
         if return_Value.returncode != 0:
-            print("[-] error: " +  return_Value.stderr)
-            print("    it might help to adjust the dst_path or to ensure that you have adb in your path\n")
+            self.log("[-] error: " +  return_Value.stderr)
+            self.log("    it might help to adjust the dst_path or to ensure that you have adb in your path\n")
             os._exit(2)
         else:
             self._adb_make_binary_executable(self.dst_path)
-            print(f"[*] pushed tcpdump to {self.dst_path} on your android device")
+            self.log(f"[*] pushed tcpdump to {self.dst_path} on your android device")
             
     def pull_pcap_from_device(self):
         self.close_friTap_if_none_android()
         pcap_path = self.dst_path + self.pcap_name
         return_Value = self._adb_pull_file(pcap_path,".")
-        print("[*] pulling capture from device")
+        self.log("[*] pulling capture from device")
         if self.print_debug_infos:
-            print(return_Value)
+            self.log(str(return_Value))
         if return_Value.returncode !=0:
-            print(f"[-] error pulling pcap ({pcap_path}) from android device")
+            self.log(f"[-] error pulling pcap ({pcap_path}) from android device")
             
     def send_ctrlC_over_adb(self):
         self.close_friTap_if_none_android()
-        self.run_adb_command_as_root(f"kill -INT $(pidof -s {self.tcpdump_version})")
+        self.run_adb_command_as_root(f"kill -INT $(pidof -s {self._get_tcpdump_name()})")
         
         
     def close_friTap_if_none_android(self):
         if self.is_Android == False:
-            print("[-] none android device\nclosing friTap...")
+            self.log("[-] none android device\nclosing friTap...")
             exit(2)
     
+    def _get_tcpdump_name(self):
+        return "tcpdump" if self.is_tcpdump_available else self.tcpdump_version
+
+
+    def _get_tcpdump_command(self, output):
+        if self.is_tcpdump_available:
+            tcpdump_binary = "tcpdump"
+        else:
+            tcpdump_binary = f"{self.dst_path}./{self.tcpdump_version}"
+        return f'{tcpdump_binary} -i any -s 0 -w {output} \\"not \\(tcp port 5555 or tcp port 27042\\)\\"'
+
+
     def run_tcpdump_capture(self,pcap_name):
         self.close_friTap_if_none_android()
         self.pcap_name = pcap_name
 
-        if self.is_tcpdump_available:
-            tcpdump_cmd = f'tcpdump -i any -s 0 -w {self.dst_path}{pcap_name} \\"not \\(tcp port 5555 or tcp port 27042\\)\\"'
-        else:
-            tcpdump_cmd = f'{self.dst_path}./{self.tcpdump_version} -i any -s 0 -w {self.dst_path}{pcap_name} \\"not \\(tcp port 5555 or tcp port 27042\\)\\"'
+        tcpdump_cmd = self._get_tcpdump_command(self.dst_path + pcap_name)
 
         
-        if self.is_magisk_mode:
-            cmd = f'adb shell su -c "{tcpdump_cmd}"'
-        else:
-            cmd = f'adb shell su 0 "{tcpdump_cmd}"'
+        self.adb_check_root()
+        # the capture runs until it is interrupted, so it gets its own adb process instead of blocking the shell
+        cmd = self.shell.get_adb_command('shell') + shlex.split(f'{self.root_method} "{tcpdump_cmd}"')
 
-        print("[*] Running tcpdump in background:", cmd)
-        process = subprocess.Popen(shlex.split(cmd), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        self.log("[*] Running tcpdump in background: " + shlex.join(cmd))
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
 
 
         return process
 
+
+    def stream_tcpdump_capture(self):
+        """Runs tcpdump on the device without writing the capture on the device.
+        Returns the adb process whose stdout is the capture as classic pcap, written packet by packet (-U).
+        """
+        self.close_friTap_if_none_android()
+        tcpdump_cmd = self._get_tcpdump_command("- -U")
+        self.adb_check_root()
+        # exec-out doesn't use a pty, so the binary capture isn't altered
+        cmd = self.shell.get_adb_command('exec-out') + shlex.split(f'{self.root_method} "{tcpdump_cmd}"')
+
+        self.log("[*] Streaming tcpdump capture: " + shlex.join(cmd))
+        return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
     
     def _is_Android(self):
         try:
-            subprocess.run(['adb'], capture_output=True, text=True)
+            devices = self.shell.devices()
         except FileNotFoundError:
-            print("[-] can't find adb in your path. Please ensure that adb is installed and in your path if you are trying a full capture on Android.")
+            self.log("[-] can't find adb in your path. Please ensure that adb is installed and in your path if you are trying a full capture on Android.")
             return False
         
-        if len(subprocess.run(['adb', 'devices'], capture_output=True, text=True).stdout) > 27:
+        if len(devices) > 0:
             self.do_we_have_an_android_device = True
             return True
         else:
-            print("[-] No device connected to adb. Ensure that adb devices will print your device if you are trying a full capture on Android.")
+            self.log("[-] No device connected to adb. Ensure that adb devices will print your device if you are trying a full capture on Android.")
             return False
         
     def is_Android(self):
         return self.do_we_have_an_android_device
+
+
+    def close(self):
+        """Ends the adb shell of the device."""
+        self.shell.close()
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Embeddable friTap capture.
+
+    import asyncio
+    from friTap.capture import Capture, DataRecord
+
+    async def main():
+        async with Capture("curl https://example.com", spawn=True) as capture:
+            async for record in capture:
+                if isinstance(record, DataRecord):
+                    print(record.function, len(record.data))
+
+    asyncio.run(main())
+
+The capture runs until the target ends or stop() is called, the interpreter keeps running.
+All options of SSL_Logger (e.g. keylog or pcap_name) can be passed as keyword arguments.
+"""
+import asyncio
+from collections import OrderedDict, deque
+from threading import Condition, Event, Lock
+from .ssl_logger import SSL_Logger, SSL_READ, get_addr_string
+from .writer_queue import OVERFLOW_POLICIES, BLOCK, DROP_OLDEST, DROP
+
+# Number of connections remembered for the "open" SocketRecord. Connections which are never closed
+# (e.g. the close wasn't hooked) are forgotten after this many newer ones, their next record opens them again.
+MAX_CONNECTIONS = 65536
+
+
+class DataRecord:
+    """Decrypted data of a TLS connection. is_read is True for data received by the target."""
+    __slots__ = ("pid", "function", "ss_family", "src_addr", "src_port", "dst_addr", "dst_port", "ssl_session_id", "data")
+
+    def __init__(self, pid, function, ss_family, src_addr, src_port, dst_addr, dst_port, ssl_session_id, data):
+        self.pid = pid
+        self.function = function
+        self.ss_family = ss_family
+        self.src_addr = src_addr
+        self.src_port = src_port
+        self.dst_addr = dst_addr
+        self.dst_port = dst_port
+        self.ssl_session_id = ssl_session_id
+        self.data = data
+
+
+    @property
+    def is_read(self):
+        return self.function in SSL_READ
+
+
+    def __repr__(self):
+        return f"DataRecord({self.function} {self.src_addr}:{self.src_port} --> {self.dst_addr}:{self.dst_port}, {len(self.data)} bytes)"
+
+
+class KeylogRecord:
+    """A line of the NSS key log format."""
+    __slots__ = ("pid", "keylog")
+
+    def __init__(self, pid, keylog):
+        self.pid = pid
+        self.keylog = keylog
+
+
+    def __repr__(self):
+        return f"KeylogRecord({self.keylog})"
+
+
+class SocketRecord:
+    """A connection seen for the first time (event "open") or closed by the target (event "close")."""
+    __slots__ = ("pid", "event", "function", "ss_family", "src_addr", "src_port", "dst_addr", "dst_port", "closed_by")
+
+    def __init__(self, pid, event, function, ss_family, src_addr, src_port, dst_addr, dst_port, closed_by=None):
+        self.pid = pid
+        self.event = event
+        self.function = function
+        self.ss_family = ss_family
+        self.src_addr = src_addr
+        self.src_port = src_port
+        self.dst_addr = dst_addr
+        self.dst_port = dst_port
+        self.closed_by = closed_by
+
+
+    def __repr__(self):
+        return f"SocketRecord({self.event} {self.src_addr}:{self.src_port} --> {self.dst_addr}:{self.dst_port})"
+
+
+class ConsoleRecord:
+    """An output of the agent, level is "info" or "debug"."""
+    __slots__ = ("pid", "level", "message")
+
+    def __init__(self, pid, level, message):
+        self.pid = pid
+        self.level = level
+        self.message = message
+
+
+    def __repr__(self):
+        return f"ConsoleRecord({self.level}: {self.message})"
+
+
+class RecordStream:
+    """Bounded queue of records between the writer threads of friTap and an asyncio consumer.
+    The event loop is only woken up when the consumer waits for the next record, so the
+    records of a busy capture are handed over without a call into the loop per record.
+    If the queue is full the overflow policy decides what happens (see WriterQueue).
+    Args:
+    loop: The event loop of the consumer.
+    max_size: Maximal number of queued records.
+    overflow_policy: One of OVERFLOW_POLICIES.
+    """
+
+    def __init__(self, loop, max_size=10000, overflow_policy=BLOCK):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy: {overflow_policy}")
+        self.loop = loop
+        self.max_size = max(1, max_size)
+        self.overflow_policy = overflow_policy
+        self.records = deque()
+        self.condition = Condition()
+        self.waiter = None
+        self.closed = False
+        self.dropped = 0
+
+
+    def put(self, record):
+        with self.condition:
+            if self.closed:
+                return
+            if len(self.records) >= self.max_size:
+                if self.overflow_policy == DROP:
+                    self.dropped += 1
+                    return
+                elif self.overflow_policy == DROP_OLDEST:
+                    self.records.popleft()
+                    self.dropped += 1
+                else:
+                    while len(self.records) >= self.max_size and not self.closed:
+                        self.condition.wait()
+                    if self.closed:
+                        return
+            self.records.append(record)
+            self._wake_up()
+
+
+    def close(self):
+        """Ends the iteration after the queued records."""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+            self._wake_up()
+
+
+    def _wake_up(self):
+        waiter = self.waiter
+        if waiter is None:
+            return
+        self.waiter = None
+        try:
+            self.loop.call_soon_threadsafe(_set_done, waiter)
+        except RuntimeError:
+            pass # the event loop is closed
+
+
+    def __aiter__(self):
+        return self
+
+
+    async def __anext__(self):
+        while True:
+            with self.condition:
+                if self.records:
+                    record = self.records.popleft()
+                    self.condition.notify_all()
+                    return record
+                if self.closed:
+                    raise StopAsyncIteration
+                waiter = self.waiter = self.loop.create_future()
+            await waiter
+
+
+def _discard(message):
+    pass
+
+
+def _set_done(future):
+    if not future.done():
+        future.set_result(None)
+
+
+class Capture:
+    """A friTap capture which can be embedded into other Python programs.
+    The records of the capture are delivered as DataRecord, KeylogRecord, SocketRecord and ConsoleRecord
+    to the callback and to the asynchronous iterators of records(). The callback is called from
+    the writer threads of friTap, but never concurrently. The file sinks of friTap (e.g. keylog or
+    pcap_name) can be used at the same time.
+    Args:
+    target: The process to attach to or the command line to spawn.
+    spawn: Spawn the target instead of attaching to it.
+    mobile: Capture a process of the connected USB device.
+    host: Capture a process of a remote frida-server.
+    callback: Function called with every record.
+    queue_size: Maximal number of records queued for an iterator.
+    queue_policy: What happens when the queue of an iterator is full (see WriterQueue).
+    log_callback: Called with every line of friTap's own output (banners, statistics, errors). By default
+        nothing is printed, the output of the agent is delivered as ConsoleRecord anyway.
+    options: Further keyword arguments of SSL_Logger.
+    """
+
+    def __init__(self, target, spawn=False, mobile=False, host=False, callback=None, queue_size=10000, queue_policy=BLOCK, log_callback=None, **options):
+        self.target = target
+        self.spawn = spawn
+        self.mobile = mobile
+        self.host = host
+        self.callback = callback
+        self.callback_lock = Lock()
+        self.queue_size = queue_size
+        self.queue_policy = queue_policy
+        self.log = log_callback if log_callback is not None else _discard
+        self.options = options
+        self.ssl_logger = None
+        self.process = None
+        self.streams = []
+        self.streams_lock = Lock()
+        self.stream = None
+        self.connections = OrderedDict()
+        self.connections_lock = Lock()
+        self.detached = Event()
+        self.stopped = False
+
+
+    def start(self):
+        """Attaches to resp. spawns the target, it returns as soon as the hooks are installed."""
+        self.ssl_logger = SSL_Logger(self.target, spawn=self.spawn, mobile=self.mobile, host=self.host,
+                                     record_handler=self.handle_record, exit_on_cleanup=False, log_callback=self.log, **self.options)
+        self.process = self.ssl_logger.start_fritap_session()
+        # called after the detach handler of SSL_Logger, which writes the remaining records
+        self.process.on("detached", self.on_detach)
+        return self
+
+
+    def stop(self, timeout=5.0):
+        """Detaches from the target, writes the pending records into the sinks and ends the iterators.
+        The iterators end first, so that a consumer which doesn't iterate anymore can't block the writer threads.
+        """
+        if self.stopped:
+            return
+        self.stopped = True
+        self.close_streams()
+        if self.ssl_logger is not None and not self.detached.is_set():
+            try:
+                self.ssl_logger.detach()
+            except Exception:
+                pass # the target is already gone
+            if not self.detached.wait(timeout):
+                self.ssl_logger.pcap_cleanup(self.ssl_logger.full_capture, self.ssl_logger.mobile, self.ssl_logger.pcap_name)
+                self.ssl_logger.cleanup(self.ssl_logger.live, self.ssl_logger.socket_trace, self.ssl_logger.full_capture, self.ssl_logger.debug)
+
+
+    def wait(self, timeout=None):
+        """Waits until the target ended or the capture was stopped, returns False after the timeout."""
+        return self.detached.wait(timeout)
+
+
+    def sync_keylog(self):
+        """Writes the pending keys of the keylog and forces them onto the disk, e.g. before it is copied while the capture continues."""
+        if self.ssl_logger is not None:
+            self.ssl_logger.sync_keylog()
+
+
+    def hook_stats(self):
+        """Returns the hooks of every traced process with their number of calls as {pid: [{"module", "function", "address", "hits"}]}."""
+        if self.ssl_logger is None:
+            return {}
+        with self.ssl_logger.sessions_lock:
+            sessions = self.ssl_logger.detached_sessions + list(self.ssl_logger.sessions.values())
+        return {session.pid: session.hook_stats() for session in sessions}
+
+
+    def on_detach(self, reason):
+        self.detached.set()
+        self.close_streams()
+
+
+    def records(self, max_size=None, overflow_policy=None):
+        """Returns an asynchronous iterator of all records from now on until the capture ends.
+        It has to be called from the event loop which consumes the records.
+        """
+        stream = RecordStream(asyncio.get_event_loop(), max_size or self.queue_size, overflow_policy or self.queue_policy)
+        with self.streams_lock:
+            if self.detached.is_set() or self.stopped:
+                stream.close()
+            else:
+                self.streams.append(stream)
+        return stream
+
+
+    def close_streams(self):
+        with self.streams_lock:
+            streams = self.streams
+            self.streams = []
+        for stream in streams:
+            stream.close()
+
+
+    def handle_record(self, p, data):
+        """Converts a message of the agent into records, called by the writer threads of SSL_Logger."""
+        content_type = p["contentType"]
+        pid = p.get("pid")
+        if content_type == "datalog":
+            src_addr = get_addr_string(p["src_addr"], p["ss_family"])
+            dst_addr = get_addr_string(p["dst_addr"], p["ss_family"])
+            key = (pid, src_addr, p["src_port"], dst_addr, p["dst_port"])
+            if p["function"] in SSL_READ:
+                key = (pid, dst_addr, p["dst_port"], src_addr, p["src_port"])
+            with self.connections_lock:
+                is_new = key not in self.connections
+                if is_new:
+                    self.connections[key] = None
+                    if len(self.connections) > MAX_CONNECTIONS:
+                        self.connections.popitem(last=False)
+                else:
+                    self.connections.move_to_end(key)
+            if is_new:
+                self.publish(SocketRecord(pid, "open", p["function"], p["ss_family"], src_addr, p["src_port"], dst_addr, p["dst_port"]))
+            if data:
+                self.publish(DataRecord(pid, p["function"], p["ss_family"], src_addr, p["src_port"], dst_addr, p["dst_port"],
+                                        p.get("ssl_session_id"), data))
+        elif content_type == "close":
+            src_addr = get_addr_string(p["src_addr"], p["ss_family"])
+            dst_addr = get_addr_string(p["dst_addr"], p["ss_family"])
+            with self.connections_lock:
+                for key in ((pid, src_addr, p["src_port"], dst_addr, p["dst_port"]), (pid, dst_addr, p["dst_port"], src_addr, p["src_port"])):
+                    self.connections.pop(key, None)
+            self.publish(SocketRecord(pid, "close", p["function"], p["ss_family"], src_addr, p["src_port"], dst_addr, p["dst_port"], p.get("closed_by")))
+        elif content_type == "keylog":
+            self.publish(KeylogRecord(pid, p["keylog"]))
+        elif content_type == "console":
+            self.publish(ConsoleRecord(pid, "info", p["console"]))
+        elif content_type == "console_dev" and p["console_dev"]:
+            self.publish(ConsoleRecord(pid, "debug", p["console_dev"]))
+
+
+    def publish(self, record):
+        if self.callback is not None:
+            with self.callback_lock:
+                try:
+                    self.callback(record)
+                except Exception as e:
+                    self.log(f"[-] Error in the record callback: {e}")
+        with self.streams_lock:
+            streams = list(self.streams)
+        for stream in streams:
+            stream.put(record)
+
+
+    def __enter__(self):
+        return self.start()
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+    def __aiter__(self):
+        if self.stream is None:
+            self.stream = self.records()
+        return self.stream
+
+
+    async def __aenter__(self):
+        # records of the first connections are queued until the iteration starts
+        self.stream = self.records()
+        await asyncio.get_event_loop().run_in_executor(None, self.start)
+        return self
+
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await asyncio.get_event_loop().run_in_executor(None, self.stop)
@@ -5,11 +5,12 @@ import argparse
 import os
 import sys
 import frida
-from AndroidFridaManager import FridaBasedException
 import traceback
 from .about import __version__
 from .about import __author__
 from .ssl_logger import SSL_Logger
+from .writer_queue import OVERFLOW_POLICIES, BLOCK
+from .live_server import parse_listen_address, DEFAULT_LISTEN_ADDRESS, DEFAULT_REPLAY_RECORDS, DEFAULT_CLIENT_BUFFER
 import logging
 
 
@@ -24,6 +25,12 @@ def write_debug_frida_file(debug_script_version):
     print(f"[!] written debug version of the frida script: {debug_script_file}")
 
 
+# the exceptions of the Android tooling are matched by their name, importing it slows down the startup and shutdown
+def is_frida_based_exception(exception):
+    return any(cls.__name__ == "FridaBasedException" and cls.__module__.startswith("AndroidFridaManager")
+               for cls in type(exception).__mro__)
+
+
 
 '''
 def running_hooks(script="custom_hooks.js"):
@@ -77,16 +84,46 @@ Examples:
     args.add_argument("-ed", "--enable_default_fd", required=False, action="store_const", const=True, default=False, help="Activate the fallback socket information (127.0.0.1:1234-127.0.0.1:2345) whenever the file descriptor (FD) of the socket cannot be determined")
     args.add_argument("-f", "--full_capture", required=False, action="store_const", const=True, default=False,
                       help="Do a full packet capture instead of logging only the decrypted TLS payload. Set pcap name with -p <PCAP name>")
+    args.add_argument("--stream_capture", required=False, action="store_const", const=True, default=False,
+                      help="Stream the full capture (-f) of an Android device over adb instead of writing it on the device, together with --live the capture can be viewed live with Wireshark")
+    args.add_argument("--raw_frames", required=False, action="store_const", const=True, default=False,
+                      help="Write the frames of a local full capture (-f) directly into the PCAP without parsing them with scapy (Linux only)")
+    args.add_argument("--filter_processes", metavar="<n>", required=False, type=int, default=1,
+                      help="Number of processes filtering the full capture (-f) for the traffic of the target application when friTap ends (default: 1)")
+    args.add_argument("--inline_filter", required=False, action="store_const", const=True, default=False,
+                      help="Write only the packets of the traced sockets during a local or streamed (--stream_capture) full capture (-f) instead of filtering the whole capture at the end")
+    args.add_argument("--preroll", metavar="<seconds>", required=False, type=float, default=3.0,
+                      help="Seconds the packets are held back by the inline filter, so that packets seen shortly before their socket was traced (e.g. the TLS handshake) are kept (default: 3)")
+    args.add_argument("--attach_workers", metavar="<n>", required=False, type=int, default=4,
+                      help="Number of spawned/child processes which are instrumented in parallel (default: 4)")
     args.add_argument("-k", "--keylog", metavar="<path>", required=False,
                       help="Log the keys used for tls traffic")
+    args.add_argument("--keylog_flush_lines", metavar="<lines>", required=False, type=int, default=64,
+                      help="Write the buffered keys into the keylog (-k) as soon as this many are pending, 1 writes every key immediately (default: 64)")
+    args.add_argument("--keylog_flush_interval", metavar="<ms>", required=False, type=int, default=100,
+                      help="Write the buffered keys into the keylog (-k) after this many milliseconds at the latest (default: 100)")
     args.add_argument("-l", "--live", required=False, action="store_const", const=True,
-                      help="Creates a named pipe /tmp/sharkfin which can be read by Wireshark during the capturing process")
+                      help="Serves the capture on a local socket which can be read by any number of Wireshark instances during the capturing process")
+    args.add_argument("--live_listen", metavar="<address>", required=False, default=DEFAULT_LISTEN_ADDRESS,
+                      help="Listen address of the live view (-l): unix:<path>, tcp:<host>:<port>, <host>:<port> or <port> (default: 127.0.0.1 with a free port)")
+    args.add_argument("--live_replay", metavar="<records>", required=False, type=int, default=DEFAULT_REPLAY_RECORDS,
+                      help=f"Number of recent records a client of the live view (-l) gets when it connects later (default: {DEFAULT_REPLAY_RECORDS})")
+    args.add_argument("--live_buffer", metavar="<MB>", required=False, type=float, default=DEFAULT_CLIENT_BUFFER / (1024 * 1024),
+                      help="Data queued for a client of the live view (-l) before it is disconnected as too slow (default: 16)")
     args.add_argument("-p ", "--pcap", metavar="<path>", required=False,
                       help="Name of PCAP file to write")
+    args.add_argument("--pcapng", required=False, action="store_const", const=True, default=False,
+                      help="Write the decrypted TLS traffic (-p or --live) as pcapng with the embedded key material, one interface per process and TLS library and the SSL session id as packet comment")
+    args.add_argument("--rotate_size", metavar="<MB>", required=False, type=float, default=0,
+                      help="Continue the decrypted TLS traffic (-p) and the keylog (-k) in a new file as soon as a file reaches this size")
+    args.add_argument("--rotate_interval", metavar="<seconds>", required=False, type=int, default=0,
+                      help="Continue the decrypted TLS traffic (-p) and the keylog (-k) in a new file after this many seconds")
+    args.add_argument("--rotate_files", metavar="<count>", required=False, type=int, default=0,
+                      help="Keep at most this many rotated files, the oldest files are removed (default: keep all)")
     args.add_argument("-s", "--spawn", required=False, action="store_const", const=True,
                       help="Spawn the executable/app instead of attaching to a running process")
     args.add_argument("-sot", "--socket_tracing", metavar="<path>", required=False, nargs='?', const=True,
-                      help="Traces all socket of the target application and provide a prepared wireshark display filter. If pathname is set, it will write the socket trace into a file-")
+                      help="Traces all socket of the target application and provide a prepared wireshark display filter. If pathname is set, it will write the socket trace into a file. A *.json or *.csv pathname writes the traced flows with their first/last seen timestamps instead")
     args.add_argument("-env","--environment", metavar="<env.json>", required=False,
                       help="Provide the environment necessary for spawning as an JSON file. For instance: {\"ENV_VAR_NAME\": \"ENV_VAR_VALUE\" }")
     args.add_argument("-v", "--verbose", required=False, action="store_const",
@@ -100,15 +137,59 @@ Examples:
                       help="Provide custom offsets for all hooked functions inside a JSON file or a json string containing all offsets. For more details see our example json (offsets_example.json)")
     args.add_argument("--payload_modification", required=False, action="store_const", const=True, default=False,
                       help="Capability to alter the decrypted payload. Be careful here, because this can crash the application.")                  
+    args.add_argument("--batch", required=False, action="store_const", const=True, default=False,
+                      help="Collect the decrypted TLS records inside the target process and transfer them in batches to friTap. This reduces the messaging overhead for chatty applications")
+    args.add_argument("--batch_size", metavar="<bytes>", required=False, type=int, default=65536,
+                      help="Flush a batch as soon as it contains at least this many bytes of decrypted data (default: 65536)")
+    args.add_argument("--batch_timeout", metavar="<ms>", required=False, type=int, default=100,
+                      help="Flush a batch at the latest after this many milliseconds (default: 100)")
+    args.add_argument("--binary_records", required=False, action="store_const", const=True, default=False,
+                      help="Transfer the decrypted TLS records with a compact binary header instead of a JSON dictionary per record")
+    args.add_argument("--queue_size", metavar="<messages>", required=False, type=int, default=10000,
+                      help="Maximal number of messages waiting to be written into the PCAP, keylog and console (default: 10000)")
+    args.add_argument("--queue_policy", required=False, choices=OVERFLOW_POLICIES, default=BLOCK,
+                      help="What happens when the queue is full: block the message dispatching, drop the oldest or drop the new record. Keys and close messages are never dropped (default: block)")
+    args.add_argument("--writer_threads", metavar="<n>", required=False, type=int, default=1,
+                      help="Number of threads writing the queued messages, the messages of a connection are always written by the same thread (default: 1)")
     args.add_argument("-exp","--experimental", required=False, action="store_const", const=True, default=False,
                       help="Activates all existing experimental feature (see documentation for more information)")
     parsed = parser.parse_args()
 
     
-    if parsed.full_capture and parsed.pcap is None:
+    if parsed.full_capture and parsed.pcap is None and not parsed.live:
         parser.error("--full_capture requires -p to set the pcap name")
         exit(2)
 
+    if parsed.stream_capture and not (parsed.full_capture and parsed.mobile):
+        parser.error("--stream_capture requires --full_capture on a mobile device (-m)")
+        exit(2)
+
+    if parsed.full_capture and parsed.live and parsed.mobile and not parsed.stream_capture:
+        parser.error("the live view of a full capture on Android requires --stream_capture")
+        exit(2)
+
+    if parsed.live:
+        try:
+            parse_listen_address(parsed.live_listen)
+        except ValueError as e:
+            parser.error(f"--live_listen: {e}")
+
+    if parsed.inline_filter and not parsed.full_capture:
+        parser.error("--inline_filter requires --full_capture")
+        exit(2)
+
+    if parsed.raw_frames and not parsed.full_capture:
+        parser.error("--raw_frames requires --full_capture")
+        exit(2)
+
+    if parsed.full_capture and parsed.pcapng:
+        parser.error("--pcapng is only supported for the decrypted TLS traffic and not together with --full_capture")
+        exit(2)
+
+    if parsed.full_capture and (parsed.rotate_size > 0 or parsed.rotate_interval > 0):
+        parser.error("the rotation (--rotate_size, --rotate_interval) is only supported for the decrypted TLS traffic and not together with --full_capture")
+        exit(2)
+
     if parsed.full_capture and parsed.keylog is None:
         print("[*] Are you sure you want to proceed without recording the key material (-k <keys.log>)?\n[*] Without the key material, you have a complete network record, but no way to view the contents of the TLS traffic.")
         print("[*] Do you want to proceed without recording keys? : <press any key to proceed or Strg+C to abort>")
@@ -117,26 +198,30 @@ Examples:
         print("Start logging")
         print("Press Ctrl+C to stop logging")
         ssl_log = SSL_Logger(parsed.exec, parsed.pcap, parsed.verbose,
-                parsed.spawn, parsed.keylog, parsed.enable_spawn_gating, parsed.mobile, parsed.live, parsed.environment, parsed.debug, parsed.full_capture, parsed.socket_tracing, parsed.host, parsed.offsets, parsed.debugoutput, parsed.experimental, parsed.anti_root, parsed.payload_modification, parsed.enable_default_fd)
+                parsed.spawn, parsed.keylog, parsed.enable_spawn_gating, parsed.mobile, parsed.live, parsed.environment, parsed.debug, parsed.full_capture, parsed.socket_tracing, parsed.host, parsed.offsets, parsed.debugoutput, parsed.experimental, parsed.anti_root, parsed.payload_modification, parsed.enable_default_fd, parsed.batch, parsed.batch_size, parsed.batch_timeout, parsed.binary_records, parsed.queue_size, parsed.queue_policy, parsed.writer_threads, parsed.pcapng, int(parsed.rotate_size * 1024 * 1024), parsed.rotate_interval, parsed.rotate_files, raw_frames=parsed.raw_frames, filter_processes=parsed.filter_processes, inline_filter=parsed.inline_filter, preroll=parsed.preroll, keylog_flush_lines=parsed.keylog_flush_lines, keylog_flush_interval=parsed.keylog_flush_interval, attach_workers=parsed.attach_workers, stream_capture=parsed.stream_capture, live_listen=parsed.live_listen, live_replay=parsed.live_replay, live_buffer=int(parsed.live_buffer * 1024 * 1024))
         
         process = ssl_log.start_fritap_session()      
         sys.stdin.read()
     except frida.TransportError as fe:
         print(f"[-] Problems while attaching to frida-server: {fe}")
         exit(2)
-    except FridaBasedException as e:
-        print(f"[-] Frida based error: {e}")
-        exit(2)
     except frida.TimedOutError as te:
         print(f"[-] TimeOutError: {te}")
         exit(2)
     except frida.ProcessNotFoundError as pe:
         print(f"[-] ProcessNotFoundError: {pe}")
         exit(2)
+    except ImportError as ie:
+        print(f"[-] {ie}")
+        exit(2)
     except KeyboardInterrupt:
-        process.detach()
+        ssl_log.detach()
         pass
     except Exception as ar:
+        if is_frida_based_exception(ar):
+            print(f"[-] Frida based error: {ar}")
+            exit(2)
+
         # Get current system exception
         ex_type, ex_value, ex_traceback = sys.exc_info()
         
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import os
+from collections import OrderedDict
+from .pcap_writer import PcapWriter
+
+# Number of (label, client_random) pairs remembered for the deduplication. Keys are usually
+# logged right after the handshake, so a duplicate of an evicted key is very unlikely.
+KEYLOG_CACHE_SIZE = 65536
+# The flushing of the keylog is controlled by the line count and the flush interval
+KEYLOG_BUFFER_SIZE = 1 << 20
+
+
+def get_keylog_key(keylog):
+    """Returns the (label, client_random) of a SSLKEYLOGFILE line or the line itself if it has another format."""
+    fields = keylog.split(" ", 2)
+    if len(fields) == 3:
+        return (fields[0], fields[1])
+    return keylog
+
+
+class KeylogDeduplicator:
+    """Remembers the last max_entries keys (LRU), so that memory stays bounded during long captures."""
+
+    def __init__(self, max_entries=KEYLOG_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.keys = OrderedDict()
+        self.duplicates = 0
+
+
+    def add(self, keylog):
+        """Returns True if the key wasn't seen before."""
+        key = get_keylog_key(keylog)
+        if key in self.keys:
+            self.keys.move_to_end(key)
+            self.duplicates += 1
+            return False
+        self.keys[key] = None
+        if len(self.keys) > self.max_entries:
+            self.keys.popitem(last=False)
+        return True
+
+
+class KeylogWriter:
+    """Writes deduplicated keys in the SSLKEYLOGFILE format (one "<label> <client_random> <secret>" line per key).
+    The lines are buffered and written every flush_lines lines or flush_interval seconds, so Wireshark
+    can still follow the file while it is written.
+    Args:
+    file_name: The keylog file, with a rotation the names are taken from the rotation.
+    rotation: Optional FileRotation of the keylog.
+    flush_lines: Write the buffered lines as soon as this many are pending (1 writes every line immediately).
+    flush_interval: Seconds after which buffered lines are written at the latest.
+    max_entries: Number of keys remembered for the deduplication.
+    log: Called with the errors of the periodic flush.
+    """
+
+    def __init__(self, file_name, rotation=None, flush_lines=64, flush_interval=0.1, max_entries=KEYLOG_CACHE_SIZE, log=print):
+        self.rotation = rotation
+        self.log = log
+        self.flush_lines = flush_lines
+        self.flush_interval = flush_interval
+        self.deduplicator = KeylogDeduplicator(max_entries)
+        self.pending_lines = 0
+        if rotation is not None:
+            file_name = rotation.next_file_name()
+        self.writer = self._open(file_name)
+
+
+    def _open(self, file_name):
+        return PcapWriter(file_name, KEYLOG_BUFFER_SIZE, self.flush_interval, self.log)
+
+
+    @property
+    def name(self):
+        return self.writer.name
+
+
+    @property
+    def closed(self):
+        return self.writer.closed
+
+
+    def write(self, keylog):
+        """Writes the key unless it is a duplicate, returns True if it was written."""
+        if not self.deduplicator.add(keylog):
+            return False
+        if self.rotation is not None and self.rotation.is_due(self.writer.written_bytes):
+            finished_file = self.writer.name
+            self.writer.close()
+            self.writer = self._open(self.rotation.next_file_name())
+            self.pending_lines = 0
+            self.rotation.finished(finished_file)
+        self.writer.write(keylog.encode() + b"\n")
+        self.pending_lines += 1
+        if self.pending_lines >= self.flush_lines:
+            self.flush()
+        return True
+
+
+    def flush(self):
+        self.pending_lines = 0
+        self.writer.flush()
+
+
+    def sync(self):
+        """Writes the buffered lines and forces them onto the disk (fsync)."""
+        self.flush()
+        if not self.writer.closed:
+            try:
+                os.fsync(self.writer.fd)
+            except OSError:
+                pass # e.g. a named pipe
+
+
+    def close(self):
+        if self.writer.closed:
+            return
+        self.sync()
+        self.writer.close()
+        if self.rotation is not None:
+            self.rotation.finished(self.writer.name)
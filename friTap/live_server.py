@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import os
+import socket
+from collections import deque
+from threading import Thread, Condition, Lock
+
+DEFAULT_LISTEN_ADDRESS = "127.0.0.1:0"
+# number of recent records a client gets when it connects
+DEFAULT_REPLAY_RECORDS = 1000
+# bytes queued for a client before it is disconnected
+DEFAULT_CLIENT_BUFFER = 16 * 1024 * 1024
+
+
+def parse_listen_address(address):
+    """Parses the listen address of the live view: unix:<path>, tcp:<host>:<port>, <host>:<port> or <port>.
+    Returns the socket family and the address.
+    """
+    if address.startswith("unix:"):
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError("Unix sockets are not supported on this platform")
+        return socket.AF_UNIX, address[len("unix:"):]
+    if address.startswith("tcp:"):
+        address = address[len("tcp:"):]
+    host, _, port = address.rpartition(":")
+    if not port.isdigit() or int(port) > 65535:
+        raise ValueError(f"invalid listen address {address}")
+    host = host.strip("[]") or "127.0.0.1"
+    return (socket.AF_INET6 if ":" in host else socket.AF_INET), (host, int(port))
+
+
+class LiveClient:
+    """A reader of the live view with a bounded queue of pending data, which is sent by its own thread.
+    Args:
+    client_socket: The connected socket of the client.
+    peer: Description of the client for the output.
+    buffers: The header and the replayed records the client gets first.
+    """
+
+    def __init__(self, client_socket, peer, buffers):
+        self.socket = client_socket
+        self.peer = peer
+        self.pending = deque(buffers)
+        self.pending_bytes = sum(len(buffer) for buffer in buffers)
+        self.condition = Condition()
+        self.closed = False
+        self.thread = Thread(target=self._send_pending, name=f"friTap-live-{peer}")
+        self.thread.daemon = True
+
+
+    def put(self, data, max_bytes):
+        """Queues data for the client. Returns False if the client is gone or max_bytes are already pending."""
+        with self.condition:
+            if self.closed:
+                return False
+            if self.pending_bytes + len(data) > max_bytes:
+                return False
+            self.pending.append(data)
+            self.pending_bytes += len(data)
+            self.condition.notify()
+        return True
+
+
+    def _send_pending(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if not self.pending:
+                    break
+                data = b"".join(self.pending)
+                self.pending.clear()
+                self.pending_bytes = 0
+            try:
+                self.socket.sendall(data)
+            except OSError:
+                break
+        self.disconnect()
+
+
+    def close(self):
+        """Disconnects the client after its pending data was sent."""
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+
+
+    def disconnect(self):
+        """Disconnects the client immediately, a blocked send of its thread fails."""
+        with self.condition:
+            self.closed = True
+            self.pending.clear()
+            self.pending_bytes = 0
+            self.condition.notify()
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.socket.close()
+
+
+class LiveServer:
+    """Distributes the live capture to any number of readers (e.g. Wireshark) over a TCP or Unix socket.
+    It replaces the PcapWriter of the capture: the header blocks (file header, pcapng interfaces and secrets)
+    are kept for the whole capture and the last replay_records records are kept for clients which connect later.
+    Every client has its own bounded queue, a client which can't keep up is disconnected instead of
+    slowing down the capture.
+    Args:
+    address: The listen address (see parse_listen_address).
+    replay_records: Number of recent records a client gets when it connects.
+    client_buffer: Number of bytes queued for a client before it is disconnected.
+    log: Called with the messages about the clients.
+    """
+
+    def __init__(self, address=DEFAULT_LISTEN_ADDRESS, replay_records=DEFAULT_REPLAY_RECORDS, client_buffer=DEFAULT_CLIENT_BUFFER, log=print):
+        self.family, self.address = parse_listen_address(address)
+        self.is_unix = self.family == getattr(socket, "AF_UNIX", None)
+        self.client_buffer = client_buffer
+        self.log = log
+        self.header = []
+        self.records = deque(maxlen=replay_records) if replay_records > 0 else None
+        self.clients = []
+        self.lock = Lock()
+        self.closed = False
+        self.written_bytes = 0
+        self.dropped_clients = 0
+
+        self.socket = socket.socket(self.family, socket.SOCK_STREAM)
+        if not self.is_unix:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind(self.address)
+        self.socket.listen()
+        # the accept loop checks regularly whether the server was closed
+        self.socket.settimeout(0.5)
+        if self.is_unix:
+            self.name = f"unix:{self.address}"
+        else:
+            host, port = self.socket.getsockname()[:2]
+            self.name = f"[{host}]:{port}" if self.family == socket.AF_INET6 else f"{host}:{port}"
+
+        self.accept_thread = Thread(target=self._accept_clients, name="friTap-live-accept")
+        self.accept_thread.daemon = True
+        self.accept_thread.start()
+
+
+    def _accept_clients(self):
+        while not self.closed:
+            try:
+                client_socket, peer = self.socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            client_socket.settimeout(None)
+            peer = f"{peer[0]}:{peer[1]}" if isinstance(peer, tuple) else "unix socket"
+            with self.lock:
+                if self.closed:
+                    client_socket.close()
+                    return
+                # the client gets the header and the replay before any record written after it connected
+                client = LiveClient(client_socket, peer, self.header + list(self.records or ()))
+                self.clients.append(client)
+                client.thread.start()
+            self.log(f"[*] live view client {peer} connected")
+
+
+    def write_header(self, *buffers):
+        """Writes blocks which every client needs to read the records, e.g. the file header or pcapng interfaces."""
+        self._write(b"".join(buffers), True)
+
+
+    def write(self, *buffers):
+        """Writes the given buffers as one record to all clients."""
+        self._write(b"".join(buffers), False)
+
+
+    def _write(self, data, is_header):
+        with self.lock:
+            if self.closed:
+                return
+            self.written_bytes += len(data)
+            if is_header:
+                self.header.append(data)
+            elif self.records is not None:
+                self.records.append(data)
+            slow_clients = [client for client in self.clients if not client.put(data, self.client_buffer)]
+            for client in slow_clients:
+                self.clients.remove(client)
+        for client in slow_clients:
+            if not client.closed:
+                self.dropped_clients += 1
+                self.log(f"[-] live view client {client.peer} can't keep up with the capture, disconnecting it")
+            client.disconnect()
+
+
+    def flush(self):
+        """Every record is queued for the clients immediately."""
+        pass
+
+
+    def close(self):
+        """Stops accepting clients and disconnects the clients after their pending data was sent."""
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            clients = self.clients
+            self.clients = []
+        self.socket.close()
+        for client in clients:
+            client.close()
+        for client in clients:
+            client.thread.join(1.0)
+            if client.thread.is_alive():
+                client.disconnect()
+        if self.is_unix:
+            try:
+                os.unlink(self.address)
+            except OSError:
+                pass
@@ -2,45 +2,68 @@
 # -*- coding: utf-8 -*-
 import ntpath
 from threading import Thread, Event
-import random
 import logging
 import time
 import struct
-# ensure that we only see errors from scapy 
-logging.getLogger("scapy.runtime").setLevel(logging.ERROR)
+import socket
+from .android import Android
+from .pcap_filter import filter_pcap, is_classic_pcap, iter_pcap_stream, FlowFilter, PrerollFilterWriter
+from .pcap_writer import PcapWriter, PlaintextPcapWriter, PcapngPlaintextWriter, CaptureFileWriter, LINKTYPE_ETHERNET, CAPTURE_SNAPLEN
 
-try:
-	from scapy.all import *
-except ImportError:
-	print('[-]: scapy is not installed, please install it by running: pip3 install scapy')
-	exit(2)
+# all protocols, see <linux/if_ether.h>
+ETH_P_ALL = 0x0003
+
+
+def import_scapy():
+    """scapy is only needed by the full capture, importing it takes about a second."""
+    # ensure that we only see errors from scapy 
+    logging.getLogger("scapy.runtime").setLevel(logging.ERROR)
+    try:
+        import scapy.all as scapy
+    except ImportError as e:
+        raise ImportError("scapy is not installed, please install it by running: pip3 install scapy") from e
+    return scapy
 
-from .android import Android
- 
 
 class PCAP:
     
-    def __init__(self,pcap_file_name,SSL_READ,SSL_WRITE, doFullCapture, isMobile, print_debug_infos=False):
+    def __init__(self,pcap_file_name,SSL_READ,SSL_WRITE, doFullCapture, isMobile, print_debug_infos=False, buffer_size=65536, flush_interval=1.0, pcapng=False, rotation=None, raw_frames=False, filter_processes=1, inline_filter=False, preroll=3.0, stream_capture=False, live_server=None, log=print):
         self.pcap_file_name = pcap_file_name
+        # called with the messages about the capture instead of printing them
+        self.log = log
+        # the capture of an Android device is only available on the host when it is streamed
+        self.stream_capture = stream_capture and isMobile
+        self.inline_filter = inline_filter and (not isMobile or self.stream_capture)
+        # the live view writes into the LiveServer instead of a file
+        self.live_server = live_server
+        self.live = live_server is not None
+        self.preroll = preroll
+        self.filter_processes = filter_processes
+        self.raw_frames = raw_frames
+        self.rotation = rotation
+        self.pcapng = pcapng
+        self.pcap_file = None
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
         self.pkt ={}
         self.print_debug_infos = print_debug_infos
             
         self.is_Mobile = isMobile
         
-        # ssl_session[<SSL_SESSION id>] = (<bytes sent by client>,
-        #                                  <bytes sent by server>)
-        self.ssl_sessions = {}
         self.SSL_READ = SSL_READ
         self.SSL_WRITE = SSL_WRITE
         
         if doFullCapture:
+            self.scapy = import_scapy()
             if isMobile:
-                print("[*] capturing whole traffic of target app")
-                self.android_Instance = Android(self.print_debug_infos)
+                self.log("[*] capturing whole traffic of target app")
+                if inline_filter and not self.stream_capture:
+                    self.log("[-] the inline filter is only supported for the streamed capture on Android, the capture is filtered at the end")
+                self.android_Instance = Android(self.print_debug_infos, log=self.log)
             self.full_capture_thread = self.get_instance_of_FullCaptureThread()
             self.full_capture_thread.start()
         else:
-            print("[*] capturing only plaintext data")
+            self.log("[*] capturing only plaintext data")
             self.pcap_file = self.__create_plaintext_pcap()
             
     
@@ -60,7 +83,11 @@ class PCAP:
                 self.tmp_pcap_name = self._get_tmp_pcap_name()
                 
                 self.mobile_pid = -1    
+                self.stream_process = None
                 self.is_Mobile = pcap_class.is_Mobile
+                self.raw_frames = pcap_class.raw_frames
+                self.capture_file = None
+                self.flow_filter = FlowFilter() if pcap_class.inline_filter else None
                 
             
             def _get_pcap_base_name(self):
@@ -81,33 +108,81 @@ class PCAP:
                 
             
             def write_packet_to_pcap(self,packet):
-                wrpcap(self.tmp_pcap_name, packet, append=True)  #appends packet to output file
+                self.capture_file.write_frame(bytes(packet), float(packet.time), pcap_class.scapy.conf.l2types.layer2num.get(type(packet), LINKTYPE_ETHERNET))
+            
+            
+            def open_capture_file(self):
+                # the capture file stays open (and buffered) for the whole capture
+                if self.flow_filter is not None:
+                    # only the traffic of the traced sockets is written, no filtering at the end is needed
+                    return PrerollFilterWriter(CaptureFileWriter(pcap_class.open_writer(self.pcap_file_name)), self.flow_filter, pcap_class.preroll, log=pcap_class.log)
+                if pcap_class.live:
+                    # the clients of the live view get the whole capture
+                    return CaptureFileWriter(pcap_class.live_server)
+                return CaptureFileWriter(pcap_class.open_writer(self.tmp_pcap_name))
             
             
             def full_local_capture(self):
-                self.socket = conf.L2listen(
+                self.capture_file = self.open_capture_file()
+                if self.raw_frames and hasattr(socket, "AF_PACKET"):
+                    self.full_local_raw_capture()
+                    return
+                elif self.raw_frames:
+                    pcap_class.log("[-] capturing raw frames is only supported on Linux, falling back to scapy")
+
+                self.socket = pcap_class.scapy.conf.L2listen(
                     type=ETH_P_ALL
                 )
                 
-                print("[*] doing full local capture")
+                pcap_class.log("[*] doing full local capture")
                 
-                sniff(
+                pcap_class.scapy.sniff(
                     opened_socket=self.socket,
                     prn=self.write_packet_to_pcap,
                     stop_filter=self.stop_capture_thread
                 )
+            
+            
+            def full_local_raw_capture(self):
+                # reads the frames of all interfaces directly from a packet socket without creating scapy packets
+                self.socket = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(ETH_P_ALL))
+                self.socket.settimeout(0.5)
+                
+                pcap_class.log("[*] doing full local capture of raw frames")
+                
+                while not self.stop_capture.is_set():
+                    try:
+                        frame = self.socket.recv(CAPTURE_SNAPLEN)
+                    except socket.timeout:
+                        continue
+                    except OSError:
+                        break # socket closed by pcap_cleanup
+                    self.capture_file.write_frame(frame, time.time())
                 
                 
             def run(self):
-                if self.is_Mobile:
+                if pcap_class.stream_capture:
+                    try:
+                        self.full_mobile_stream_capture()
+                    finally:
+                        if self.capture_file is not None:
+                            self.capture_file.close()
+                elif self.is_Mobile:
                     self.mobile_pid = self.full_mobile_capture()
                 else:
-                    self.full_local_capture()
+                    try:
+                        self.full_local_capture()
+                    finally:
+                        if self.capture_file is not None:
+                            self.capture_file.close()
             
             
             def join(self, timeout=None):
                 self.stop_capture.set()
                 super().join(timeout)
+                if self.capture_file is not None:
+                    # everything captured so far has to be in the file before it gets filtered
+                    self.capture_file.close()
             
             
             def stop_capture_thread(self, packet):
@@ -120,12 +195,38 @@ class PCAP:
                         pcap_class.android_Instance.push_tcpdump_to_device()
                     android_capture_process = pcap_class.android_Instance.run_tcpdump_capture("_"+self._get_pcap_base_name())
                     
-                    print("[*] doing full capture on Android")
+                    pcap_class.log("[*] doing full capture on Android")
                     return android_capture_process
                 else:
-                    print("[-] currently a full capture on iOS is not supported\nAbborting...")
+                    pcap_class.log("[-] currently a full capture on iOS is not supported\nAbborting...")
                     exit(2)
                     
+            def full_mobile_stream_capture(self):
+                android = pcap_class.android_Instance
+                if not android.is_Android():
+                    pcap_class.log("[-] currently a full capture on iOS is not supported")
+                    return
+                if android.is_tcpdump_available == False:
+                    android.push_tcpdump_to_device()
+                self.capture_file = self.open_capture_file()
+                self.stream_process = android.stream_tcpdump_capture()
+                pcap_class.log("[*] doing full capture on Android, streaming it to the host")
+                try:
+                    for frame, t, linktype in iter_pcap_stream(self.stream_process.stdout):
+                        self.capture_file.write_frame(frame, t, linktype)
+                except ValueError:
+                    pcap_class.log("[-] tcpdump on the Android device didn't start, ensure that it is able to run as root")
+            
+            
+            def stop_stream(self, timeout=2.0):
+                """Ends the streamed capture on Android, tcpdump on the device is already interrupted."""
+                super().join(timeout)
+                if self.stream_process is not None and self.stream_process.poll() is None:
+                    self.stream_process.terminate()
+                    self.stream_process.wait()
+                self.join(timeout)
+            
+            
         ## End of inner class FullCaptureThread 
         instance_of_thread_class = FullCaptureThread()
         return instance_of_thread_class
@@ -133,27 +234,37 @@ class PCAP:
      
     def write_pcap_header(self, pcap_file):
         self.pcap_file = pcap_file
-        for writes in (
-            ("=I", 0xa1b2c3d4),     # Magic number
-            ("=H", 2),              # Major version number
-            ("=H", 4),              # Minor version number
-            ("=i", time.timezone),  # GMT to local correction
-            ("=I", 0),              # Accuracy of timestamps
-            ("=I", 65535),          # Max length of captured packets
-            ("=I", 101)):           # Data link type (LINKTYPE_IPV4 = 228) CHANGED TO RAW
-            pcap_file.write(struct.pack(writes[0], writes[1]))
+        if self.pcapng:
+            self.plaintext_writer = PcapngPlaintextWriter(pcap_file, self.SSL_READ, self.log)
+        else:
+            self.plaintext_writer = PlaintextPcapWriter(pcap_file, self.SSL_READ, self.log)
+        self.plaintext_writer.write_header()
         return pcap_file    
     
+    def open_writer(self, file_name):
+        """Returns the writer of the capture, the LiveServer of the live view or a PcapWriter of file_name."""
+        if self.live_server is not None:
+            return self.live_server
+        return PcapWriter(file_name, self.buffer_size, self.flush_interval, self.log)
+    
     def __create_plaintext_pcap(self):
-        pcap_file = open(self.pcap_file_name, "wb", 0)
+        file_name = self.pcap_file_name if self.rotation is None else self.rotation.next_file_name()
+        pcap_file = self.open_writer(file_name)
         pcap_file = self.write_pcap_header(pcap_file)
         return pcap_file
     
+    def rotate(self):
+        """Closes the current plaintext PCAP and continues in the next file of the rotation."""
+        finished_file = self.pcap_file
+        finished_file.close()
+        self.pcap_file = PcapWriter(self.rotation.next_file_name(), self.buffer_size, self.flush_interval, self.log)
+        self.plaintext_writer.start_file(self.pcap_file)
+        self.rotation.finished(finished_file.name)
+
     def log_plaintext_payload(self, ss_family, function, src_addr, src_port,
-                 dst_addr, dst_port, data):
+                 dst_addr, dst_port, data, ssl_session_id=None, pid=None):
         """Writes the captured data to a pcap file.
         Args:
-        pcap_file: The opened pcap file.
         ss_family: The family of the connection, IPv4/IPv6
         function: The function that was intercepted ("SSL_read" or "SSL_write").
         src_addr: The source address of the logged packet.
@@ -161,147 +272,62 @@ class PCAP:
         dst_addr: The destination address of the logged packet.
         dst_port: The destination port of the logged packet.
         data: The decrypted packet data.
+        ssl_session_id: The SSL session id of the packet, added as comment in pcapng files.
+        pid: The process id of the target, every process gets its own interface in pcapng files.
         """
-        
-        t = time.time()
-
-        if function in self.SSL_READ:
-            session_unique_key = str(src_addr) + str(src_port) + \
-                str(dst_addr) + str(dst_port)
-        else:
-            session_unique_key = str(dst_addr) + str(dst_port) + \
-                str(src_addr) + str(src_port)
-        if session_unique_key not in self.ssl_sessions:
-
-            self.ssl_sessions[session_unique_key] = (random.randint(0, 0xFFFFFFFF),
-                                                random.randint(0, 0xFFFFFFFF))
-
-        client_sent, server_sent = self.ssl_sessions[session_unique_key]
-
-        if function in self.SSL_READ:
-            seq, ack = (server_sent, client_sent)
-        else:
-            seq, ack = (client_sent, server_sent)
-        if ss_family == "AF_INET":
-            for writes in (
-                # PCAP record (packet) header
-                # Timestamp seconds
-                ("=I", int(t)),
-                # Timestamp microseconds
-                ("=I", int(t * 1000000) % 1000000),
-                # Number of octets saved
-                ("=I", 40 + len(data)),
-                # Actual length of packet
-                ("=i", 40 + len(data)),
-                # IPv4 header
-                # Version and Header Length
-                (">B", 0x45),
-                # Type of Service
-                (">B", 0),
-                # Total Length
-                (">H", 40 + len(data)),
-                # Identification
-                (">H", 0),
-                # Flags and Fragment Offset
-                (">H", 0x4000),
-                # Time to Live
-                (">B", 0xFF),
-                # Protocol
-                (">B", 6),
-                # Header Checksum
-                (">H", 0),
-                (">I", src_addr),                 # Source Address
-                (">I", dst_addr),                 # Destination Address
-                # TCP header
-                (">H", src_port),                 # Source Port
-                (">H", dst_port),                 # Destination Port
-                (">I", seq),                      # Sequence Number
-                (">I", ack),                      # Acknowledgment Number
-                (">H", 0x5018),                   # Header Length and Flags
-                (">H", 0xFFFF),                   # Window Size
-                (">H", 0),                        # Checksum
-                    (">H", 0)):                       # Urgent Pointer
-                self.pcap_file.write(struct.pack(writes[0], writes[1]))
-
-            self.pcap_file.write(data)
-
-        elif ss_family == "AF_INET6":
-            for writes in (
-                # PCAP record (packet) header
-                # Timestamp seconds
-                ("=I", int(t)),
-                # Timestamp microseconds
-                ("=I", int(t * 1000000) % 1000000),
-                # Number of octets saved
-                ("=I", 60 + len(data)),
-                # Actual length of packet
-                ("=i", 60 + len(data)),
-                # IPv6 header
-                # Version, traffic class and Flow label
-                (">I", 0x60000000),
-                # Payload length
-                (">H", 20 + len(data)),
-                # Next Header
-                (">B", 6),
-                # Hop limit
-                (">B", 0xFF),
-                # Source Address
-                (">16s", bytes.fromhex(src_addr)),
-                # Destination Address
-                (">16s", bytes.fromhex(dst_addr)),
-                # TCP header
-                (">H", src_port),                 # Source Port
-                (">H", dst_port),                 # Destination Port
-                (">I", seq),                      # Sequence Number
-                (">I", ack),                      # Acknowledgment Number
-                (">H", 0x5018),                   # Header Length and Flags
-                (">H", 0xFFFF),                   # Window Size
-                (">H", 0),                        # Checksum
-                    (">H", 0)):                       # Urgent Pointer
-                self.pcap_file.write(struct.pack(writes[0], writes[1]))
-
-            self.pcap_file.write(data)
-
-        else:
-            print("Packet has unknown/unsupported family!")
-
-        if function in self.SSL_READ:
-            server_sent += len(data)
-        else:
-            client_sent += len(data)
-        self.ssl_sessions[session_unique_key] = (client_sent, server_sent)
+        if self.rotation is not None and self.rotation.is_due(self.pcap_file.written_bytes):
+            self.rotate()
+        self.plaintext_writer.log_plaintext_payload(ss_family, function, src_addr, src_port, dst_addr, dst_port, data, ssl_session_id, pid)
+    
+    
+    def close_flow(self, ss_family, function, src_addr, src_port, dst_addr, dst_port, ssl_session_id=None, pid=None):
+        """Ends a flow of the plaintext PCAP with FIN segments and frees its state.
+        Returns the closed flow or None if no data of it was captured.
+        """
+        return self.plaintext_writer.close_flow(ss_family, function, src_addr, src_port, dst_addr, dst_port, ssl_session_id, pid)
+    
+    
+    def log_keylog(self, keylog):
+        """Embeds a keylog line into the capture (only supported by pcapng files)."""
+        if self.rotation is not None and self.rotation.is_due(self.pcap_file.written_bytes):
+            self.rotate()
+        self.plaintext_writer.log_keylog(keylog)
+    
+    
+    def close(self):
+        """Writes the pending packets of the plaintext PCAP and closes it."""
+        if self.pcap_file is not None and not self.pcap_file.closed:
+            self.pcap_file.close()
+            if self.rotation is not None:
+                self.rotation.finished(self.pcap_file.name)
         
     
     # creating a filter for scapy or wiresharks display filter depending on the provided socket_trace_set which looks like 
     @staticmethod
     def get_filter_from_traced_sockets(socket_trace_set):
-        filter = ""
-        first_element = True
-        for length_of_socket_Set in range(len(socket_trace_set)):
-            if len(socket_trace_set) == 1:
-                filter = socket_trace_set.pop() + " or "  + filter
-                break
-            if first_element:
-                first_element = False
-                filter = socket_trace_set.pop()
-            else:
-                filter = socket_trace_set.pop() + " or " + filter
-                
-            length_of_socket_Set = length_of_socket_Set - 1
-            
-        return filter
+        return " or ".join(socket_trace_set)
 
         
     # this function is able to reduce a capture to the traffic from the traced target application by using the information from the socket trace and applying a bpf filter of those traced packets
-    def create_application_traffic_pcap(self,traced_Socket_Set):        
-        bpf_filter = PCAP.get_filter_from_traced_sockets(traced_Socket_Set)
-        print("[*] filtering the capture for the target application this might take a while...")
+    def create_application_traffic_pcap(self, traced_sockets):
+        self.log("[*] filtering the capture for the target application this might take a while...")
+        full_capture_name = "_"+self.pcap_file_name
         try:
-            filtered_capture = sniff(offline="_"+self.pcap_file_name,filter=bpf_filter)
-            wrpcap(self.pcap_file_name,filtered_capture)
+            if is_classic_pcap(full_capture_name):
+                # stream the capture through the compiled filter instead of loading it with scapy
+                filter_pcap(full_capture_name, self.pcap_file_name, traced_sockets.get_clauses(), self.filter_processes, self.log)
+            else:
+                filtered_capture = self.scapy.sniff(offline=full_capture_name,filter=traced_sockets.get_bpf_filter())
+                self.scapy.wrpcap(self.pcap_file_name,filtered_capture)
         except Exception as ar:
-            print(ar)
-        print(f"[*] finished and written to {self.pcap_file_name}")
+            self.log(str(ar))
+        self.log(f"[*] finished and written to {self.pcap_file_name}")
+    
+    
+    def add_traced_flow(self, src_addr, src_port, dst_addr, dst_port):
+        """Lets the inline filter of the full capture write the packets of this socket."""
+        if self.inline_filter:
+            self.full_capture_thread.flow_filter.add_flow(src_addr, src_port, dst_addr, dst_port)
     
     
     def get_pcap_name(self):
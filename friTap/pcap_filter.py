@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming filter for the full capture. The capture is read in chunks and every record is
+matched against a compiled filter, matching records are written unchanged (including the
+original record header) into the output. The memory usage doesn't depend on the size of
+the capture. Only classic pcap files are supported (pcapng captures fall back to scapy).
+"""
+import ipaddress
+import os
+import shutil
+import socket
+import struct
+import time
+from collections import deque
+from threading import Lock
+from concurrent.futures import ProcessPoolExecutor
+
+from .pcap_writer import PcapWriter
+
+PCAP_MAGICS = {
+    b"\xd4\xc3\xb2\xa1": "<", # microsecond timestamps
+    b"\xa1\xb2\xc3\xd4": ">",
+    b"\x4d\x3c\xb2\xa1": "<", # nanosecond timestamps
+    b"\xa1\xb2\x3c\x4d": ">"
+}
+PCAP_NANOSECOND_MAGICS = (b"\x4d\x3c\xb2\xa1", b"\xa1\xb2\x3c\x4d")
+PCAP_HEADER_SIZE = 24
+RECORD_HEADER_SIZE = 16
+CHUNK_SIZE = 1024 * 1024
+
+LINKTYPE_NULL = 0
+LINKTYPE_ETHERNET = 1
+LINKTYPE_RAW = 101
+LINKTYPE_LOOP = 108
+LINKTYPE_LINUX_SLL = 113
+LINKTYPE_IPV4 = 228
+LINKTYPE_IPV6 = 229
+LINKTYPE_LINUX_SLL2 = 276
+ETHERTYPE_IPV4 = 0x0800
+ETHERTYPE_IPV6 = 0x86DD
+ETHERTYPE_VLAN = (0x8100, 0x88A8)
+IPPROTO_TCP = 6
+IPPROTO_UDP = 17
+
+
+def is_classic_pcap(file_name):
+    with open(file_name, "rb") as f:
+        return f.read(4) in PCAP_MAGICS
+
+
+def read_pcap_header(f):
+    header = f.read(PCAP_HEADER_SIZE)
+    if len(header) < PCAP_HEADER_SIZE or header[:4] not in PCAP_MAGICS:
+        raise ValueError("not a classic pcap file")
+    byte_order = PCAP_MAGICS[header[:4]]
+    linktype = struct.unpack(byte_order + "I", header[20:24])[0] & 0x0FFFFFFF
+    return header, byte_order, linktype
+
+
+def iter_records(f, byte_order, start, end, chunk_size=CHUNK_SIZE):
+    """Yields (buffer, offset, length, position) of every record starting in [start, end) of the opened capture.
+    The record (header and frame) is buffer[offset:offset + length] and starts at position
+    in the file. The buffer is only valid until the next record is requested.
+    """
+    record_header = struct.Struct(byte_order + "IIII")
+    f.seek(start)
+    position = start
+    data = b""
+    offset = 0
+    while position < end:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        data = data[offset:] + chunk
+        offset = 0
+        while position < end and offset + RECORD_HEADER_SIZE <= len(data):
+            length = RECORD_HEADER_SIZE + record_header.unpack_from(data, offset)[2]
+            if offset + length > len(data):
+                break
+            yield data, offset, length, position
+            offset += length
+            position += length
+
+
+def iter_pcap_stream(f):
+    """Yields (frame, timestamp, linktype) of every record of a classic pcap read from a stream
+    (e.g. the stdout of "tcpdump -w -") until the stream ends.
+    """
+    header, byte_order, linktype = read_pcap_header(f)
+    record_header = struct.Struct(byte_order + "IIII")
+    resolution = 1e9 if header[:4] in PCAP_NANOSECOND_MAGICS else 1e6
+    while True:
+        data = f.read(RECORD_HEADER_SIZE)
+        if len(data) < RECORD_HEADER_SIZE:
+            return
+        seconds, fraction, captured_length, _ = record_header.unpack(data)
+        frame = f.read(captured_length)
+        if len(frame) < captured_length:
+            return # truncated by the end of the capture
+        yield frame, seconds + fraction / resolution, linktype
+
+
+def record_offsets(file_name, parts):
+    """Splits the capture into parts of about the same size at record boundaries.
+    Only the record headers are read to find the boundaries.
+    """
+    size = os.path.getsize(file_name)
+    with open(file_name, "rb") as f:
+        _, byte_order, _ = read_pcap_header(f)
+        record_header = struct.Struct(byte_order + "IIII")
+        offsets = [PCAP_HEADER_SIZE]
+        for part in range(1, parts):
+            target = PCAP_HEADER_SIZE + (size - PCAP_HEADER_SIZE) * part // parts
+            position = offsets[-1]
+            f.seek(position)
+            while position < target:
+                header = f.read(RECORD_HEADER_SIZE)
+                if len(header) < RECORD_HEADER_SIZE:
+                    position = size
+                    break
+                position += RECORD_HEADER_SIZE + record_header.unpack(header)[2]
+                f.seek(position)
+            offsets.append(min(position, size))
+    offsets.append(size)
+    return offsets
+
+
+class SocketFilter:
+    """Compiled filter matching the packets of the traced sockets.
+    This is the equivalent of the BPF filter "((host C or net N) and (host S) and port P) or ..." built from the traced sockets.
+    Args:
+    clauses: Iterable of (clients, servers, port) tuples of IPv4/IPv6 address and network strings (see TracedSockets.get_clauses).
+    """
+
+    def __init__(self, clauses):
+        self.clauses = {}
+        for clients, servers, port in clauses:
+            self.clauses.setdefault(port, []).append((AddressSet(clients), AddressSet(servers)))
+
+
+    def matches(self, frame, linktype):
+        """Checks the frame (without record header) of a capture with the given linktype."""
+        flow = get_flow_tuple(frame, linktype)
+        if flow is None:
+            return False
+        src, src_port, dst, dst_port = flow
+        for port in (src_port, dst_port):
+            for clients, servers in self.clauses.get(port, ()):
+                if (src in clients or dst in clients) and (src in servers or dst in servers):
+                    return True
+        return False
+
+
+class AddressSet:
+    """IPv4/IPv6 addresses and networks (e.g. "10.0.0.1" or "10.0.0.0/24") which are matched against packed addresses."""
+
+    def __init__(self, addresses):
+        self.hosts = set()
+        self.networks = []
+        for address in addresses:
+            network = ipaddress.ip_network(address)
+            if network.num_addresses == 1:
+                self.hosts.add(network.network_address.packed)
+            else:
+                self.networks.append((network.max_prefixlen // 8, int(network.network_address), int(network.netmask)))
+
+
+    def __contains__(self, packed):
+        if packed in self.hosts:
+            return True
+        if self.networks:
+            value = int.from_bytes(packed, "big")
+            for length, network, netmask in self.networks:
+                if length == len(packed) and value & netmask == network:
+                    return True
+        return False
+
+
+def pack_address(addr):
+    return socket.inet_pton(socket.AF_INET6 if ":" in addr else socket.AF_INET, addr)
+
+
+def get_ip_header(frame, linktype):
+    """Returns (IP version, offset of the IP header) of the frame or None for non IP frames."""
+    if linktype == LINKTYPE_ETHERNET:
+        offset = 12
+        ethertype = (frame[offset] << 8) | frame[offset + 1] if len(frame) >= 14 else 0
+        while ethertype in ETHERTYPE_VLAN and len(frame) >= offset + 6:
+            offset += 4
+            ethertype = (frame[offset] << 8) | frame[offset + 1]
+        ip_offset = offset + 2
+    elif linktype == LINKTYPE_LINUX_SLL:
+        ethertype = (frame[14] << 8) | frame[15] if len(frame) >= 16 else 0
+        ip_offset = 16
+    elif linktype == LINKTYPE_LINUX_SLL2:
+        ethertype = (frame[0] << 8) | frame[1] if len(frame) >= 20 else 0
+        ip_offset = 20
+    elif linktype in (LINKTYPE_RAW, LINKTYPE_IPV4, LINKTYPE_IPV6, 12, 14):
+        ethertype = None
+        ip_offset = 0
+    elif linktype in (LINKTYPE_NULL, LINKTYPE_LOOP):
+        ethertype = None
+        ip_offset = 4
+    else:
+        return None
+
+    if len(frame) <= ip_offset:
+        return None
+    version = frame[ip_offset] >> 4
+    if version == 4 and ethertype in (None, ETHERTYPE_IPV4) and len(frame) >= ip_offset + 20:
+        return 4, ip_offset
+    if version == 6 and ethertype in (None, ETHERTYPE_IPV6) and len(frame) >= ip_offset + 40:
+        return 6, ip_offset
+    return None
+
+
+def get_ip_addresses(frame, linktype):
+    """Returns the (src, dst) addresses of the IP packet inside the frame or None for non IP frames."""
+    ip_header = get_ip_header(frame, linktype)
+    if ip_header is None:
+        return None
+    version, ip_offset = ip_header
+    if version == 4:
+        return (bytes(frame[ip_offset + 12:ip_offset + 16]), bytes(frame[ip_offset + 16:ip_offset + 20]))
+    return (bytes(frame[ip_offset + 8:ip_offset + 24]), bytes(frame[ip_offset + 24:ip_offset + 40]))
+
+
+def get_flow_tuple(frame, linktype):
+    """Returns (src, src_port, dst, dst_port) of the TCP/UDP packet inside the frame or None for other frames.
+    IPv6 extension headers are not followed.
+    """
+    ip_header = get_ip_header(frame, linktype)
+    if ip_header is None:
+        return None
+    version, ip_offset = ip_header
+    if version == 4:
+        protocol = frame[ip_offset + 9]
+        l4_offset = ip_offset + (frame[ip_offset] & 0x0F) * 4
+        src = bytes(frame[ip_offset + 12:ip_offset + 16])
+        dst = bytes(frame[ip_offset + 16:ip_offset + 20])
+    else:
+        protocol = frame[ip_offset + 6]
+        l4_offset = ip_offset + 40
+        src = bytes(frame[ip_offset + 8:ip_offset + 24])
+        dst = bytes(frame[ip_offset + 24:ip_offset + 40])
+    if protocol not in (IPPROTO_TCP, IPPROTO_UDP) or len(frame) < l4_offset + 4:
+        return None
+    src_port = (frame[l4_offset] << 8) | frame[l4_offset + 1]
+    dst_port = (frame[l4_offset + 2] << 8) | frame[l4_offset + 3]
+    return src, src_port, dst, dst_port
+
+
+class FlowFilter:
+    """Filter matching the packets of the traced sockets (both directions of their address/port tuples).
+    Flows can be added from another thread while the capture thread uses the filter.
+    """
+
+    def __init__(self):
+        self.flows = set()
+        self.added = set()
+
+
+    def add_flow(self, src_addr, src_port, dst_addr, dst_port):
+        """Adds the socket with the given IPv4/IPv6 address strings, returns True if it wasn't known before."""
+        key = (src_addr, src_port, dst_addr, dst_port)
+        if key in self.added:
+            return False
+        self.added.add(key)
+        src = pack_address(src_addr)
+        dst = pack_address(dst_addr)
+        self.flows.add((src, src_port, dst, dst_port))
+        self.flows.add((dst, dst_port, src, src_port))
+        return True
+
+
+    def matches(self, frame, linktype):
+        flow = get_flow_tuple(frame, linktype)
+        return flow is not None and flow in self.flows
+
+
+class PrerollFilterWriter:
+    """Writes only the frames of the traced sockets into the capture file.
+    Every frame is held back in a pre-roll buffer for up to preroll seconds (at most max_frames
+    frames) before the filter decides about it. So the packets of a socket which were seen
+    shortly before the socket was reported by the agent (e.g. the TLS handshake) are kept.
+    Args:
+    capture_file: The CaptureFileWriter the matching frames are written to.
+    flow_filter: The FlowFilter which is updated with the traced sockets.
+    preroll: Seconds a frame is held back.
+    max_frames: Maximal number of frames in the pre-roll buffer.
+    log: Called with the statistics of the filter when it is closed.
+    """
+
+    def __init__(self, capture_file, flow_filter, preroll=3.0, max_frames=20000, log=print):
+        self.capture_file = capture_file
+        self.log = log
+        self.flow_filter = flow_filter
+        self.preroll = preroll
+        self.max_frames = max_frames
+        self.pending = deque()
+        self.lock = Lock()
+        self.closed = False
+        self.frames = 0
+        self.matched = 0
+
+
+    def write_frame(self, frame, t, linktype=LINKTYPE_ETHERNET):
+        with self.lock:
+            if self.closed:
+                return
+            self.pending.append((frame, t, linktype))
+            self.frames += 1
+            while len(self.pending) > self.max_frames or t - self.pending[0][1] > self.preroll:
+                self._decide(*self.pending.popleft())
+
+
+    def _decide(self, frame, t, linktype):
+        if self.flow_filter.matches(frame, linktype):
+            self.capture_file.write_frame(frame, t, linktype)
+            self.matched += 1
+
+
+    def close(self):
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            while self.pending:
+                self._decide(*self.pending.popleft())
+        self.capture_file.close()
+        self.log(f"[*] inline filter: {self.matched} of {self.frames} captured packets belong to the traced sockets")
+
+
+def filter_range(input_name, output_name, clauses, start, end, write_header=False, progress=None):
+    """Writes the matching records starting in [start, end) of the capture into output_name.
+    Returns the number of read and matched packets.
+    Args:
+    progress: Optional FilterProgress which is updated every 10000 packets.
+    """
+    pcap_filter = SocketFilter(clauses)
+    output = PcapWriter(output_name, flush_interval=0)
+    packets = 0
+    matched = 0
+    try:
+        with open(input_name, "rb") as f:
+            header, byte_order, linktype = read_pcap_header(f)
+            if write_header:
+                output.write(header)
+            for data, offset, length, position in iter_records(f, byte_order, start, end):
+                packets += 1
+                if pcap_filter.matches(memoryview(data)[offset + RECORD_HEADER_SIZE:offset + length], linktype):
+                    output.write(data[offset:offset + length])
+                    matched += 1
+                if progress is not None and packets % 10000 == 0:
+                    progress.report(position + length, packets, matched)
+    finally:
+        output.close()
+    return packets, matched
+
+
+class FilterProgress:
+    """Reports the progress of the filtering about every second."""
+
+    def __init__(self, total_bytes, log=print):
+        self.total_bytes = max(1, total_bytes)
+        self.log = log
+        self.last_report = time.monotonic()
+
+
+    def report(self, done_bytes, packets, matched, force=False):
+        now = time.monotonic()
+        if force or now - self.last_report >= 1.0:
+            self.last_report = now
+            self.log(f"[*] filtered {min(100, done_bytes * 100 // self.total_bytes)}% of the capture: {matched} of {packets} packets belong to the target application")
+
+
+def filter_pcap(input_name, output_name, clauses, processes=1, log=print):
+    """Streams the classic pcap input_name into output_name keeping only the packets of the traced sockets.
+    With processes > 1 the capture is split at record boundaries into parts which are filtered in parallel.
+    Returns the number of read and matched packets, the progress is reported to log.
+    """
+    clauses = list(clauses)
+    size = os.path.getsize(input_name)
+    progress = FilterProgress(size, log)
+
+    if processes <= 1:
+        packets, matched = filter_range(input_name, output_name, clauses, PCAP_HEADER_SIZE, size, True, progress)
+        progress.report(size, packets, matched, True)
+        return packets, matched
+
+    offsets = record_offsets(input_name, processes)
+    part_names = [f"{output_name}.part{i}" for i in range(len(offsets) - 1)]
+    packets = 0
+    matched = 0
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(filter_range, input_name, part_names[i], clauses, offsets[i], offsets[i + 1], i == 0)
+                   for i in range(len(offsets) - 1)]
+        for i, future in enumerate(futures):
+            part_packets, part_matched = future.result()
+            packets += part_packets
+            matched += part_matched
+            progress.report(offsets[i + 1], packets, matched, True)
+
+    with open(output_name, "wb") as output:
+        for part_name in part_names:
+            with open(part_name, "rb") as part:
+                shutil.copyfileobj(part, output, CHUNK_SIZE)
+            os.remove(part_name)
+    return packets, matched
@@ -0,0 +1,537 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import os
+import random
+import struct
+import time
+from threading import Thread, Event, Lock
+from collections import OrderedDict
+
+# PCAP record header: timestamp seconds, timestamp microseconds, number of octets saved, actual length of packet
+RECORD_HEADER = struct.Struct("=IIII")
+# Total Length of the IPv4 header resp. Payload length of the IPv6 header
+IP_LENGTH = struct.Struct(">H")
+# Sequence and Acknowledgment Number of the TCP header
+TCP_SEQ_ACK = struct.Struct(">II")
+# Header Length and Flags of the TCP header
+TCP_FLAGS = struct.Struct(">H")
+TCP_FLAGS_ACK = 0x5010
+TCP_FLAGS_FIN_ACK = 0x5011
+
+RECORD_HEADER_SIZE = RECORD_HEADER.size
+IPV4_HEADER_SIZE = 20
+IPV6_HEADER_SIZE = 40
+TCP_HEADER_SIZE = 20
+
+LINKTYPE_ETHERNET = 1
+LINKTYPE_RAW = 101
+# snaplen of the full capture, frames of the loopback interface can be larger than 64 KiB
+CAPTURE_SNAPLEN = 262144
+
+# pcapng block types and options (see https://www.ietf.org/archive/id/draft-ietf-opsawg-pcapng-01.html)
+SHB_TYPE = 0x0A0D0D0A
+IDB_TYPE = 0x00000001
+EPB_TYPE = 0x00000006
+DSB_TYPE = 0x0000000A
+BYTE_ORDER_MAGIC = 0x1A2B3C4D
+TLS_KEY_LOG = 0x544C534B
+OPT_ENDOFOPT = 0
+OPT_COMMENT = 1
+SHB_USERAPPL = 4
+IF_NAME = 2
+IF_DESCRIPTION = 3
+# Enhanced Packet Block: block type, block total length, interface id, timestamp (high), timestamp (low), captured length, original length
+EPB_HEADER = struct.Struct("=IIIIIII")
+PADDING = [b"", b"\x00", b"\x00\x00", b"\x00\x00\x00"]
+# Each TLS library gets its own pcapng interface. GnuTLS reports its records as SSL_read/SSL_write
+# and therefore shares the interface with OpenSSL/BoringSSL.
+PCAPNG_LIBRARIES = {
+    "SSL_read": "openssl", "SSL_write": "openssl",
+    "wolfSSL_read": "wolfssl", "wolfSSL_write": "wolfssl",
+    "NSS_read": "nss", "NSS_write": "nss",
+    "readApplicationData": "bouncycastle", "writeApplicationData": "bouncycastle",
+    "mbedtls_ssl_read": "mbedtls", "mbedtls_ssl_write": "mbedtls",
+    "matrixSslReceivedData": "matrixssl", "matrixSslEncodeWritebuf": "matrixssl",
+    "DecryptMessage": "sspi", "EncryptMessage": "sspi",
+    "Full_read": "socket", "Full_write": "socket"
+}
+# Number of the most recent keys which are embedded again at the start of every rotated pcapng file.
+# Keys are logged right after the handshake, so older keys mostly belong to connections which are closed.
+REEMBEDDED_KEYLOGS = 4096
+
+# os.writev() accepts at most IOV_MAX buffers (1024 on Linux and macOS)
+MAX_PENDING_BUFFERS = 512
+
+
+def _tcp_header(src_port, dst_port):
+    return struct.pack(">HHIIHHHH",
+        src_port,                         # Source Port
+        dst_port,                         # Destination Port
+        0,                                # Sequence Number (patched per record)
+        0,                                # Acknowledgment Number (patched per record)
+        0x5018,                           # Header Length and Flags
+        0xFFFF,                           # Window Size
+        0,                                # Checksum
+        0)                                # Urgent Pointer
+
+
+def ipv4_template(src_addr, src_port, dst_addr, dst_port):
+    """Returns the IPv4 and TCP headers of a packet from src to dst.
+    Only the length and seq/ack have to be patched per record (see PlaintextFlow).
+    """
+    return struct.pack(">BBHHHBBH4s4s",
+        0x45,                             # Version and Header Length
+        0,                                # Type of Service
+        0,                                # Total Length (patched per record)
+        0,                                # Identification
+        0x4000,                           # Flags and Fragment Offset
+        0xFF,                             # Time to Live
+        6,                                # Protocol
+        0,                                # Header Checksum
+        src_addr,                         # Source Address
+        dst_addr) + _tcp_header(src_port, dst_port)
+
+
+def ipv6_template(src_addr, src_port, dst_addr, dst_port):
+    """Returns the IPv6 and TCP headers of a packet from src to dst."""
+    return struct.pack(">IHBB16s16s",
+        0x60000000,                       # Version, traffic class and Flow label
+        0,                                # Payload length (patched per record)
+        6,                                # Next Header
+        0xFF,                             # Hop limit
+        src_addr,                         # Source Address
+        dst_addr) + _tcp_header(src_port, dst_port)
+
+
+def raw_address(addr, ss_family):
+    """Converts an address as provided by the agent (IPv4 as int, IPv6 as hex string or raw bytes) into its packed form."""
+    if isinstance(addr, (bytes, bytearray)):
+        return bytes(addr)
+    if ss_family == "AF_INET":
+        return struct.pack(">I", addr)
+    return bytes.fromhex(addr)
+
+
+class PlaintextFlow:
+    """State of a single TLS connection inside the plaintext capture.
+    The headers of both directions are precomputed when the flow is seen for the first time.
+    Each header starts with prefix_size bytes reserved for the record header of the capture
+    format (PCAP record header or pcapng Enhanced Packet Block) which is filled by the writer.
+    """
+    __slots__ = ("client_sent", "server_sent", "read_template", "write_template", "ip_length_offset", "ip_overhead", "seq_offset", "packet_overhead",
+                 "first_seen", "records", "client_bytes", "server_bytes")
+
+    def __init__(self, ss_family, server_addr, server_port, client_addr, client_port, prefix_size=RECORD_HEADER_SIZE):
+        # random initial sequence numbers of the client and the server
+        self.client_sent = random.randint(0, 0xFFFFFFFF)
+        self.server_sent = random.randint(0, 0xFFFFFFFF)
+        if ss_family == "AF_INET":
+            template = ipv4_template
+            self.ip_length_offset = prefix_size + 2
+            self.ip_overhead = IPV4_HEADER_SIZE + TCP_HEADER_SIZE
+            self.seq_offset = prefix_size + IPV4_HEADER_SIZE + 4
+            self.packet_overhead = IPV4_HEADER_SIZE + TCP_HEADER_SIZE
+        else:
+            template = ipv6_template
+            self.ip_length_offset = prefix_size + 4
+            self.ip_overhead = TCP_HEADER_SIZE
+            self.seq_offset = prefix_size + IPV6_HEADER_SIZE + 4
+            self.packet_overhead = IPV6_HEADER_SIZE + TCP_HEADER_SIZE
+        # data read by the client was sent by the server and vice versa
+        prefix = bytes(prefix_size)
+        self.read_template = prefix + template(server_addr, server_port, client_addr, client_port)
+        self.write_template = prefix + template(client_addr, client_port, server_addr, server_port)
+        self.first_seen = time.time()
+        self.records = 0
+        self.client_bytes = 0
+        self.server_bytes = 0
+
+
+    def packet_header(self, is_read, length):
+        """Returns the header of the next record of this flow (with an empty prefix) and advances seq/ack."""
+        self.records += 1
+        if is_read:
+            header = bytearray(self.read_template)
+            seq, ack = self.server_sent, self.client_sent
+            self.server_sent = (self.server_sent + length) & 0xFFFFFFFF
+            self.server_bytes += length
+        else:
+            header = bytearray(self.write_template)
+            seq, ack = self.client_sent, self.server_sent
+            self.client_sent = (self.client_sent + length) & 0xFFFFFFFF
+            self.client_bytes += length
+        IP_LENGTH.pack_into(header, self.ip_length_offset, self.ip_overhead + length)
+        TCP_SEQ_ACK.pack_into(header, self.seq_offset, seq, ack)
+        return header
+
+
+    def close_headers(self):
+        """Returns the headers of the segments which close the flow: a FIN of the client (the traced
+        application), the FIN of the server and the final ACK of the client.
+        """
+        headers = []
+        for is_read, flags in ((False, TCP_FLAGS_FIN_ACK), (True, TCP_FLAGS_FIN_ACK), (False, TCP_FLAGS_ACK)):
+            if is_read:
+                header = bytearray(self.read_template)
+                seq, ack = self.server_sent, self.client_sent
+            else:
+                header = bytearray(self.write_template)
+                seq, ack = self.client_sent, self.server_sent
+            IP_LENGTH.pack_into(header, self.ip_length_offset, self.ip_overhead)
+            TCP_SEQ_ACK.pack_into(header, self.seq_offset, seq, ack)
+            TCP_FLAGS.pack_into(header, self.seq_offset + 8, flags)
+            headers.append((is_read, header))
+            # a FIN occupies one sequence number
+            if flags == TCP_FLAGS_FIN_ACK:
+                if is_read:
+                    self.server_sent = (self.server_sent + 1) & 0xFFFFFFFF
+                else:
+                    self.client_sent = (self.client_sent + 1) & 0xFFFFFFFF
+        return headers
+
+
+    def summary(self):
+        """Returns a short description of the flow, e.g. for the end of the flow."""
+        return (f"{self.records} records, {self.client_bytes} bytes sent, {self.server_bytes} bytes received, "
+                f"{time.time() - self.first_seen:.1f}s")
+
+
+class PcapWriter:
+    """Buffered writer for PCAP files and named pipes.
+    The written buffers are collected and written with a single vectored write (os.writev)
+    as soon as buffer_size bytes are pending, flush_interval seconds elapsed or on close().
+    With a buffer_size of 0 every record is written immediately, still with one write per record.
+    Args:
+    file_name: The PCAP file or named pipe to write to.
+    buffer_size: Number of bytes collected before they are written.
+    flush_interval: Seconds after which pending data is written at the latest (0 disables the timer).
+    log: Called with the errors of the periodic flush.
+    """
+
+    def __init__(self, file_name, buffer_size=65536, flush_interval=1.0, log=print):
+        self.name = file_name
+        self.log = log
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.fd = os.open(file_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        self.pending = []
+        self.pending_bytes = 0
+        self.lock = Lock()
+        self.closed = False
+        self.write_calls = 0
+        self.written_bytes = 0
+
+        self.stop_flush_timer = Event()
+        self.flush_timer = None
+        if buffer_size > 0 and flush_interval > 0:
+            self.flush_timer = Thread(target=self._flush_periodically, name="friTap-pcap-flush")
+            self.flush_timer.daemon = True
+            self.flush_timer.start()
+
+
+    def write(self, *buffers):
+        """Writes the given buffers as one unit, e.g. the header and the payload of a record."""
+        with self.lock:
+            if self.closed:
+                return
+            self.pending.extend(buffers)
+            for buffer in buffers:
+                self.pending_bytes += len(buffer)
+                self.written_bytes += len(buffer)
+            if self.pending_bytes >= self.buffer_size or len(self.pending) >= MAX_PENDING_BUFFERS:
+                self._write_pending()
+
+
+    def write_header(self, *buffers):
+        """Writes blocks which are needed to read the records, e.g. the file header (see LiveServer)."""
+        self.write(*buffers)
+
+
+    def flush(self):
+        with self.lock:
+            if not self.closed:
+                self._write_pending()
+
+
+    def _write_pending(self):
+        if not self.pending:
+            return
+        buffers = self.pending
+        self.pending = []
+        self.pending_bytes = 0
+        if hasattr(os, "writev"):
+            self.write_calls += 1
+            written = os.writev(self.fd, buffers)
+            total = sum(len(buffer) for buffer in buffers)
+            if written < total:
+                # short write (e.g. a full pipe), write the remaining bytes
+                self._write_all(b"".join(buffers)[written:])
+        else:
+            self._write_all(b"".join(buffers))
+
+
+    def _write_all(self, data):
+        view = memoryview(data)
+        while len(view) > 0:
+            self.write_calls += 1
+            view = view[os.write(self.fd, view):]
+
+
+    def _flush_periodically(self):
+        while not self.stop_flush_timer.wait(self.flush_interval):
+            try:
+                self.flush()
+            except OSError as e:
+                self.log(f"[-] Error while writing {self.name}: {e}")
+                return
+
+
+    def close(self):
+        self.stop_flush_timer.set()
+        with self.lock:
+            if self.closed:
+                return
+            try:
+                self._write_pending()
+            finally:
+                self.closed = True
+                os.close(self.fd)
+
+
+def pcap_file_header(linktype, snaplen):
+    return struct.pack("=IHHiIII",
+        0xa1b2c3d4,     # Magic number
+        2,              # Major version number
+        4,              # Minor version number
+        time.timezone,  # GMT to local correction
+        0,              # Accuracy of timestamps
+        snaplen,        # Max length of captured packets
+        linktype)       # Data link type
+
+
+class CaptureFileWriter:
+    """Writes the frames of the full capture into a classic PCAP.
+    The file header is written together with the first frame, so that its link type can be used.
+    Args:
+    writer: The PcapWriter the frames are written to.
+    """
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.header_written = False
+        self.frames = 0
+
+
+    def write_frame(self, frame, t, linktype=LINKTYPE_ETHERNET):
+        if not self.header_written:
+            self.writer.write_header(pcap_file_header(linktype, CAPTURE_SNAPLEN))
+            self.header_written = True
+        length = len(frame)
+        self.writer.write(RECORD_HEADER.pack(int(t), int(t * 1000000) % 1000000, length, length), frame)
+        self.frames += 1
+
+
+    def close(self):
+        self.writer.close()
+
+
+class PlaintextPcapWriter:
+    """Writes the decrypted records as TCP packets into a PCAP (LINKTYPE_RAW).
+    The flows are keyed by their (server address, server port, client address, client port) tuple.
+    Args:
+    writer: The PcapWriter the packets are written to.
+    ssl_read: Names of the functions whose data was received by the target.
+    log: Called with the records which can't be written.
+    """
+    prefix_size = RECORD_HEADER_SIZE
+
+    def __init__(self, writer, ssl_read, log=print):
+        self.writer = writer
+        self.ssl_read = frozenset(ssl_read)
+        self.log = log
+        self.flows = {}
+
+
+    def start_file(self, writer):
+        """Continues the capture in a new file (see FileRotation), the flows keep their seq/ack."""
+        self.writer = writer
+        self.write_header()
+
+
+    def write_header(self):
+        self.writer.write_header(pcap_file_header(LINKTYPE_RAW, 65535))
+
+
+    def get_flow(self, ss_family, is_read, src_addr, src_port, dst_addr, dst_port):
+        if is_read:
+            key = (src_addr, src_port, dst_addr, dst_port)
+        else:
+            key = (dst_addr, dst_port, src_addr, src_port)
+        flow = self.flows.get(key)
+        if flow is None:
+            if ss_family != "AF_INET" and ss_family != "AF_INET6":
+                self.log("Packet has unknown/unsupported family!")
+                return None
+            flow = PlaintextFlow(ss_family, raw_address(key[0], ss_family), key[1], raw_address(key[2], ss_family), key[3], self.prefix_size)
+            self.flows[key] = flow
+        return flow
+
+
+    def log_plaintext_payload(self, ss_family, function, src_addr, src_port, dst_addr, dst_port, data, ssl_session_id=None, pid=None):
+        is_read = function in self.ssl_read
+        flow = self.get_flow(ss_family, is_read, src_addr, src_port, dst_addr, dst_port)
+        if flow is None:
+            return
+        header = flow.packet_header(is_read, len(data))
+        t = time.time()
+        packet_length = flow.packet_overhead + len(data)
+        RECORD_HEADER.pack_into(header, 0, int(t), int(t * 1000000) % 1000000, packet_length, packet_length)
+        self.writer.write(header, data)
+
+
+    def close_flow(self, ss_family, function, src_addr, src_port, dst_addr, dst_port, ssl_session_id=None, pid=None):
+        """Writes the FIN segments of a closed connection and frees its state.
+        Returns the closed PlaintextFlow or None if the flow wasn't part of the capture.
+        """
+        flow = self.pop_flow(ss_family, function in self.ssl_read, src_addr, src_port, dst_addr, dst_port)
+        if flow is None:
+            return None
+        t = time.time()
+        for _, header in flow.close_headers():
+            RECORD_HEADER.pack_into(header, 0, int(t), int(t * 1000000) % 1000000, flow.packet_overhead, flow.packet_overhead)
+            self.writer.write(header)
+        return flow
+
+
+    def pop_flow(self, ss_family, is_read, src_addr, src_port, dst_addr, dst_port):
+        if is_read:
+            key = (src_addr, src_port, dst_addr, dst_port)
+        else:
+            key = (dst_addr, dst_port, src_addr, src_port)
+        flow = self.flows.pop(key, None)
+        if flow is None and not isinstance(key[0], bytes):
+            # the records of binary transport carry their addresses as raw bytes
+            flow = self.flows.pop((raw_address(key[0], ss_family), key[1], raw_address(key[2], ss_family), key[3]), None)
+        return flow
+
+
+    def log_keylog(self, keylog):
+        """Classic PCAPs can't carry key material, the keys are only written into the keylog file."""
+        pass
+
+
+class PcapngPlaintextWriter(PlaintextPcapWriter):
+    """Writes the decrypted records as TCP packets into a pcapng file.
+    Every traced process and TLS library gets its own interface (Interface Description Block),
+    the key material is embedded as Decryption Secrets Blocks and every packet carries its
+    ssl_session_id as comment. All blocks are appended as they arrive, so the file can be
+    streamed to the live view.
+    """
+    prefix_size = EPB_HEADER.size
+
+    def __init__(self, writer, ssl_read, log=print):
+        super().__init__(writer, ssl_read, log)
+        self.interfaces = {}
+        # the most recent keys, they are embedded into every rotated file again
+        self.keylogs = OrderedDict()
+        # the packet comments of the most recent sessions, sessions which aren't closed would otherwise stay forever
+        self.comments = OrderedDict()
+
+
+    def start_file(self, writer):
+        """Every file starts a new section with its own interfaces and the most recent keys (see REEMBEDDED_KEYLOGS)."""
+        self.interfaces = {}
+        super().start_file(writer)
+        if self.keylogs:
+            self.write_secrets("".join(keylog + "\n" for keylog in self.keylogs).encode())
+
+
+    def write_header(self):
+        options = pcapng_option(SHB_USERAPPL, b"friTap") + pcapng_option(OPT_ENDOFOPT, b"")
+        block_length = 28 + len(options)
+        self.writer.write_header(struct.pack("=IIIHHq", SHB_TYPE, block_length, BYTE_ORDER_MAGIC, 1, 0, -1) +
+                          options + struct.pack("=I", block_length))
+
+
+    def get_interface_id(self, function, pid):
+        key = (pid, PCAPNG_LIBRARIES.get(function, "unknown"))
+        interface_id = self.interfaces.get(key)
+        if interface_id is None:
+            interface_id = len(self.interfaces)
+            self.interfaces[key] = interface_id
+            name = key[1] if pid is None else f"{key[1]}-{pid}"
+            description = f"friTap: {key[1]} records" + ("" if pid is None else f" of process {pid}")
+            options = (pcapng_option(IF_NAME, name.encode()) + pcapng_option(IF_DESCRIPTION, description.encode()) +
+                       pcapng_option(OPT_ENDOFOPT, b""))
+            block_length = 20 + len(options)
+            self.writer.write_header(struct.pack("=IIHHI", IDB_TYPE, block_length, 101, 0, 0) +
+                              options + struct.pack("=I", block_length))
+        return interface_id
+
+
+    def get_comment(self, ssl_session_id):
+        comment = self.comments.get(ssl_session_id)
+        if comment is None:
+            comment = pcapng_option(OPT_COMMENT, f"ssl_session_id: {ssl_session_id}".encode()) + pcapng_option(OPT_ENDOFOPT, b"")
+            self.comments[ssl_session_id] = comment
+            if len(self.comments) > REEMBEDDED_KEYLOGS:
+                self.comments.popitem(last=False)
+        else:
+            self.comments.move_to_end(ssl_session_id)
+        return comment
+
+
+    def log_plaintext_payload(self, ss_family, function, src_addr, src_port, dst_addr, dst_port, data, ssl_session_id=None, pid=None):
+        is_read = function in self.ssl_read
+        flow = self.get_flow(ss_family, is_read, src_addr, src_port, dst_addr, dst_port)
+        if flow is None:
+            return
+        interface_id = self.get_interface_id(function, pid)
+        header = flow.packet_header(is_read, len(data))
+        packet_length = flow.packet_overhead + len(data)
+        options = self.get_comment(ssl_session_id) if ssl_session_id else b""
+        padding = -len(data) % 4
+        block_length = EPB_HEADER.size + packet_length + padding + len(options) + 4
+        timestamp = int(time.time() * 1000000)
+        EPB_HEADER.pack_into(header, 0, EPB_TYPE, block_length, interface_id, timestamp >> 32, timestamp & 0xFFFFFFFF, packet_length, packet_length)
+        self.writer.write(header, data, PADDING[padding] + options + struct.pack("=I", block_length))
+
+
+    def close_flow(self, ss_family, function, src_addr, src_port, dst_addr, dst_port, ssl_session_id=None, pid=None):
+        """The FIN of the client carries a summary of the flow as comment."""
+        flow = self.pop_flow(ss_family, function in self.ssl_read, src_addr, src_port, dst_addr, dst_port)
+        if flow is None:
+            return None
+        self.comments.pop(ssl_session_id, None)
+        interface_id = self.get_interface_id(function, pid)
+        summary = f"friTap: connection closed after {flow.summary()}"
+        if ssl_session_id:
+            summary += f", ssl_session_id: {ssl_session_id}"
+        timestamp = int(time.time() * 1000000)
+        for i, (_, header) in enumerate(flow.close_headers()):
+            options = pcapng_option(OPT_COMMENT, summary.encode()) + pcapng_option(OPT_ENDOFOPT, b"") if i == 0 else b""
+            block_length = EPB_HEADER.size + flow.packet_overhead + len(options) + 4
+            EPB_HEADER.pack_into(header, 0, EPB_TYPE, block_length, interface_id, timestamp >> 32, timestamp & 0xFFFFFFFF, flow.packet_overhead, flow.packet_overhead)
+            self.writer.write(header, options + struct.pack("=I", block_length))
+        return flow
+
+
+    def log_keylog(self, keylog):
+        if keylog in self.keylogs:
+            self.keylogs.move_to_end(keylog)
+            return
+        self.keylogs[keylog] = None
+        if len(self.keylogs) > REEMBEDDED_KEYLOGS:
+            self.keylogs.popitem(last=False)
+        self.write_secrets(keylog.encode() + b"\n")
+
+
+    def write_secrets(self, secrets):
+        padding = -len(secrets) % 4
+        block_length = 20 + len(secrets) + padding
+        self.writer.write_header(struct.pack("=IIII", DSB_TYPE, block_length, TLS_KEY_LOG, len(secrets)) +
+                          secrets + PADDING[padding] + struct.pack("=I", block_length))
+
+
+def pcapng_option(code, value):
+    return struct.pack("=HH", code, len(value)) + value + PADDING[-len(value) % 4]
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import os
+import time
+
+
+class FileRotation:
+    """Ring buffer style rotation of an output file.
+    The files are named after the configured file name with an increasing number,
+    e.g. log.pcap becomes log_00001.pcap, log_00002.pcap, ...
+    Args:
+    file_name: The configured name of the output file.
+    max_size: Roll over as soon as a file contains this many bytes (0 disables it).
+    interval: Roll over after this many seconds (0 disables it). The check is done
+        whenever something is written, so quiet periods don't create empty files.
+    max_files: Keep at most this many files, the oldest ones are removed (0 keeps all).
+    callback: Called with the name of every finished file, e.g. to compress or move it.
+        It is called from the writer thread, so long running work should be handed off.
+    log: Called with the messages about the rotated files.
+    """
+
+    def __init__(self, file_name, max_size=0, interval=0, max_files=0, callback=None, log=print):
+        self.root, self.extension = os.path.splitext(file_name)
+        self.max_size = max_size
+        self.interval = interval
+        self.max_files = max_files
+        self.callback = callback
+        self.log = log
+        self.file_number = 0
+        self.file_names = []
+        self.opened_at = 0
+
+
+    def next_file_name(self):
+        """Returns the name of the next file."""
+        self.file_number += 1
+        self.opened_at = time.monotonic()
+        file_name = f"{self.root}_{self.file_number:05d}{self.extension}"
+        self.file_names.append(file_name)
+        return file_name
+
+
+    def is_due(self, written_bytes):
+        if self.max_size > 0 and written_bytes >= self.max_size:
+            return True
+        return self.interval > 0 and time.monotonic() - self.opened_at >= self.interval
+
+
+    def finished(self, file_name):
+        """Hands a finished file to the callback, afterwards the oldest files are removed if more than max_files exist."""
+        self.log(f"[*] rotated {file_name}")
+        if self.callback is not None:
+            try:
+                self.callback(file_name)
+            except Exception as e:
+                self.log(f"[-] Error in rotation callback for {file_name}: {e}")
+        self.prune()
+
+
+    def prune(self):
+        while self.max_files > 0 and len(self.file_names) > self.max_files:
+            try:
+                os.remove(self.file_names.pop(0))
+            except FileNotFoundError:
+                pass # the callback already moved it
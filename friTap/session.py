@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+# The agent requests all options with a single config request during its startup
+CONFIG_REQUEST = "config"
+# Requests of the legacy agent (frida < 16) and the part of the config which is its answer
+STARTUP_REQUESTS = {
+    "experimental": "experimental",
+    "defaultFD": "defaultFD",
+    "transport": "transport",
+    "anti": "antiroot"
+}
+# the last request of the legacy agent, afterwards the hooks are installed
+LAST_STARTUP_REQUEST = "anti"
+# Send by the agent as soon as its hooks are installed
+HOOKS_INSTALLED = "hooks_installed"
+# Send by the agent with the statistics of its hooks when it is unloaded, e.g. because the process exits
+HOOK_STATS = "hook_stats"
+# Seconds a spawned process is kept suspended while waiting for the hooks of its agent
+HOOKS_TIMEOUT = 10
+
+
+class AgentSession:
+    """A traced process with its own friTap agent.
+    Every process owns its script and answers the config request of its agent itself,
+    so that several processes can be instrumented at the same time.
+    Args:
+    process: The frida session of the process.
+    pid: The process id.
+    agent_config: The options of the agent, the answer of the config request.
+    on_message: Called with (message, data, pid) for every message after the startup.
+    log: Called with the console output of the agent (console.log) and the reports.
+    """
+
+    def __init__(self, process, pid, agent_config, on_message, log=print):
+        self.process = process
+        self.pid = pid
+        self.agent_config = agent_config
+        self.on_message_callback = on_message
+        self.log = log
+        self.script = None
+        self.startup = True
+        self.messages = 0
+        self.received_bytes = 0
+        self.detached = False
+        # the hook statistics of the agent are kept for the final report once it is gone
+        self.final_hook_stats = None
+        self.hooks_installed = Event()
+
+
+    def load(self, script_string, runtime="qjs", debug_port=None):
+        self.script = self.process.create_script(script_string, runtime=runtime)
+        if debug_port is not None:
+            self.script.enable_debugger(debug_port)
+        self.script.on("message", self.on_message)
+        self.script.set_log_handler(lambda level, text: self.log(text))
+        self.script.load()
+
+
+    def post(self, message):
+        self.script.post(message)
+
+
+    def on_message(self, message, data):
+        self.messages += 1
+        if data:
+            self.received_bytes += len(data)
+        if self.startup and message["type"] == "send":
+            payload = message["payload"]
+            if payload == CONFIG_REQUEST:
+                self.script.post({'type': CONFIG_REQUEST, 'payload': self.agent_config})
+                self.startup = False
+                return
+            if payload in STARTUP_REQUESTS:
+                reply = STARTUP_REQUESTS[payload]
+                self.script.post({'type': reply, 'payload': self.agent_config[reply]})
+                if payload == LAST_STARTUP_REQUEST:
+                    self.startup = False
+                    # the legacy agent doesn't report its hooks
+                    self.hooks_installed.set()
+                return
+        if message["type"] == "send" and isinstance(message["payload"], dict) and message["payload"].get("contentType") == HOOKS_INSTALLED:
+            self.hooks_installed.set()
+            return
+        if message["type"] == "send" and isinstance(message["payload"], dict) and message["payload"].get("contentType") == HOOK_STATS:
+            self.final_hook_stats = message["payload"]["stats"]
+            return
+        self.on_message_callback(message, data, self.pid)
+
+
+    def wait_for_hooks(self, timeout):
+        """Waits until the agent installed its hooks, returns False after the timeout."""
+        return self.hooks_installed.wait(timeout)
+
+
+    def detach(self):
+        if not self.detached:
+            self.keep_hook_stats()
+            self.detached = True
+            self.process.detach()
+
+
+    def keep_hook_stats(self):
+        """Reads the hook statistics for the final report, it has to be called before friTap detaches."""
+        if not self.detached:
+            stats = self.hook_stats()
+            if stats:
+                self.final_hook_stats = stats
+
+
+    def hook_stats(self):
+        """Returns the hooks of the agent with their number of calls, once the agent is gone the last known ones."""
+        if self.script is None or self.detached:
+            return self.final_hook_stats or []
+        # exports_sync replaces exports since frida 16.2
+        exports = getattr(self.script, "exports_sync", None) or self.script.exports
+        try:
+            return exports.hook_stats()
+        except Exception:
+            return [] # the legacy agent doesn't count its hooks
+
+
+    def report(self, hooks=False):
+        self.log(f"[*] process {self.pid}: {self.messages} messages, {self.received_bytes} bytes")
+        if hooks:
+            for hook in self.hook_stats():
+                self.log(f"[*]   {hook['module']}!{hook['function']} ({hook['address']}): {hook['hits']} calls")
+
+
+class AttachPool:
+    """Attaches to new processes (spawn gating, child gating) on worker threads.
+    Frida delivers the spawn and child events on a single thread, attaching and loading the agent
+    there would instrument the processes one after another while all of them are suspended.
+    Args:
+    attach: Called with (pid, description) on a worker thread, it has to resume the process.
+    workers: Number of processes which are instrumented at the same time.
+    log: Called with the errors of attach.
+    """
+
+    def __init__(self, attach, workers=4, log=print):
+        self.attach = attach
+        self.log = log
+        self.executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="friTap-attach")
+
+
+    def submit(self, pid, description):
+        """Instruments the process on a worker thread, returns False if the pool is already shut down."""
+        try:
+            self.executor.submit(self._run, pid, description)
+        except RuntimeError:
+            return False
+        return True
+
+
+    def _run(self, pid, description):
+        try:
+            self.attach(pid, description)
+        except Exception as e:
+            self.log(f"[-] Unable to instrument {description} with pid {pid}: {e}")
+
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import csv
+import ipaddress
+import json
+import time
+
+# Hosts of the same /24 (IPv4) resp. /64 (IPv6) network are merged into the network
+# as soon as at least this many of them were traced.
+SUBNET_THRESHOLD = 4
+SUBNET_PREFIX = {4: 24, 6: 64}
+
+FLOW_FIELDS = ["client_addr", "client_port", "server_addr", "server_port", "first_seen", "last_seen", "closed", "records"]
+
+
+class TracedFlow:
+    """A traced socket with the time it was seen first and last and when it was closed (None while it is open)."""
+    __slots__ = ("client_addr", "client_port", "server_addr", "server_port", "first_seen", "last_seen", "closed", "records")
+
+    def __init__(self, client_addr, client_port, server_addr, server_port, t):
+        self.client_addr = client_addr
+        self.client_port = client_port
+        self.server_addr = server_addr
+        self.server_port = server_port
+        self.first_seen = t
+        self.last_seen = t
+        self.closed = None
+        self.records = 0
+
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in FLOW_FIELDS}
+
+
+class TracedSockets:
+    """The sockets seen by friTap, keyed by their (client address, client port, server address, server port) tuple.
+    From them compact BPF and Wireshark display filters are generated, which merge the sockets
+    per server and port and by subnet.
+    Args:
+    ssl_read: Names of the functions whose data was received by the target (the source is the server).
+    """
+
+    def __init__(self, ssl_read):
+        self.ssl_read = frozenset(ssl_read)
+        self.flows = {}
+
+
+    def __len__(self):
+        return len(self.flows)
+
+
+    def get_key(self, function, src_addr, src_port, dst_addr, dst_port):
+        if function in self.ssl_read:
+            return (dst_addr, dst_port, src_addr, src_port)
+        return (src_addr, src_port, dst_addr, dst_port)
+
+
+    def add(self, function, src_addr, src_port, dst_addr, dst_port, t=None):
+        """Records a socket of a datalog message, the addresses are IPv4/IPv6 address strings."""
+        key = self.get_key(function, src_addr, src_port, dst_addr, dst_port)
+        if t is None:
+            t = time.time()
+        flow = self.flows.get(key)
+        if flow is None:
+            flow = TracedFlow(key[0], key[1], key[2], key[3], t)
+            self.flows[key] = flow
+        flow.last_seen = t
+        flow.records += 1
+
+
+    def close(self, function, src_addr, src_port, dst_addr, dst_port, t=None):
+        """Marks the socket as closed, it stays part of the filters."""
+        flow = self.flows.get(self.get_key(function, src_addr, src_port, dst_addr, dst_port))
+        if flow is not None:
+            flow.closed = time.time() if t is None else t
+
+
+    def get_clauses(self):
+        """Returns the traced sockets merged into (clients, servers, port) clauses of address/network strings.
+        The clients of every server and port are merged by subnet, servers with the same port and the same
+        clients are merged as well. So a clause only combines clients and servers which talked to each other.
+        """
+        clients_by_server = {}
+        for flow in self.flows.values():
+            clients_by_server.setdefault((flow.server_addr, flow.server_port), set()).add(ipaddress.ip_address(flow.client_addr))
+        servers_by_clients = {}
+        for (server_addr, port), clients in clients_by_server.items():
+            server = ipaddress.ip_address(server_addr)
+            key = (server.version, port, tuple(merge_addresses(clients)))
+            servers_by_clients.setdefault(key, set()).add(server)
+        return [(list(clients), merge_addresses(servers), port) for (_, port, clients), servers in sorted(servers_by_clients.items())]
+
+
+    def get_bpf_filter(self):
+        """Returns a BPF filter for the traffic of the traced sockets."""
+        clauses = []
+        for clients, servers, port in self.get_clauses():
+            clauses.append("(({}) and ({}) and port {})".format(
+                " or ".join(("net {}" if "/" in addr else "host {}").format(addr) for addr in clients),
+                " or ".join(("net {}" if "/" in addr else "host {}").format(addr) for addr in servers), port))
+        return " or ".join(clauses)
+
+
+    def get_display_filter(self):
+        """Returns a Wireshark display filter for the traffic of the traced sockets."""
+        clauses = []
+        for clients, servers, port in self.get_clauses():
+            field = "ipv6.addr" if ":" in servers[0] else "ip.addr"
+            clauses.append("({0} in {{{1}}} && {0} in {{{2}}} && tcp.port == {3})".format(field, " ".join(clients), " ".join(servers), port))
+        return " || ".join(clauses)
+
+
+    def write_flows(self, file_name):
+        """Writes the traced sockets as JSON (*.json) or CSV (every other file name)."""
+        flows = sorted(self.flows.values(), key=lambda flow: flow.first_seen)
+        with open(file_name, "w", newline="") as flow_file:
+            if file_name.endswith(".json"):
+                json.dump([flow.as_dict() for flow in flows], flow_file, indent=2)
+            else:
+                writer = csv.DictWriter(flow_file, fieldnames=FLOW_FIELDS)
+                writer.writeheader()
+                for flow in flows:
+                    writer.writerow(flow.as_dict())
+
+
+def merge_addresses(addresses):
+    """Merges the addresses into their subnets (see SUBNET_THRESHOLD) and returns them as sorted strings."""
+    subnets = {}
+    for address in addresses:
+        subnet = ipaddress.ip_network((address, SUBNET_PREFIX[address.version]), strict=False)
+        subnets.setdefault(subnet, []).append(address)
+    networks = []
+    for subnet, members in subnets.items():
+        if len(members) >= SUBNET_THRESHOLD:
+            networks.append(subnet)
+        else:
+            networks.extend(ipaddress.ip_network(member) for member in members)
+    merged = []
+    for network in ipaddress.collapse_addresses(networks):
+        if network.num_addresses == 1:
+            merged.append(str(network.network_address))
+        else:
+            merged.append(str(network))
+    return merged
@@ -2,28 +2,33 @@
 # -*- coding: utf-8 -*-
 
 import frida
-import tempfile
 import os
 import struct
 import socket
 import pprint
 import signal
-import time
 import json
+from threading import Lock
 from .pcap import PCAP
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, LoggingEventHandler
-
-try:
-    import hexdump  # pylint: disable=g-import-not-at-top
-except ImportError:
-    print("Unable to import hexdump module!")
-    pass
+from .live_server import LiveServer, DEFAULT_LISTEN_ADDRESS, DEFAULT_REPLAY_RECORDS, DEFAULT_CLIENT_BUFFER
+from .writer_queue import WriterQueue, BLOCK
+from .rotation import FileRotation
+from .socket_trace import TracedSockets
+from .keylog import KeylogWriter, KEYLOG_CACHE_SIZE
+from .session import AgentSession, AttachPool, HOOKS_TIMEOUT
 
 
 # here - where we are.
 here = os.path.abspath(os.path.dirname(__file__))
 
+# Function codes of the binary datalog records, this must be in sync with FUNCTION_CODES in agent/util/datalog.ts
+DATALOG_FUNCTIONS = ["SSL_read", "SSL_write", "wolfSSL_read", "wolfSSL_write", "NSS_read", "NSS_write",
+                     "readApplicationData", "writeApplicationData", "mbedtls_ssl_read", "mbedtls_ssl_write",
+                     "matrixSslReceivedData", "matrixSslEncodeWritebuf", "DecryptMessage", "EncryptMessage",
+                     "Full_read", "Full_write"]
+# function code, address family, src port, dst port, src addr, dst addr, session handle, payload length
+DATALOG_HEADER = struct.Struct("!BBHH16s16sII")
+
 # Names of all supported read functions:
 SSL_READ = ["SSL_read", "wolfSSL_read", "readApplicationData", "NSS_read","Full_read"]
 # Names of all supported write functions:
@@ -31,7 +36,7 @@ SSL_WRITE = ["SSL_write", "wolfSSL_write", "writeApplicationData", "NSS_write","
 
 class SSL_Logger():
 
-    def __init__(self, app, pcap_name=None, verbose=False, spawn=False, keylog=False, enable_spawn_gating=False, mobile=False, live=False, environment_file=None, debug_mode=False,full_capture=False, socket_trace=False, host=False, offsets=None, debug_output=False, experimental=False, anti_root=False, payload_modification=False,enable_default_fd=False):
+    def __init__(self, app, pcap_name=None, verbose=False, spawn=False, keylog=False, enable_spawn_gating=False, mobile=False, live=False, environment_file=None, debug_mode=False,full_capture=False, socket_trace=False, host=False, offsets=None, debug_output=False, experimental=False, anti_root=False, payload_modification=False,enable_default_fd=False, batching=False, batch_size=65536, batch_timeout=100, binary_records=False, queue_size=10000, queue_policy=BLOCK, writer_threads=1, pcapng=False, rotate_size=0, rotate_interval=0, rotate_files=0, rotation_callback=None, raw_frames=False, filter_processes=1, inline_filter=False, preroll=3.0, keylog_flush_lines=64, keylog_flush_interval=100, keylog_cache_size=KEYLOG_CACHE_SIZE, attach_workers=4, stream_capture=False, live_listen=DEFAULT_LISTEN_ADDRESS, live_replay=DEFAULT_REPLAY_RECORDS, live_buffer=DEFAULT_CLIENT_BUFFER, record_handler=None, exit_on_cleanup=True, log_callback=None):
         self.debug = debug_mode
         self.anti_root = anti_root
         self.pcap_name = pcap_name
@@ -53,45 +58,72 @@ class SSL_Logger():
         self.payload_modification = payload_modification
         self.enable_default_fd = enable_default_fd
         self.experimental = experimental
-
-        self.tmpdir = None
-        self.filename = ""
-        self.startup = True
+        self.batching = batching
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.binary_records = binary_records
+        self.ssl_session_handles = {}
+        self.queue_size = queue_size
+        self.queue_policy = queue_policy
+        self.writer_threads = writer_threads
+        self.pcapng = pcapng
+        self.rotate_size = rotate_size
+        self.rotate_interval = rotate_interval
+        self.rotate_files = rotate_files
+        self.rotation_callback = rotation_callback
+        self.raw_frames = raw_frames
+        self.filter_processes = filter_processes
+        self.inline_filter = inline_filter
+        self.preroll = preroll
+        self.stream_capture = stream_capture
+        self.live_listen = live_listen
+        self.live_replay = live_replay
+        self.live_buffer = live_buffer
+        # an embedded capture (see friTap/capture.py) gets every message and keeps the interpreter running
+        self.record_handler = record_handler
+        self.exit_on_cleanup = exit_on_cleanup
+        # called with every line of friTap's output instead of printing it, e.g. when friTap is embedded
+        self.log = log_callback if log_callback is not None else print
+        self.keylog_flush_lines = keylog_flush_lines
+        self.keylog_flush_interval = keylog_flush_interval
+        self.keylog_cache_size = keylog_cache_size
+        self.attach_workers = attach_workers
+        self.script_string = None
+        self.sessions = {}
+        self.detached_sessions = []
+        self.sessions_lock = Lock()
+        self.attach_pool = None
+        # set as soon as the capture ends, new processes are resumed without instrumenting them
+        self.stopped = False
+        self.writer_queue = None
+        self.sink_lock = Lock()
+
+        self.live_server = None
 
         self.process = None
         self.device = None
         self.keylog_file = None
+        # only needed for the verbose output of the decrypted records
+        self.hexdump = import_hexdump(self.log) if verbose else None
 
         if frida.__version__ < "16":
             self.frida_agent_script = "_ssl_log_legacy.js"
         else:
             self.frida_agent_script = "_ssl_log.js"
-        print("[***] loading frida script: " + self.frida_agent_script)
+        self.log("[***] loading frida script: " + self.frida_agent_script)
 
-        self.keydump_Set = {*()}
-        self.traced_Socket_Set = {*()}
-        self.traced_scapy_socket_Set = {*()}
+        self.traced_sockets = TracedSockets(SSL_READ)
     
     
     def on_detach(self, reason):
         if reason != "application-requested":
-            print(f"\n[*] Target process stopped: {reason}\n")
+            self.log(f"\n[*] Target process stopped: {reason}\n")
                     
         self.pcap_cleanup(self.full_capture,self.mobile,self.pcap_name)
         self.cleanup(self.live,self.socket_trace,self.full_capture,self.debug)
 
 
-    def temp_fifo(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.filename = os.path.join(self.tmpdir, 'fritap_sharkfin')  # Temporary filename
-        os.mkfifo(self.filename)  # Create FIFO
-        try:
-            return self.filename
-        except OSError as e:
-            print(f'Failed to create FIFO: {e}')
-        
-
-    def on_message(self, message, data):
+    def on_message(self, message, data, pid=None):
         """Callback for errors and messages sent from Frida-injected JavaScript.
         Logs captured packet data received from JavaScript to the console and/or a
         pcap file. See https://www.frida.re/docs/messages/ for more detail on
@@ -100,40 +132,60 @@ class SSL_Logger():
         message: A dictionary containing the message "type" and other fields
             dependent on message type.
         data: The string of captured decrypted data.
+        pid: The process id of the instrumented process which sent the message.
         """
-            
-        if self.startup and message['payload'] == 'experimental':
-            script.post({'type':'experimental', 'payload': self.experimental})
-
-        if self.startup and message['payload'] == 'defaultFD':
-            script.post({'type':'defaultFD', 'payload': self.enable_default_fd})
-        
-        if self.startup and message['payload'] == 'anti':
-            script.post({'type':'antiroot', 'payload': self.anti_root})
-            self.startup = False
-            
-        
         if message["type"] == "error":
-            pprint.pprint(message)
-            os.kill(os.getpid(), signal.SIGTERM)
+            self.log(pprint.pformat(message))
+            if self.exit_on_cleanup:
+                os.kill(os.getpid(), signal.SIGTERM)
             return
         
-        p = message["payload"]
+        self.handle_payload(message["payload"], data, pid)
+
+
+    def handle_payload(self, p, data, pid=None):
         if not "contentType" in p:
             return
+        if p["contentType"] == "datalog_batch":
+            for record, record_data in unpack_datalog_batch(p, data):
+                self.handle_payload(record, record_data, pid)
+            return
+        if p["contentType"] == "datalog_binary":
+            for record, record_data in unpack_binary_datalog(data, self.ssl_session_handles, pid):
+                self.handle_payload(record, record_data, pid)
+            return
+        if p["contentType"] == "session":
+            # every agent numbers its handles itself
+            self.ssl_session_handles[(pid, p["handle"])] = p["ssl_session_id"]
+            return
+        if p["contentType"] == "close" and "session_handle" in p:
+            self.ssl_session_handles.pop((pid, p["session_handle"]), None)
+        p["pid"] = pid
+        writer_queue = self.writer_queue
+        if writer_queue is not None:
+            writer_queue.put(p, data)
+        else:
+            self.write_payload(p, data)
+
+
+    def write_payload(self, p, data):
+        """Writes a single decoded message into the console, PCAP and keylog sinks.
+        This is called by the writer threads of the WriterQueue.
+        """
+        if self.record_handler is not None:
+            self.record_handler(p, data)
         if p["contentType"] == "console":
-            print("[*] " + p["console"])
+            self.log("[*] " + p["console"])
+        if p["contentType"] == "close":
+            self.close_flow(p)
+            return
         if self.debug or self.debug_output:
             if p["contentType"] == "console_dev" and p["console_dev"]:
                 if len(p["console_dev"]) > 3:
-                    print("[***] " + p["console_dev"])
+                    self.log("[***] " + p["console_dev"])
         if self.verbose:
-            if(p["contentType"] == "keylog") and self.keylog:
-                if p["keylog"] not in self.keydump_Set:
-                    print(p["keylog"])
-                    self.keydump_Set.add(p["keylog"])
-                    self.keylog_file.write(p["keylog"] + "\n")
-                    self.keylog_file.flush()    
+            if p["contentType"] == "keylog":
+                pass # printed by the keylog sink below
             elif not data or len(data) == 0:
                 return
             else:
@@ -141,34 +193,27 @@ class SSL_Logger():
                 dst_addr = get_addr_string(p["dst_addr"], p["ss_family"])
                 
                 if self.socket_trace == False and self.full_capture  == False:
-                    print("SSL Session: " + str(p["ssl_session_id"]))
-                if self.full_capture:
-                    scapy_filter = PCAP.get_bpf_filter(src_addr,dst_addr)
-                    self.traced_scapy_socket_Set.add(scapy_filter)
+                    self.log("SSL Session: " + str(p["ssl_session_id"]))
                 if self.socket_trace:
-                    display_filter = PCAP.get_display_filter(src_addr,dst_addr)
-                    self.traced_Socket_Set.add(display_filter)
-                    print("[socket_trace] %s:%d --> %s:%d" % (src_addr, p["src_port"], dst_addr, p["dst_port"]))
+                    self.log("[socket_trace] %s:%d --> %s:%d" % (src_addr, p["src_port"], dst_addr, p["dst_port"]))
                 else:
-                    print("[%s] %s:%d --> %s:%d" % (p["function"], src_addr, p["src_port"], dst_addr, p["dst_port"]))
-                    hexdump.hexdump(data)
-                print()
-        if self.pcap_name and p["contentType"] == "datalog" and self.full_capture == False:
-            self.pcap_obj.log_plaintext_payload(p["ss_family"], p["function"], p["src_addr"],
-                     p["src_port"], p["dst_addr"], p["dst_port"], data)
-        if self.live and p["contentType"] == "datalog" and self.full_capture == False:
-            try:
+                    # a single print keeps the output of multiple writer threads together
+                    self.log("[%s] %s:%d --> %s:%d\n%s" % (p["function"], src_addr, p["src_port"], dst_addr, p["dst_port"], self.hexdump.hexdump(data, result="return")))
+                self.log("")
+        # the live view never blocks, clients which can't keep up are disconnected by the LiveServer
+        if (self.pcap_name or self.live) and p["contentType"] == "datalog" and self.full_capture == False:
+            with self.sink_lock:
                 self.pcap_obj.log_plaintext_payload(p["ss_family"], p["function"], p["src_addr"],
-                         p["src_port"], p["dst_addr"], p["dst_port"], data)
-            except (BrokenPipeError, IOError):
-                self.process.detach()
-                self.cleanup(self.live)
+                         p["src_port"], p["dst_addr"], p["dst_port"], data, p.get("ssl_session_id"), p.get("pid"))
+
+        if self.pcapng and (self.pcap_name or self.live) and p["contentType"] == "keylog" and self.full_capture == False:
+            with self.sink_lock:
+                self.pcap_obj.log_keylog(p["keylog"])
 
         if self.keylog and p["contentType"] == "keylog":
-            if p["keylog"] not in self.keydump_Set:
-                self.keylog_file.write(p["keylog"] + "\n")
-                self.keylog_file.flush()
-                self.keydump_Set.add(p["keylog"])
+            with self.sink_lock:
+                if self.keylog_file.write(p["keylog"]) and self.verbose:
+                    self.log(p["keylog"])
         
         if self.socket_trace or self.full_capture:
             if "src_addr" not in p:
@@ -176,86 +221,209 @@ class SSL_Logger():
             
             src_addr = get_addr_string(p["src_addr"], p["ss_family"])
             dst_addr = get_addr_string(p["dst_addr"], p["ss_family"])
-            if self.socket_trace:
-                display_filter = PCAP.get_display_filter(src_addr,dst_addr)
-                self.traced_Socket_Set.add(display_filter)
-            else:
-                scapy_filter = PCAP.get_bpf_filter(src_addr,dst_addr)
-                self.traced_scapy_socket_Set.add(scapy_filter)
+            with self.sink_lock:
+                self.traced_sockets.add(p["function"], src_addr, p["src_port"], dst_addr, p["dst_port"])
+            if self.full_capture:
+                self.pcap_obj.add_traced_flow(src_addr, p["src_port"], dst_addr, p["dst_port"])
     
 
+    def close_flow(self, p):
+        """Ends a flow after the agent reported that its connection was closed (e.g. by SSL_free or close()).
+        The plaintext PCAP gets the FIN segments of the flow and its state is freed.
+        """
+        flow = None
+        with self.sink_lock:
+            if self.pcap_obj is not None and not self.full_capture:
+                flow = self.pcap_obj.close_flow(p["ss_family"], p["function"], p["src_addr"], p["src_port"],
+                                                p["dst_addr"], p["dst_port"], p.get("ssl_session_id"), p.get("pid"))
+            if self.socket_trace or self.full_capture:
+                src_addr = get_addr_string(p["src_addr"], p["ss_family"])
+                dst_addr = get_addr_string(p["dst_addr"], p["ss_family"])
+                self.traced_sockets.close(p["function"], src_addr, p["src_port"], dst_addr, p["dst_port"])
+        if (self.verbose or self.debug_output) and flow is not None:
+            src_addr = get_addr_string(p["src_addr"], p["ss_family"])
+            dst_addr = get_addr_string(p["dst_addr"], p["ss_family"])
+            self.log("[%s] %s:%d --> %s:%d closed after %s\n" % (p["closed_by"], src_addr, p["src_port"], dst_addr, p["dst_port"], flow.summary()))
+
+
+    def sync_keylog(self):
+        """Forces the logged keys onto the disk, e.g. before the keylog file is copied while the capture continues."""
+        with self.sink_lock:
+            if self.keylog_file is not None:
+                self.keylog_file.sync()
+
+
     def on_child_added(self, child):
-        print(f"[*] Attached to child process with pid {child.pid}")
-        self.instrument(self.device.attach(child.pid))
-        self.device.resume(child.pid)
+        if self.stopped or not self.attach_pool.submit(child.pid, "child process"):
+            self.resume_process(child.pid)
+            return
+        self.log(f"[*] Attached to child process with pid {child.pid}")
 
 
     def on_spawn_added(self, spawn):
-        print(
+        if self.stopped or not self.attach_pool.submit(spawn.pid, spawn.identifier):
+            self.resume_process(spawn.pid)
+            return
+        self.log(
             f"[*] Process spawned with pid {spawn.pid}. Name: {spawn.identifier}")
-        self.instrument(self.device.attach(spawn.pid))
-        self.device.resume(spawn.pid)
+
+
+    def resume_process(self, pid):
+        """Resumes a gated process which isn't instrumented because the capture already ended."""
+        try:
+            self.device.resume(pid)
+        except Exception as e:
+            self.log(f"[-] Unable to resume the process with pid {pid}: {e}")
+
+
+    def release_device(self):
+        """Removes the handlers of friTap from the device and disables the spawn gating, so that an
+        embedded capture leaves the device as it found it. Processes which are reported afterwards
+        are resumed by on_child_added/on_spawn_added.
+        """
+        if self.stopped:
+            return
+        self.stopped = True
+        if self.device is None:
+            return
+        try:
+            self.device.off("child_added", self.on_child_added)
+            if self.enable_spawn_gating:
+                self.device.off("spawn_added", self.on_spawn_added)
+                self.device.disable_spawn_gating()
+        except Exception as e:
+            # the handlers weren't installed yet or the device is gone
+            if self.debug_output:
+                self.log(f"[-] Unable to release the device: {e}")
+
+
+    def attach_process(self, pid, description):
+        """Instruments a new process on a worker thread of the attach pool and resumes it."""
+        try:
+            self.wait_for_hooks(self.instrument(self.device.attach(pid), pid))
+        finally:
+            self.device.resume(pid)
+
+
+    def wait_for_hooks(self, session):
+        if not session.wait_for_hooks(HOOKS_TIMEOUT):
+            self.log(f"[-] The hooks of process {session.pid} weren't installed after {HOOKS_TIMEOUT} seconds, resuming it anyway")
+
+
+    def get_agent_config(self):
+        """Returns the options of the agent, they are send as answer to its config request (see friTap/session.py)."""
+        return {
+            'experimental': self.experimental,
+            'defaultFD': self.enable_default_fd,
+            'transport': {'batch_size': self.batch_size if self.batching else 0, 'batch_timeout': self.batch_timeout, 'binary_records': self.binary_records},
+            'antiroot': self.anti_root
+        }
+
+
+    def on_session_detached(self, session, reason):
+        with self.sessions_lock:
+            self.sessions.pop(session.pid, None)
+            # kept for the final report
+            self.detached_sessions.append(session)
+        # the handles of other processes may be added meanwhile, so a copy of the keys is iterated
+        for key in list(self.ssl_session_handles):
+            if key[0] == session.pid:
+                self.ssl_session_handles.pop(key, None)
+        session.detached = True
+        session.hooks_installed.set()
+        if session.process is not self.process:
+            self.log(f"[*] Process {session.pid} detached: {reason}")
+
+
+    def detach(self):
+        """Detaches from all traced processes, the main process last. The hook statistics are read before."""
+        with self.sessions_lock:
+            sessions = list(self.sessions.values())
+        for session in sessions:
+            session.keep_hook_stats()
+        for session in sessions:
+            if session.process is not self.process:
+                session.detach()
+        self.process.detach()
+
+
+    def report_sessions(self):
+        with self.sessions_lock:
+            sessions = self.detached_sessions + list(self.sessions.values())
+        if len(sessions) > 1 or self.debug_output:
+            for session in sessions:
+                session.report(hooks=self.debug_output)
         
 
-    def instrument(self, process):
-        global script
+    def get_script_string(self):
+        """Returns the agent with the injected offsets, it is only read once for all traced processes."""
+        if self.script_string is None:
+            script_string = get_fritap_frida_script(self.frida_agent_script)
+            if self.offsets_data is not None:
+                self.log(f"[*] applying hooks at offset {self.offsets_data}")
+                script_string = script_string.replace('"{OFFSETS}"', self.offsets_data)
+                # might lead to a malformed package in recent frida versions
+            self.script_string = script_string
+        return self.script_string
+
+
+    def instrument(self, process, pid):
         runtime="qjs"
         debug_port = 1337
         if self.debug:
             if frida.__version__ < "16":
                 process.enable_debugger(debug_port)
-            print("\n[!] running in debug mode")
-            print(f"[!] Chrome Inspector server listening on port {debug_port}")
-            print("[!] Open Chrome with chrome://inspect for debugging\n")
+            self.log("\n[!] running in debug mode")
+            self.log(f"[!] Chrome Inspector server listening on port {debug_port}")
+            self.log("[!] Open Chrome with chrome://inspect for debugging\n")
             runtime="v8"
         
-        script_string = get_fritap_frida_script(self.frida_agent_script)
-        
+        script_string = self.get_script_string()
 
-        if self.offsets_data is not None:
-            print(f"[*] applying hooks at offset {self.offsets_data}")
-            script_string = script_string.replace('"{OFFSETS}"', self.offsets_data)
-            # might lead to a malformed package in recent frida versions
-                    
-
-        script = process.create_script(script_string, runtime=runtime)
-
-        if self.debug and frida.__version__ >= "16":
-            script.enable_debugger(debug_port)
-        script.on("message", self.on_message)
-        script.load()
+        session = AgentSession(process, pid, self.get_agent_config(), self.on_message, self.log)
+        with self.sessions_lock:
+            self.sessions[pid] = session
+        process.on('detached', lambda reason: self.on_session_detached(session, reason))
+        session.load(script_string, runtime, debug_port if self.debug and frida.__version__ >= "16" else None)
         
         
 
         
         #script.post({'type':'readmod', 'payload': '0x440x410x53'})
         if self.payload_modification:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+
+            log = self.log
+
             class ModWatcher(FileSystemEventHandler):
-                def __init__(self, process):
+                def __init__(self, session):
                     
-                    self.process = process
+                    self.session = session
 
                 def on_any_event(self, event):
                     try:
                         if(event.event_type == "modified" and ("readmod" in event.src_path)):
                             with open("./readmod.bin", "rb") as f:
                                 buffer = f.read()
-                                script.post({'type':'readmod', 'payload': buffer.hex()})
+                                self.session.post({'type':'readmod', 'payload': buffer.hex()})
                         elif(event.event_type == "modified" and ("writemod" in event.src_path)):
                             with open("./writemod.bin", "rb") as f:
                                 buffer = f.read()
-                                script.post({'type':'writemod', 'payload': buffer.hex()})
+                                self.session.post({'type':'writemod', 'payload': buffer.hex()})
                     except RuntimeError as e:
-                        print(e)
+                        log(str(e))
                 
                 
 
-            print("Init watcher")
-            event_handler = ModWatcher(process)
+            self.log("Init watcher")
+            event_handler = ModWatcher(session)
             
             observer = Observer()
             observer.schedule(event_handler, os.getcwd())
             observer.start()
+
+        return session
     
 
     def start_fritap_session(self):
@@ -277,17 +445,18 @@ class SSL_Logger():
                     json.load(self.offsets)
                     self.offsets_data = self.offsets
                 except ValueError as e:
-                    print(f"Log error, defaulting to auto-detection: {e}")
+                    self.log(f"Log error, defaulting to auto-detection: {e}")
 
+        self.attach_pool = AttachPool(self.attach_process, self.attach_workers, self.log)
         self.device.on("child_added", self.on_child_added)
         if self.enable_spawn_gating:
             self.device.enable_spawn_gating()
             self.device.on("spawn_added", self.on_spawn_added)
         if self.spawn:
-            print("spawning "+ self.target_app)
+            self.log("spawning "+ self.target_app)
             
             if self.pcap_name:
-                self.pcap_obj =  PCAP(self.pcap_name,SSL_READ,SSL_WRITE,self.full_capture, self.mobile,self.debug)
+                self.pcap_obj =  PCAP(self.pcap_name,SSL_READ,SSL_WRITE,self.full_capture, self.mobile,self.debug, pcapng=self.pcapng, rotation=self.get_file_rotation(self.pcap_name), raw_frames=self.raw_frames, filter_processes=self.filter_processes, inline_filter=self.inline_filter, preroll=self.preroll, stream_capture=self.stream_capture, log=self.log)
                 
             if self.mobile or self.host:
                 pid = self.device.spawn(self.target_app)
@@ -297,53 +466,99 @@ class SSL_Logger():
                     with open(self.environment_file) as json_env_file:
                         used_env = json.load(json_env_file)
                 pid = self.device.spawn(self.target_app.split(" "),env=used_env)
-                self.device.resume(pid)
-                time.sleep(1) # without it Java.perform silently fails
             self.process = self.device.attach(pid)
         else:
             if self.pcap_name:
-                self.pcap_obj =  PCAP(self.pcap_name,SSL_READ,SSL_WRITE,self.full_capture, self.mobile,self.debug_mode)
-            self.process = self.device.attach(int(self.target_app) if self.target_app.isnumeric() else self.target_app)
+                self.pcap_obj =  PCAP(self.pcap_name,SSL_READ,SSL_WRITE,self.full_capture, self.mobile,self.debug, pcapng=self.pcapng, rotation=self.get_file_rotation(self.pcap_name), raw_frames=self.raw_frames, filter_processes=self.filter_processes, inline_filter=self.inline_filter, preroll=self.preroll, stream_capture=self.stream_capture, log=self.log)
+            if self.target_app.isnumeric():
+                pid = int(self.target_app)
+            else:
+                pid = self.device.get_process(self.target_app).pid
+            self.process = self.device.attach(pid)
 
         if self.live:
             if self.pcap_name:
-                print("[*] YOU ARE TRYING TO WRITE A PCAP AND HAVING A LIVE VIEW\nTHIS IS NOT SUPPORTED!\nWHEN YOU DO A LIVE VIEW YOU CAN SAFE YOUR CAPUTRE WIHT WIRESHARK.")
-            fifo_file = self.temp_fifo()
-            print(f'[*] friTap live view on Wireshark')
-            print(f'[*] Created named pipe for Wireshark live view to {fifo_file}')
-            print(
-                f'[*] Now open this named pipe with Wireshark in another terminal: sudo wireshark -k -i {fifo_file}')
-            print(f'[*] friTap will continue after the named pipe is ready....\n')
-            self.pcap_obj =  PCAP(fifo_file,SSL_READ,SSL_WRITE,self.full_capture, self.mobile,self.debug)
+                self.log("[*] YOU ARE TRYING TO WRITE A PCAP AND HAVING A LIVE VIEW\nTHIS IS NOT SUPPORTED!\nWHEN YOU DO A LIVE VIEW YOU CAN SAFE YOUR CAPUTRE WIHT WIRESHARK.")
+            self.live_server = LiveServer(self.live_listen, self.live_replay, self.live_buffer, self.log)
+            self.log(f'[*] friTap live view on Wireshark')
+            self.log(f'[*] Serving the live view on {self.live_server.name} (clients joining later get the last {self.live_replay} records)')
+            if self.live_server.is_unix:
+                self.log(f'[*] Now open it with Wireshark in another terminal: socat -u UNIX-CONNECT:{self.live_server.address} - | wireshark -k -i -')
+            else:
+                self.log(f'[*] Now open it with Wireshark in another terminal: wireshark -k -i TCP@{self.live_server.name}')
+            self.pcap_obj =  PCAP(self.live_server.name,SSL_READ,SSL_WRITE,self.full_capture, self.mobile,self.debug, pcapng=self.pcapng, raw_frames=self.raw_frames, inline_filter=self.inline_filter, preroll=self.preroll, stream_capture=self.stream_capture, live_server=self.live_server, log=self.log)
             
 
         if self.keylog:
-            self.keylog_file = open(self.keylog, "w")
+            self.keylog_file = KeylogWriter(self.keylog, self.get_file_rotation(self.keylog), self.keylog_flush_lines,
+                                            self.keylog_flush_interval / 1000, self.keylog_cache_size, self.log)
 
+        self.writer_queue = WriterQueue(self.write_payload, self.queue_size, self.queue_policy, self.writer_threads, self.log)
+        self.writer_queue.start()
 
-        self.instrument(self.process)
+        session = self.instrument(self.process, pid)
+        if self.enable_spawn_gating:
+            # forked helper processes are reported by child_added and instrumented by the attach pool
+            self.process.enable_child_gating()
 
 
 
         if self.pcap_name and self.full_capture:
-            print(f'[*] Logging pcap to {self.pcap_name}')
+            self.log(f'[*] Logging pcap to {self.pcap_name}')
         if self.pcap_name and self.full_capture == False:
-            print(f'[*] Logging TLS plaintext as pcap to {self.pcap_name}')
+            self.log(f'[*] Logging TLS plaintext as pcap to {self.pcap_name}')
         if self.keylog:
-            print(f'[*] Logging keylog file to {self.keylog}')
+            self.log(f'[*] Logging keylog file to {self.keylog}')
             
         self.process.on('detached', self.on_detach)
 
         if self.spawn:
+            # the spawned process stays suspended until the agent installed its hooks
+            self.wait_for_hooks(session)
             self.device.resume(pid)
 
         return self.process
     
 
+    def get_file_rotation(self, file_name):
+        if self.rotate_size <= 0 and self.rotate_interval <= 0:
+            return None
+        return FileRotation(file_name, self.rotate_size, self.rotate_interval, self.rotate_files, self.rotation_callback, self.log)
+
+
+    def stop_writer_queue(self):
+        """Writes all pending messages into the sinks, reports the queue and process statistics and closes the plaintext PCAP and keylog."""
+        writer_queue = self.writer_queue
+        if writer_queue is None:
+            return
+        self.writer_queue = None
+        if self.attach_pool is not None:
+            self.attach_pool.shutdown()
+        writer_queue.close()
+        writer_queue.report()
+        self.report_sessions()
+        if self.pcap_obj is not None and not self.full_capture:
+            try:
+                self.pcap_obj.close()
+            except OSError as e:
+                self.log(f"[-] Error while writing the pcap: {e}")
+        if self.keylog_file is not None:
+            self.keylog_file.close()
+
+
     def pcap_cleanup(self, is_full_capture, is_mobile, pcap_name):
+        self.release_device()
+        self.stop_writer_queue()
         if is_full_capture and self.pcap_obj is not None:
                 capture_type = "local"
-                self.pcap_obj.full_capture_thread.join(2.0)
+                if self.pcap_obj.stream_capture:
+                    capture_type = "mobile"
+                    # interrupting tcpdump on the device ends the stream
+                    self.pcap_obj.android_Instance.send_ctrlC_over_adb()
+                    self.pcap_obj.full_capture_thread.stop_stream()
+                    self.pcap_obj.android_Instance.close()
+                else:
+                    self.pcap_obj.full_capture_thread.join(2.0)
                 if self.pcap_obj.full_capture_thread.is_alive() and is_mobile == False:
                     self.pcap_obj.full_capture_thread.socket.close()
                 if self.pcap_obj.full_capture_thread.mobile_pid != -1:
@@ -351,37 +566,52 @@ class SSL_Logger():
                     self.pcap_obj.full_capture_thread.mobile_pid.terminate()
                     self.pcap_obj.android_Instance.send_ctrlC_over_adb()
                     self.pcap_obj.android_Instance.pull_pcap_from_device()
-                print(f"[*] full {capture_type} capture safed to _{pcap_name}")
+                    self.pcap_obj.android_Instance.close()
+                if self.pcap_obj.live:
+                    self.log(f"[*] full {capture_type} capture was only shown live in Wireshark")
+                elif self.pcap_obj.inline_filter:
+                    self.log(f"[*] traffic of the traced sockets safed to {pcap_name}")
+                else:
+                    self.log(f"[*] full {capture_type} capture safed to _{pcap_name}")
                 if self.keylog_file is None:
-                    print(f"[*] remember that the full capture won't contain any decrypted TLS traffic.")
+                    self.log(f"[*] remember that the full capture won't contain any decrypted TLS traffic.")
                 else:
-                    print(f"[*] remember that the full capture won't contain any decrypted TLS traffic. In order to decrypt it use the logged keys from {self.keylog_file.name}")
+                    self.log(f"[*] remember that the full capture won't contain any decrypted TLS traffic. In order to decrypt it use the logged keys from {self.keylog_file.name}")
     
 
     def cleanup(self, live=False, socket_trace=False, full_capture=False, debug_output=False, debug=False):
-        if live:
-            os.unlink(self.filename)  # Remove file
-            os.rmdir(self.tmpdir)  # Remove directory
+        self.release_device()
+        self.stop_writer_queue()
+        if live and self.live_server is not None:
+            self.live_server.close()
         if type(socket_trace) is str:
-            print(f"[*] Write traced sockets into {socket_trace}")
-            self.write_socket_trace(socket_trace)
+            self.log(f"[*] Write traced sockets into {socket_trace}")
+            write_socket_trace(self.traced_sockets, socket_trace)
         if socket_trace == True:
-            print("[*] Traced sockets")
-            print(PCAP.get_filter_from_traced_sockets(self.traced_Socket_Set))
+            self.log("[*] Traced sockets")
+            self.log(self.traced_sockets.get_display_filter())
         
-        if full_capture and len(self.traced_scapy_socket_Set) > 0:
+        if full_capture and live:
+            pass # the full capture was only shown in Wireshark
+        elif full_capture and self.pcap_obj is not None and self.pcap_obj.inline_filter:
+            if len(self.traced_sockets) < 1:
+                self.log(f"[-] friTap was unable to indentify the used sockets.\n[-] The resulting PCAP is empty.")
+        elif full_capture and len(self.traced_sockets) > 0:
             if debug_output or debug:
-                print("[*] traced sockets: "+str(self.traced_scapy_socket_Set))
+                self.log("[*] traced sockets: "+self.traced_sockets.get_bpf_filter())
 
-            self.pcap_obj.create_application_traffic_pcap(self.traced_scapy_socket_Set)
-        elif full_capture and len(self.traced_scapy_socket_Set) < 1:
-            print(f"[-] friTap was unable to indentify the used sockets.\n[-] The resulting PCAP will contain all trafic from the device.")
+            self.pcap_obj.create_application_traffic_pcap(self.traced_sockets)
+        elif full_capture and len(self.traced_sockets) < 1:
+            self.log(f"[-] friTap was unable to indentify the used sockets.\n[-] The resulting PCAP will contain all trafic from the device.")
             
-        print("\n\nThx for using friTap\nHave a great day\n")
-        os._exit(0)
+        if self.exit_on_cleanup:
+            self.log("\n\nThx for using friTap\nHave a great day\n")
+            os._exit(0)
 
   
 def get_addr_string(socket_addr,ss_family):
+    if isinstance(socket_addr, bytes): # raw address from a binary datalog record
+        return socket.inet_ntop(socket.AF_INET if ss_family == "AF_INET" else socket.AF_INET6, socket_addr)
     if ss_family == "AF_INET":
         return  socket.inet_ntop(socket.AF_INET, struct.pack(">I", socket_addr))
     else: # this should only be AF_INET6
@@ -389,13 +619,73 @@ def get_addr_string(socket_addr,ss_family):
         return socket.inet_ntop(socket.AF_INET6, struct.pack(">16s", raw_addr))
     
 
+def unpack_datalog_batch(batch, data):
+    """Splits a batch of datalog records send by the agent into the single records.
+    Args:
+    batch: The "datalog_batch" payload containing the list of "records". Each record
+        carries the "length" of its part of the concatenated data.
+    data: The concatenated decrypted data of all records.
+    """
+    offset = 0
+    for record in batch["records"]:
+        length = record["length"]
+        yield record, data[offset:offset + length]
+        offset += length
+
+
+def unpack_binary_datalog(data, ssl_session_handles, pid=None):
+    """Decodes the binary datalog records send by the agent (see agent/util/datalog.ts).
+    The records are returned in the same form as the JSON based ones, except that the
+    addresses are kept as raw bytes.
+    Args:
+    data: One or more concatenated binary records.
+    ssl_session_handles: Mapping of (pid, session handle) to the announced SSL session ids.
+    pid: The process id of the agent which send the records.
+    """
+    offset = 0
+    header_size = DATALOG_HEADER.size
+    while offset < len(data):
+        function_code, family, src_port, dst_port, src_addr, dst_addr, handle, length = DATALOG_HEADER.unpack_from(data, offset)
+        offset += header_size
+        if family == 4:
+            ss_family = "AF_INET"
+            src_addr = src_addr[:4]
+            dst_addr = dst_addr[:4]
+        else:
+            ss_family = "AF_INET6"
+        record = {
+            "contentType": "datalog",
+            "function": DATALOG_FUNCTIONS[function_code],
+            "ss_family": ss_family,
+            "src_addr": src_addr,
+            "src_port": src_port,
+            "dst_addr": dst_addr,
+            "dst_port": dst_port,
+            "ssl_session_id": ssl_session_handles.get((pid, handle), handle)
+        }
+        yield record, data[offset:offset + length]
+        offset += length
+
+
+def import_hexdump(log=print):
+    try:
+        import hexdump  # pylint: disable=g-import-not-at-top
+        return hexdump
+    except ImportError:
+        log("Unable to import hexdump module!")
+        return None
+
+
 def get_fritap_frida_script(frida_agent_script):
     with open(os.path.join(here, frida_agent_script), encoding='utf8', newline='\n') as f:
             script_string = f.read()
             return script_string
             
 
-def write_socket_trace(self, socket_trace_name):
-    with open(socket_trace_name, 'a') as trace_file:
-        trace_file.write(PCAP.get_filter_from_traced_sockets(self.traced_Socket_Set) + '\n')
+def write_socket_trace(traced_sockets, socket_trace_name):
+    if socket_trace_name.endswith(".json") or socket_trace_name.endswith(".csv"):
+        traced_sockets.write_flows(socket_trace_name)
+    else:
+        with open(socket_trace_name, 'a') as trace_file:
+            trace_file.write(traced_sockets.get_display_filter() + '\n')
    
\ No newline at end of file
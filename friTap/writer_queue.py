@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from threading import Thread, Condition, current_thread
+from collections import deque
+
+# Overflow policies of the WriterQueue
+BLOCK = "block"
+DROP_OLDEST = "drop-oldest"
+DROP = "drop"
+OVERFLOW_POLICIES = [BLOCK, DROP_OLDEST, DROP]
+
+
+class WriterQueue:
+    """Bounded queue between Frida's message dispatch thread and the writer threads.
+    The dispatch thread only enqueues the decoded messages while the writer threads
+    pass them to the handler which writes them into the PCAP, keylog and console sinks.
+    If the queue is full the overflow policy decides what happens:
+        block:       the dispatch thread waits until a writer made room
+        drop-oldest: the oldest queued record is dropped
+        drop:        the new record is dropped
+    Only decrypted records ("datalog") are dropped, keys, close and console messages are
+    always enqueued, even if the queue is full. Dropped records are counted and reported
+    when the capture ends.
+    Every writer thread has its own part of the queue. The messages of a connection are
+    always handled by the same writer, so their order is kept (e.g. no data after the close
+    of a flow), all other messages (keys, console) are handled by the first writer.
+    Args:
+    handler: Function called by the writer threads for every queued (payload, data) tuple.
+    max_size: Maximal number of queued messages.
+    overflow_policy: One of OVERFLOW_POLICIES.
+    writer_threads: Number of writer threads.
+    log: Called with the errors of the handler and the report.
+    """
+
+    def __init__(self, handler, max_size=10000, overflow_policy=BLOCK, writer_threads=1, log=print):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy: {overflow_policy}")
+        self.handler = handler
+        self.log = log
+        self.max_size = max(1, max_size)
+        self.overflow_policy = overflow_policy
+        self.queues = [deque() for i in range(max(1, writer_threads))]
+        self.size = 0
+        self.condition = Condition()
+        self.closed = False
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+        self.writers = []
+        for i, queue in enumerate(self.queues):
+            writer = Thread(target=self._drain, args=(queue,), name=f"friTap-writer-{i}")
+            writer.daemon = True
+            self.writers.append(writer)
+
+
+    def start(self):
+        for writer in self.writers:
+            writer.start()
+
+
+    def get_queue(self, payload):
+        if len(self.queues) == 1 or "src_port" not in payload:
+            return self.queues[0]
+        # both directions and the close message of a connection have the same ports
+        ports = (payload["src_port"], payload["dst_port"])
+        return self.queues[hash((payload.get("pid"), min(ports), max(ports))) % len(self.queues)]
+
+
+    def drop_oldest_record(self, queue):
+        """Drops the oldest queued record, preferably of the given queue. Returns False if only other messages are queued."""
+        for candidate in [queue] + self.queues:
+            for i, (payload, data) in enumerate(candidate):
+                if payload["contentType"] == "datalog":
+                    del candidate[i]
+                    self.size -= 1
+                    return True
+        return False
+
+
+    def put(self, payload, data):
+        queue = self.get_queue(payload)
+        with self.condition:
+            if self.closed:
+                self.dropped += 1
+                return
+            if self.size >= self.max_size:
+                droppable = payload["contentType"] == "datalog"
+                if self.overflow_policy == DROP:
+                    if droppable:
+                        self.dropped += 1
+                        return
+                elif self.overflow_policy == DROP_OLDEST:
+                    if self.drop_oldest_record(queue):
+                        self.dropped += 1
+                    elif droppable:
+                        self.dropped += 1
+                        return
+                else:
+                    while self.size >= self.max_size and not self.closed:
+                        self.condition.wait()
+            queue.append((payload, data))
+            self.size += 1
+            self.enqueued += 1
+            if self.size > self.max_depth:
+                self.max_depth = self.size
+            self.condition.notify_all()
+
+
+    def depth(self):
+        with self.condition:
+            return self.size
+
+
+    def _drain(self, queue):
+        while True:
+            with self.condition:
+                while len(queue) == 0 and not self.closed:
+                    self.condition.wait()
+                if len(queue) == 0:
+                    return
+                payload, data = queue.popleft()
+                self.size -= 1
+                self.condition.notify_all()
+            try:
+                self.handler(payload, data)
+            except Exception as e:
+                self.log(f"[-] Error while writing message: {e}")
+
+
+    def close(self, timeout=None):
+        """Stops accepting new messages and waits until the writer threads drained the queue.
+        When called from a writer thread (e.g. because a sink broke) it doesn't wait for itself,
+        its remaining messages are written after its handler returned.
+        """
+        with self.condition:
+            if self.closed:
+                return
+            self.closed = True
+            self.condition.notify_all()
+        for writer in self.writers:
+            if writer is not current_thread() and writer.is_alive():
+                writer.join(timeout)
+
+
+    def report(self):
+        self.log(f"[*] writer queue: {self.enqueued} messages queued, max. depth {self.max_depth}/{self.max_size}, {self.depth()} left, {self.dropped} dropped ({self.overflow_policy})")
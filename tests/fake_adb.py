@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""A stand-in for adb which runs the shell commands of the "device" in a local sh.
+It is used with FRITAP_ADB or the adb argument of AdbShell/Android.
+Environment:
+FAKE_ADB_DEVICE: Directory with the binaries of the device (su, getprop, tcpdump, ...), put in front of the PATH.
+FAKE_ADB_LOG: File to which every invocation of adb is appended.
+FAKE_ADB_LEGACY: If set, the device doesn't support the shell protocol v2 (before Android 7):
+                 "shell -T" fails, the exit status is always 0 and the output uses \\r\\n.
+"""
+import os
+import subprocess
+import sys
+
+
+def main(args):
+    log = os.environ.get("FAKE_ADB_LOG")
+    if log:
+        with open(log, "a") as f:
+            f.write(" ".join(args) + "\n")
+    if args[:1] == ["-s"]:
+        args = args[2:]
+    legacy = bool(os.environ.get("FAKE_ADB_LEGACY"))
+    env = dict(os.environ, PATH=os.environ.get("FAKE_ADB_DEVICE", "") + os.pathsep + os.environ.get("PATH", ""))
+
+    if args[:1] == ["devices"]:
+        print("List of devices attached\nemulator-5554\tdevice\n")
+        return 0
+    if args[:1] == ["features"]:
+        print("cmd\nstat_v2" if legacy else "shell_v2\ncmd\nstat_v2")
+        return 0
+    if args[:1] in (["shell"], ["exec-out"]):
+        args = args[1:]
+        if args[:1] == ["-T"]:
+            if legacy:
+                print("error: target doesn't support the shell protocol v2", file=sys.stderr)
+                return 1
+            args = args[1:]
+        if legacy:
+            # the legacy shell uses a pty
+            result = subprocess.run(["sh", "-c", " ".join(args)] if args else ["sh"], env=env, stdout=subprocess.PIPE)
+            sys.stdout.buffer.write(result.stdout.replace(b"\n", b"\r\n"))
+            return 0
+        # exec, so that the shell replaces this process like the device shell ends the adb connection
+        os.execvpe("sh", ["sh", "-c", " ".join(args)] if args else ["sh"], env)
+    print(f"fake_adb: unsupported command {' '.join(args)}", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests of the adb layer against the stand-in fake_adb.py, run with: python3 -m pytest tests"""
+import os
+import stat
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from friTap.adb import AdbShell, SHELL_CLOSED
+from friTap.android import Android
+
+FAKE_ADB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_adb.py")
+
+# binaries of the fake device, every call is appended to $FAKE_ADB_DEVICE/calls
+MAGISK_SU = '''echo "su $*" >> "$FAKE_ADB_DEVICE/calls"
+if [ "$1" = "-v" ]; then echo "26.1:MAGISKSU"; exit 0; fi
+if [ "$1" = "-c" ]; then shift; exec sh -c "$*"; fi
+exit 1
+'''
+SU_0 = '''echo "su $*" >> "$FAKE_ADB_DEVICE/calls"
+if [ "$1" = "0" ]; then shift; exec "$@"; fi
+exit 1
+'''
+GETPROP = '''echo "getprop $*" >> "$FAKE_ADB_DEVICE/calls"
+echo arm64-v8a
+'''
+TCPDUMP = '''echo "tcpdump $*" >> "$FAKE_ADB_DEVICE/calls"
+echo "tcpdump version 4.99.4"
+'''
+
+
+class FakeAdbTestCase(unittest.TestCase):
+    """Runs a test against a fake device with the given binaries."""
+    legacy = False
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.device = os.path.join(self.directory.name, "device")
+        os.mkdir(self.device)
+        self.adb_log = os.path.join(self.directory.name, "adb.log")
+        environment = {"FAKE_ADB_DEVICE": self.device, "FAKE_ADB_LOG": self.adb_log}
+        if self.legacy:
+            environment["FAKE_ADB_LEGACY"] = "1"
+        patcher = mock.patch.dict(os.environ, environment)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+    def add_binary(self, name, script):
+        path = os.path.join(self.device, name)
+        with open(path, "w") as f:
+            f.write("#!/bin/sh\n" + script)
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+
+    def adb_calls(self):
+        if not os.path.exists(self.adb_log):
+            return []
+        with open(self.adb_log) as f:
+            return f.read().splitlines()
+
+    def device_calls(self):
+        path = os.path.join(self.device, "calls")
+        if not os.path.exists(path):
+            return []
+        with open(path) as f:
+            return f.read().splitlines()
+
+
+class AdbShellTest(FakeAdbTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.shell = AdbShell(FAKE_ADB)
+        self.addCleanup(self.shell.close)
+
+    def test_output_and_exit_status(self):
+        result = self.shell.run("echo a; echo b")
+        self.assertEqual((result.returncode, result.stdout), (0, "a\nb\n"))
+        # the output is returned unchanged, also without a final newline
+        self.assertEqual(self.shell.run("printf abc").stdout, "abc")
+        self.assertEqual(self.shell.run("exit 3").returncode, 3)
+        # stderr is discarded and the command can't read the following commands from stdin
+        self.assertEqual(self.shell.run("echo error >&2; cat").stdout, "")
+        self.assertEqual(self.shell.run("cd /; pwd").stdout, "/\n")
+        self.assertEqual(self.shell.run("pwd").stdout, os.getcwd() + "\n")
+        self.assertEqual(self.adb_calls().count("shell -T"), 1)
+
+    def test_threads(self):
+        results = {}
+
+        def run(thread):
+            results[thread] = [self.shell.run(f"printf '{thread} {i}'").stdout for i in range(20)]
+
+        threads = [threading.Thread(target=run, args=(thread,)) for thread in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for thread in range(8):
+            self.assertEqual(results[thread], [f"{thread} {i}" for i in range(20)])
+        self.assertEqual(self.adb_calls().count("shell -T"), 1)
+
+    def test_restart_after_exit(self):
+        self.assertEqual(self.shell.run("echo first").stdout, "first\n")
+        # the shell itself ends, like on a disconnect of the device
+        self.assertEqual(self.shell.run("kill -9 $$").returncode, SHELL_CLOSED)
+        self.assertEqual(self.shell.run("echo second").stdout, "second\n")
+        # the shell ended between two commands
+        self.shell.process.kill()
+        self.shell.process.wait()
+        self.assertEqual(self.shell.run("echo third").stdout, "third\n")
+        self.assertEqual(self.adb_calls().count("shell -T"), 3)
+
+
+class LegacyAdbShellTest(FakeAdbTestCase):
+    """A device without the shell protocol v2 (before Android 7) gets an adb process per command."""
+    legacy = True
+
+    def test_one_shot_commands(self):
+        shell = AdbShell(FAKE_ADB)
+        result = shell.run("echo a; echo b")
+        self.assertEqual((result.returncode, result.stdout), (0, "a\nb\n"))
+        self.assertEqual(shell.run("printf abc").stdout, "abc")
+        self.assertEqual(shell.run("exit 3").returncode, 3)
+        calls = self.adb_calls()
+        self.assertEqual(calls.count("features"), 1)
+        self.assertNotIn("shell -T", calls)
+        self.assertEqual(len([call for call in calls if call.startswith("shell ")]), 3)
+        self.assertIsNone(shell.process)
+
+
+class AndroidTest(FakeAdbTestCase):
+
+    def get_android(self):
+        android = Android(adb=FAKE_ADB, log=lambda message: None)
+        self.addCleanup(android.close)
+        return android
+
+    def test_root_method_and_tcpdump_are_cached(self):
+        self.add_binary("su", MAGISK_SU)
+        self.add_binary("getprop", GETPROP)
+        self.add_binary("tcpdump", TCPDUMP)
+        android = self.get_android()
+        self.assertTrue(android.is_Android())
+        self.assertEqual(android.tcpdump_version, "tcpdump_arm64_android")
+        for _ in range(3):
+            self.assertTrue(android.adb_check_root())
+            self.assertTrue(android.is_tcpdump_available)
+        self.assertEqual((android.root_method, android.is_magisk_mode), ("su -c", True))
+        self.assertEqual(android.run_adb_command_as_root("echo root").stdout, "root\n")
+        self.assertEqual(android._get_tcpdump_name(), "tcpdump")
+        calls = self.device_calls()
+        self.assertEqual(calls.count("su -v"), 1)
+        self.assertEqual(calls.count("getprop ro.product.cpu.abi"), 1)
+        self.assertEqual(calls.count("tcpdump --version"), 1)
+        self.assertEqual(self.adb_calls().count("shell -T"), 1)
+
+    def test_su_0(self):
+        self.add_binary("su", SU_0)
+        self.add_binary("getprop", GETPROP)
+        android = self.get_android()
+        self.assertEqual((android.root_method, android.is_magisk_mode), ("su 0", False))
+        self.assertEqual(android.run_adb_command_as_root("echo root").stdout, "root\n")
+        # tcpdump isn't installed, the pushed binary is used
+        self.assertFalse(android.is_tcpdump_available)
+        self.assertEqual(android._get_tcpdump_name(), "tcpdump_arm64_android")
+        self.assertEqual(self.device_calls().count("su 0 id -u"), 1)
+
+    def test_not_rooted(self):
+        self.add_binary("getprop", GETPROP)
+        android = self.get_android()
+        commands = android.shell.commands
+        self.assertFalse(android.adb_check_root())
+        self.assertFalse(android.adb_check_root())
+        self.assertEqual(android.root_method, "")
+        self.assertEqual(android.shell.commands, commands)
+
+
+if __name__ == "__main__":
+    unittest.main()